@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from database.session import get_db
+from database.session import get_db, get_async_db
 from domains.auth.schemas import (
     LoginRequest,
     SignupRequest,
@@ -9,7 +10,7 @@ from domains.auth.schemas import (
     TokenResponse,
     MessageResponse
 )
-from domains.auth.service import AuthService
+from domains.auth.service import AuthService, AsyncAuthService
 from core.exceptions import AppException
 
 
@@ -17,10 +18,10 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 
 
 @router.post("/signup", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
-def signup(signup_data: SignupRequest, db: Session = Depends(get_db)):
+async def signup(signup_data: SignupRequest, db: AsyncSession = Depends(get_async_db)):
     """Register a new user (OTP disabled - auto login)."""
     try:
-        user = AuthService.signup(db, signup_data)
+        user = await AsyncAuthService.signup(db, signup_data)
         
         # Auto-login after signup (OTP disabled)
         from core.jwt import create_access_token, create_refresh_token
@@ -59,10 +60,15 @@ def verify_otp(verify_data: OTPVerifyRequest, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=TokenResponse)
-def login(login_data: LoginRequest, db: Session = Depends(get_db)):
-    """Authenticate user and return JWT tokens."""
+async def login(login_data: LoginRequest, db: AsyncSession = Depends(get_async_db)):
+    """
+    Authenticate user and return JWT tokens.
+    
+    Runs on the event loop; bcrypt runs in the password hashing pool, so a
+    login burst cannot exhaust the threadpool used by sync endpoints.
+    """
     try:
-        return AuthService.login(db, login_data)
+        return await AsyncAuthService.login(db, login_data)
     except AppException as e:
         raise HTTPException(status_code=e.status_code, detail=e.message)
 
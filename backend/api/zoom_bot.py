@@ -5,13 +5,15 @@ Allows triggering bot to join Zoom meetings and record audio.
 
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Optional
+import asyncio
 import logging
 from pathlib import Path
 
-from database.session import get_db
-from domains.auth.utils import get_current_active_user
+from core.config import settings
+from database.session import get_async_db
+from domains.auth.utils import get_current_active_user_async
 from domains.user.model import User
 
 router = APIRouter(prefix="/zoom", tags=["Zoom Bot"])
@@ -74,6 +76,10 @@ def start_zoom_bot_background(
             "--duration", str(min_record_time),
             "--output-dir", "storage/zoom_recordings"
         ]
+        if settings.ZOOM_BOT_LOW_RESOURCE:
+            cmd.append("--low-resource")
+        if settings.ZOOM_BOT_RSS_BUDGET_MB:
+            cmd.extend(["--rss-budget-mb", str(settings.ZOOM_BOT_RSS_BUDGET_MB)])
         
         # Run bot as detached subprocess
         process = subprocess.Popen(
@@ -96,8 +102,8 @@ def start_zoom_bot_background(
 @router.post("/join", response_model=JoinMeetingResponse)
 async def join_zoom_meeting(
     request: JoinMeetingRequest,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_active_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Trigger bot to join Zoom meeting and start recording.
@@ -146,8 +152,8 @@ class EndBotRequest(BaseModel):
 @router.post("/end")
 async def end_zoom_bot(
     request: EndBotRequest,
-    current_user: User = Depends(get_current_active_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_active_user_async),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     End active Zoom bot session by terminating the process.
@@ -183,7 +189,6 @@ async def end_zoom_bot(
             logger.warning(f"Failed to create stop signal file: {e}")
         
         # Step 2: Wait for graceful shutdown (max 5 seconds)
-        import time
         max_wait = 5
         wait_interval = 0.5
         elapsed = 0
@@ -203,7 +208,7 @@ async def end_zoom_bot(
                     process_alive = False
                     break
                 
-                time.sleep(wait_interval)
+                await asyncio.sleep(wait_interval)
                 elapsed += wait_interval
             
             # Step 3: Force kill if still alive
@@ -229,7 +234,7 @@ async def end_zoom_bot(
         except ImportError:
             # Fallback without psutil - just wait and kill
             logger.warning("psutil not available, using basic kill after timeout")
-            time.sleep(max_wait)
+            await asyncio.sleep(max_wait)
             import signal
             try:
                 os.killpg(os.getpgid(pid), signal.SIGKILL)
@@ -248,7 +253,7 @@ async def end_zoom_bot(
         # Trigger transcription asynchronously (enqueue for background processing)
         transcript_result = None
         try:
-            from domains.zoom_resume.transcript.service import TranscriptService
+            from domains.zoom_resume.transcript.service import AsyncTranscriptService
             from workers.meeting.transcribe_worker import enqueue_transcript
             
             audio_file = backend_dir / "out" / f"{request.bot_id}.opus"
@@ -256,7 +261,7 @@ async def end_zoom_bot(
             # Check if audio file exists
             if audio_file.exists():
                 # Create transcript record in database with PENDING status
-                transcript = TranscriptService.create_transcript(
+                transcript = await AsyncTranscriptService.create_transcript(
                     db,
                     user_id=current_user.id,
                     audio_url=str(audio_file)
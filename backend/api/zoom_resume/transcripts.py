@@ -1,23 +1,63 @@
 """
 API endpoints for transcript management.
 """
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response, Header, Query
+from fastapi.responses import FileResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from pathlib import Path
-import shutil
-import uuid
+from datetime import timezone
+from email.utils import format_datetime, parsedate_to_datetime
+import asyncio
+import json
 
-from database.base import get_db
-from domains.auth.utils import get_current_active_user
+import orjson
+from starlette.concurrency import run_in_threadpool
+
+from database.base import AsyncSessionLocal, get_db, get_async_db
+from domains.auth.utils import (
+    get_current_active_user,
+    get_current_active_user_async,
+    get_current_active_user_for_stream
+)
 from domains.user.model import User
-from domains.zoom_resume.transcript.service import TranscriptService
+from domains.zoom_resume.transcript.service import TranscriptService, AsyncTranscriptService
+from domains.zoom_resume.transcript.model import TranscriptStatus
+from domains.zoom_resume.transcript.events import (
+    TERMINAL_STATUSES,
+    subscribe_transcript_events,
+    unsubscribe_transcript_events
+)
+from domains.zoom_resume.transcript.export import (
+    EXPORT_MEDIA_TYPES,
+    ExportFormat,
+    cache_while_streaming,
+    export_artifact_path,
+    render_export
+)
+from domains.zoom_resume.transcript.serialization import dump_transcript_json
+from domains.zoom_resume.transcript.cache import transcript_cache_key, transcript_response_cache
+from domains.zoom_resume.transcript.search import TranscriptSearchService
+from domains.zoom_resume.transcript.ingest import stream_upload, ResumableChunkWriter
+from domains.zoom_resume.transcript.upload_service import UploadSessionService, AsyncUploadSessionService
 from domains.zoom_resume.transcript.validation import FileValidator
 from domains.zoom_resume.transcript.schemas import (
     TranscriptResponse,
     TranscriptListResponse,
-    TranscriptStatusResponse
+    TranscriptSummary,
+    TranscriptSearchHit,
+    TranscriptSearchResponse,
+    TranscriptStatusResponse,
+    StreamTokenResponse,
+    UploadSessionCreate,
+    UploadSessionResponse
 )
+from core.compression import compress_body, negotiate_encoding
+from core.config import settings
+from core.exceptions import AppException
+from core.jwt import create_stream_token
+from core.range_response import ranged_file_response
 
 router = APIRouter(prefix="/transcripts", tags=["transcripts"])
 
@@ -25,27 +65,58 @@ router = APIRouter(prefix="/transcripts", tags=["transcripts"])
 UPLOAD_DIR = Path("uploads")
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
+# Partial files for resumable uploads
+PARTIAL_UPLOAD_DIR = UPLOAD_DIR / "partial"
+
+# Comment line sent on idle SSE connections so proxies keep them open
+SSE_KEEPALIVE_SECONDS = 15
+
+# Segments serialized per streamed chunk by GET /transcripts/{id}/segments
+SEGMENT_STREAM_BATCH = 200
+
+# The upload body is parsed by stream_upload rather than FastAPI's form
+# handling, so document the multipart schema explicitly
+UPLOAD_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "required": ["file"],
+                    "properties": {"file": {"type": "string", "format": "binary"}}
+                }
+            }
+        }
+    }
+}
+
 
-@router.post("/upload", response_model=TranscriptResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/upload",
+    response_model=TranscriptResponse,
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra=UPLOAD_REQUEST_BODY
+)
 async def upload_transcript(
-    file: UploadFile = File(...),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
 ):
     """
     Upload audio file for async transcription.
     
     Flow:
-    1. Validate file (extension, size)
-    2. Save to uploads/ directory
-    3. Create PENDING transcript record
-    4. Enqueue background worker
-    5. Return transcript_id immediately
+    1. Stream the multipart body to uploads/, validating extension,
+       size and container magic bytes while hashing in the same pass
+    2. Create PENDING transcript record
+    3. Enqueue background worker
+    4. Return transcript_id immediately
     
     Client should poll GET /transcripts/{id}/status for updates.
     
     Args:
-        file: Audio file upload
+        request: Incoming request carrying a multipart "file" field
         db: Database session
         current_user: Authenticated user
         
@@ -57,21 +128,17 @@ async def upload_transcript(
     """
     from workers.meeting.transcribe_worker import enqueue_transcript
     
-    # Validate file
-    FileValidator.validate_upload(file)
-    
-    # Generate unique filename
-    ext = Path(file.filename or "audio").suffix.lower()
-    file_name = f"{uuid.uuid4().hex}{ext}"
-    file_path = UPLOAD_DIR / file_name
+    # Validate and save file without blocking the event loop
+    upload = await stream_upload(
+        request.headers.get("content-type"),
+        request.stream(),
+        UPLOAD_DIR
+    )
+    file_path = upload.path
     
     try:
-        # Save uploaded file
-        with file_path.open("wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-        
         # Create PENDING transcript record
-        transcript = TranscriptService.create_transcript(
+        transcript = await AsyncTranscriptService.create_transcript(
             db,
             user_id=current_user.id,
             audio_url=str(file_path)
@@ -97,66 +164,580 @@ async def upload_transcript(
         )
 
 
-@router.get("", response_model=TranscriptListResponse)
-def list_transcripts(
-    skip: int = 0,
-    limit: int = 20,
+def _upload_headers(upload) -> dict:
+    """tus-style headers describing upload progress."""
+    return {
+        "Upload-Offset": str(upload.upload_offset),
+        "Upload-Length": str(upload.upload_length),
+        "Cache-Control": "no-store"
+    }
+
+
+@router.post("/uploads", response_model=UploadSessionResponse, status_code=status.HTTP_201_CREATED)
+def create_upload_session(
+    upload_data: UploadSessionCreate,
+    response: Response,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Start a resumable upload for a large recording.
+    
+    Flow:
+    1. POST /transcripts/uploads with filename and total size
+    2. PATCH /transcripts/uploads/{id} with raw bytes and Upload-Offset header,
+       repeating until the offset reaches the size
+    3. After an interruption, GET/HEAD /transcripts/uploads/{id} to read the
+       offset and continue from there
+    4. POST /transcripts/uploads/{id}/complete to create the transcript
+    
+    Raises:
+        HTTPException: 400 for invalid extension, 413 if size exceeds the resumable limit
+    """
+    FileValidator.validate_filename(upload_data.filename)
+    FileValidator.validate_size(upload_data.size, FileValidator.MAX_RESUMABLE_FILE_SIZE)
+    
+    upload = UploadSessionService.create_session(
+        db,
+        user_id=current_user.id,
+        filename=upload_data.filename,
+        upload_length=upload_data.size,
+        partial_dir=PARTIAL_UPLOAD_DIR
+    )
+    
+    response.headers.update(_upload_headers(upload))
+    response.headers["Location"] = f"{router.prefix}/uploads/{upload.id}"
+    return UploadSessionResponse.from_orm(upload)
+
+
+@router.api_route("/uploads/{upload_id}", methods=["GET", "HEAD"], response_model=UploadSessionResponse)
+def get_upload_session(
+    upload_id: str,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
     """
-    List all transcripts for current user with pagination.
+    Get the current offset of a resumable upload.
+    
+    Raises:
+        HTTPException: 404 if the session is missing or expired
+    """
+    try:
+        upload = UploadSessionService.get_session(db, upload_id, current_user.id)
+    except AppException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    
+    response.headers.update(_upload_headers(upload))
+    return UploadSessionResponse.from_orm(upload)
+
+
+@router.patch("/uploads/{upload_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def append_upload_chunk(
+    upload_id: str,
+    request: Request,
+    upload_offset: Optional[int] = Header(None, alias="Upload-Offset"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+):
+    """
+    Append a byte range to a resumable upload.
+    
+    The body is streamed to disk at the given offset. If the connection
+    drops, the bytes already written are kept and the offset reflects them.
+    
+    Raises:
+        HTTPException: 404 unknown session, 409 offset mismatch or another
+            chunk in progress, 413 past declared size, 400 invalid audio content
+    """
+    lock = AsyncUploadSessionService.chunk_lock(upload_id)
+    if lock.locked():
+        # The other request owns this offset; the client re-reads it with HEAD
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Another chunk for this upload is still being written"
+        )
+    
+    async with lock:
+        try:
+            upload = await AsyncUploadSessionService.get_session(db, upload_id, current_user.id)
+            UploadSessionService.check_offset(upload, upload_offset)
+        except AppException as e:
+            raise HTTPException(status_code=e.status_code, detail=e.message)
+        
+        # Don't hold a pooled connection while the chunk body streams in
+        await db.commit()
+        
+        writer = ResumableChunkWriter(
+            upload.file_path,
+            upload.upload_offset,
+            upload.upload_length,
+            Path(upload.filename).suffix.lower()
+        )
+        try:
+            await writer.write_stream(request.stream())
+        finally:
+            await AsyncUploadSessionService.record_offset(db, upload, writer.offset)
+    
+    return Response(status_code=status.HTTP_204_NO_CONTENT, headers=_upload_headers(upload))
+
+
+@router.post("/uploads/{upload_id}/complete", response_model=TranscriptResponse, status_code=status.HTTP_201_CREATED)
+def complete_upload(
+    upload_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Finalize a fully received upload into a PENDING transcript and enqueue it.
+    
+    Raises:
+        HTTPException: 404 unknown session, 409 if bytes are still missing,
+            400 if the file is not a supported audio container
+    """
+    from workers.meeting.transcribe_worker import enqueue_transcript
+    
+    try:
+        upload = UploadSessionService.get_session(db, upload_id, current_user.id)
+        if upload.upload_offset == upload.upload_length:
+            # Re-check magic bytes in case the first chunk was too short to sniff
+            ext = FileValidator.validate_filename(upload.filename)
+            with open(upload.file_path, "rb") as f:
+                FileValidator.validate_container(ext, f.read(FileValidator.SNIFF_BYTES))
+        transcript = UploadSessionService.complete(db, upload, UPLOAD_DIR)
+    except AppException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    
+    enqueue_transcript(transcript.id)
+    return TranscriptResponse.from_orm(transcript)
+
+
+@router.delete("/uploads/{upload_id}", status_code=status.HTTP_204_NO_CONTENT)
+def abort_upload(
+    upload_id: str,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Cancel a resumable upload and delete its partial data.
+    
+    Raises:
+        HTTPException: 404 if the session is missing or expired
+    """
+    try:
+        upload = UploadSessionService.get_session(db, upload_id, current_user.id)
+    except AppException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    
+    UploadSessionService.abort(db, upload)
+    return None
+
+
+@router.get("", response_model=TranscriptListResponse)
+async def list_transcripts(
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+):
+    """
+    List transcripts for current user, newest first, with keyset pagination.
+    
+    Items are summaries without full_text/segments; fetch
+    GET /transcripts/{id} for the full transcript. Latency stays flat
+    however deep the page, since each page seeks on (created_at, id)
+    instead of counting and skipping rows.
     
     Args:
-        skip: Number of records to skip
-        limit: Maximum number of records to return
-        db: Database session
+        limit: Maximum number of records to return (1-100)
+        cursor: next_cursor from the previous page
+        include_total: Also return the user's total count (cached briefly)
+        db: Async database session
         current_user: Authenticated user
         
     Returns:
-        TranscriptListResponse with items and pagination info
+        TranscriptListResponse with items and next_cursor
+        
+    Raises:
+        HTTPException: 400 for an invalid cursor
     """
-    transcripts, total = TranscriptService.list_by_user(
-        db, current_user.id, skip, limit
-    )
+    try:
+        rows, next_cursor = await AsyncTranscriptService.list_summaries_by_user(
+            db, current_user.id, limit, cursor
+        )
+    except AppException as e:
+        raise HTTPException(status_code=e.status_code, detail=e.message)
+    
+    total = None
+    if include_total:
+        total = await AsyncTranscriptService.count_by_user(db, current_user.id)
     
     return TranscriptListResponse(
-        total=total,
-        items=[TranscriptResponse.from_orm(t) for t in transcripts],
-        skip=skip,
-        limit=limit
+        items=[TranscriptSummary.from_orm(row) for row in rows],
+        limit=limit,
+        next_cursor=next_cursor,
+        total=total
+    )
+
+
+@router.get("/search", response_model=TranscriptSearchResponse)
+async def search_transcripts(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+):
+    """
+    Full-text search across the current user's transcripts.
+    
+    Matches are segment-level and ranked by relevance, so each hit carries
+    the timestamps needed to jump straight to that part of the recording.
+    Word forms are normalized ("pertemuannya" finds "bertemu") and the last
+    term matches as a prefix.
+    
+    Args:
+        q: Search query
+        limit: Maximum number of hits (1-100)
+        db: Async database session
+        current_user: Authenticated user
+        
+    Returns:
+        TranscriptSearchResponse with hits, best match first
+    """
+    hits = await TranscriptSearchService.search(db, current_user.id, q, limit)
+    return TranscriptSearchResponse(
+        query=q,
+        items=[TranscriptSearchHit(**hit) for hit in hits]
     )
 
 
+def _validators(transcript) -> dict:
+    """ETag/Last-Modified/Cache-Control for a transcript, derived from updated_at."""
+    updated_at = transcript.updated_at.replace(tzinfo=timezone.utc)
+    if transcript.status == TranscriptStatus.DONE:
+        cache_control = f"private, max-age={settings.TRANSCRIPT_CLIENT_MAX_AGE}, immutable"
+    else:
+        cache_control = "private, no-cache"
+    return {
+        # Weak: the same version may be sent gzip-, br- or identity-encoded
+        "ETag": f'W/"{transcript.id}-{int(updated_at.timestamp() * 1_000_000)}"',
+        "Last-Modified": format_datetime(updated_at, usegmt=True),
+        "Cache-Control": cache_control,
+        "Vary": "Accept-Encoding"
+    }
+
+
+def _is_not_modified(request: Request, validators: dict) -> bool:
+    """Evaluate If-None-Match (preferred) or If-Modified-Since against the validators."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # Weak comparison, as required for If-None-Match
+        tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        return "*" in tags or validators["ETag"].removeprefix("W/") in tags
+    
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return parsedate_to_datetime(validators["Last-Modified"]) <= since
+    return False
+
+
 @router.get("/{transcript_id}", response_model=TranscriptResponse)
-def get_transcript(
+async def get_transcript(
     transcript_id: int,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
 ):
     """
     Get single transcript by ID.
     
+    Supports conditional requests: ETag and Last-Modified come from
+    updated_at, and a matching If-None-Match/If-Modified-Since gets a 304
+    after a summary-only query. Bodies of DONE transcripts never change,
+    so they are served from an in-memory LRU of serialized (and
+    compressed) responses. Misses are serialized straight from the row
+    with orjson instead of going through TranscriptResponse.
+    
     Args:
         transcript_id: ID of the transcript
-        db: Database session
+        request: Incoming request (conditional headers)
+        db: Async database session
         current_user: Authenticated user
         
     Returns:
-        TranscriptResponse
+        TranscriptResponse JSON, or 304 Not Modified
         
     Raises:
         HTTPException: 404 if transcript not found or unauthorized
     """
-    transcript = TranscriptService.get_by_id(db, transcript_id, current_user.id)
+    summary = await AsyncTranscriptService.get_summary(db, transcript_id, current_user.id)
+    
+    if not summary:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Transcript not found"
+        )
+    
+    validators = _validators(summary)
+    if _is_not_modified(request, validators):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validators)
+    
+    # DONE bodies are cached already compressed for the negotiated encoding;
+    # other responses are compressed by CompressionMiddleware
+    cacheable = summary.status == TranscriptStatus.DONE
+    encoding = negotiate_encoding(request.headers.get("accept-encoding")) if cacheable else None
+    body = None
+    if cacheable:
+        body = transcript_response_cache.get(transcript_cache_key(summary.id, summary.updated_at, encoding))
     
+    if body is None:
+        transcript = await AsyncTranscriptService.get_by_id(db, transcript_id, current_user.id)
+        if not transcript:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Transcript not found"
+            )
+        # Headers must describe the row that was actually serialized
+        validators = _validators(transcript)
+        body = dump_transcript_json(transcript)
+        if transcript.status != TranscriptStatus.DONE:
+            encoding = None
+        else:
+            if encoding:
+                body = await run_in_threadpool(compress_body, body, encoding)
+            transcript_response_cache.put(
+                transcript_cache_key(transcript.id, transcript.updated_at, encoding), body
+            )
+    
+    if encoding:
+        validators["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=validators)
+
+
+@router.get("/{transcript_id}/segments")
+async def get_transcript_segments(
+    transcript_id: int,
+    request: Request,
+    start_from: Optional[float] = Query(None, alias="from", ge=0, description="Range start in seconds"),
+    end_to: Optional[float] = Query(None, alias="to", ge=0, description="Range end in seconds"),
+    speaker: Optional[str] = None,
+    limit: Optional[int] = Query(None, ge=1, le=10000),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+):
+    """
+    Get the segments overlapping a time range, streamed in time order.
+    
+    Reads from the indexed transcript_segments table, so only the requested
+    slice is loaded (e.g. ?from=1800&to=2100 for minutes 30-35). The body is
+    a JSON array, or NDJSON (one segment per line) when the client sends
+    Accept: application/x-ndjson.
+    
+    Args:
+        transcript_id: ID of the transcript
+        start_from: Range start in seconds (?from=)
+        end_to: Range end in seconds (?to=)
+        speaker: Only segments from this speaker
+        limit: Maximum number of segments
+        
+    Raises:
+        HTTPException: 404 if transcript not found or unauthorized, 400 for an empty range
+    """
+    if start_from is not None and end_to is not None and end_to <= start_from:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'to' must be greater than 'from'"
+        )
+    
+    transcript = await AsyncTranscriptService.get_summary(db, transcript_id, current_user.id)
     if not transcript:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Transcript not found"
         )
+    await db.close()
     
-    return TranscriptResponse.from_orm(transcript)
+    ndjson = "application/x-ndjson" in request.headers.get("accept", "")
+    
+    async def segment_stream():
+        # Own session: the request-scoped one may be closed before streaming ends
+        async with AsyncSessionLocal() as stream_db:
+            batch = []
+            first = True
+            if not ndjson:
+                yield b"["
+            async for row in AsyncTranscriptService.stream_segments(
+                stream_db, transcript_id, start_from, end_to, speaker, limit
+            ):
+                batch.append(orjson.dumps({
+                    "id": row.seq,
+                    "start": row.start,
+                    "end": row.end,
+                    "text": row.text,
+                    "speaker": row.speaker
+                }))
+                if len(batch) >= SEGMENT_STREAM_BATCH:
+                    yield _join_segment_batch(batch, ndjson, first)
+                    batch, first = [], False
+            if batch:
+                yield _join_segment_batch(batch, ndjson, first)
+            if not ndjson:
+                yield b"]"
+    
+    return StreamingResponse(
+        segment_stream(),
+        media_type="application/x-ndjson" if ndjson else "application/json"
+    )
+
+
+def _join_segment_batch(batch: List[bytes], ndjson: bool, first: bool) -> bytes:
+    """Join serialized segments for one streamed chunk."""
+    if ndjson:
+        return b"\n".join(batch) + b"\n"
+    return (b"" if first else b",") + b",".join(batch)
+
+
+@router.post("/{transcript_id}/stream-token", response_model=StreamTokenResponse)
+async def create_transcript_stream_token(
+    transcript_id: int,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
+):
+    """
+    Issue a short-lived token for this transcript's export, audio and events URLs.
+    
+    Download links, <audio src> and EventSource cannot send an Authorization
+    header, so they pass this token as ?token= instead of the access token:
+    if it leaks through access logs or proxies it expires within minutes and
+    only opens this one transcript.
+    
+    Raises:
+        HTTPException: 404 if transcript not found or unauthorized
+    """
+    transcript = await AsyncTranscriptService.get_summary(db, transcript_id, current_user.id)
+    if not transcript:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Transcript not found"
+        )
+    return StreamTokenResponse(
+        token=create_stream_token(current_user.id, transcript_id),
+        expires_in=settings.STREAM_TOKEN_EXPIRE_MINUTES * 60
+    )
+
+
+@router.get("/{transcript_id}/export")
+async def export_transcript(
+    transcript_id: int,
+    export_format: ExportFormat = Query(..., alias="format", description="srt, vtt, txt or docx"),
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_for_stream)
+):
+    """
+    Download a transcript as subtitles (SRT/WebVTT), plain text or DOCX.
+    
+    The file is rendered segment by segment from transcript_segments and
+    streamed, so downloads start immediately with constant server memory.
+    The rendered artifact is kept on disk while streaming; later downloads
+    of the same transcript version are served from that file. Accepts a
+    stream token as ?token= so a plain download link can stream straight
+    to disk.
+    
+    Args:
+        transcript_id: ID of the transcript
+        export_format: Output format (?format=)
+        db: Async database session
+        current_user: Authenticated user
+        
+    Raises:
+        HTTPException: 404 if transcript not found or unauthorized,
+            409 if transcription has not finished
+    """
+    transcript = await AsyncTranscriptService.get_summary(db, transcript_id, current_user.id)
+    if not transcript:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Transcript not found"
+        )
+    if transcript.status != TranscriptStatus.DONE:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Transcript is not finished yet"
+        )
+    await db.close()
+    
+    filename = f"transcript-{transcript_id}.{export_format.value}"
+    media_type = EXPORT_MEDIA_TYPES[export_format]
+    artifact = export_artifact_path(transcript_id, transcript.updated_at, export_format)
+    
+    if artifact.exists():
+        return FileResponse(artifact, media_type=media_type, filename=filename)
+    
+    async def export_stream():
+        # Own session: the request-scoped one is closed before streaming starts
+        async with AsyncSessionLocal() as stream_db:
+            rows = AsyncTranscriptService.stream_segments(stream_db, transcript_id)
+            chunks = render_export(rows, export_format, title=f"Transcript #{transcript_id}")
+            async for chunk in cache_while_streaming(chunks, artifact):
+                yield chunk
+    
+    return StreamingResponse(
+        export_stream(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.api_route("/{transcript_id}/audio", methods=["GET", "HEAD"])
+async def get_transcript_audio(
+    transcript_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_for_stream)
+):
+    """
+    Stream the meeting recording for playback next to its segments.
+    
+    Supports byte-range requests (206 Partial Content), so the player can
+    seek to any segment without downloading the whole recording. Accepts a
+    stream token as ?token= because <audio src> cannot send an
+    Authorization header.
+    
+    Args:
+        transcript_id: ID of the transcript
+        request: Incoming request (Range / If-Range headers)
+        db: Async database session
+        current_user: Authenticated user
+        
+    Raises:
+        HTTPException: 404 if transcript not found or unauthorized,
+            410 if the audio was removed by the retention policy
+    """
+    transcript = await AsyncTranscriptService.get_summary(db, transcript_id, current_user.id)
+    if not transcript:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Transcript not found"
+        )
+    await db.close()
+    
+    audio_path = Path(transcript.audio_url)
+    if not audio_path.is_file():
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Audio is no longer available"
+        )
+    
+    return ranged_file_response(
+        audio_path,
+        request,
+        headers={"Cache-Control": "private, max-age=3600"}
+    )
 
 
 @router.get("/{transcript_id}/status", response_model=TranscriptStatusResponse)
@@ -190,6 +771,88 @@ def get_transcript_status(
     return TranscriptStatusResponse.from_orm(transcript)
 
 
+def _sse_message(event_type: str, data: dict) -> str:
+    """Format one Server-Sent Events message."""
+    return f"event: {event_type}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@router.get("/{transcript_id}/events")
+async def stream_transcript_events(
+    transcript_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_for_stream)
+):
+    """
+    Push transcript status transitions and progress via Server-Sent Events.
+    
+    Replaces polling GET /transcripts/{id}/status: authentication and the
+    transcript lookup run once per connection, then the worker's events are
+    pushed as they happen. The stream sends the current status first and
+    closes after DONE or FAILED.
+    
+    EventSource cannot set headers, so a stream token may be passed as
+    ?token=... instead of an Authorization header.
+    
+    Events:
+        status: {status, error_message, ...} lifecycle transitions
+        progress: {stage, progress} worker progress
+        segments: {segments} saved segments in batches, before DONE
+    
+    Raises:
+        HTTPException: 404 if transcript not found or unauthorized
+    """
+    # Subscribe before reading so no transition between the read and the
+    # subscription is missed
+    queue = subscribe_transcript_events(transcript_id)
+    transcript = await AsyncTranscriptService.get_summary(db, transcript_id, current_user.id)
+    
+    if not transcript:
+        unsubscribe_transcript_events(transcript_id, queue)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Transcript not found"
+        )
+    
+    snapshot = {
+        "type": "status",
+        "transcript_id": transcript.id,
+        "status": TranscriptStatus(transcript.status).value,
+        "error_message": transcript.error_message
+    }
+    
+    # Release the pooled connection; the stream itself never touches the DB
+    await db.close()
+    
+    async def event_stream():
+        try:
+            yield "retry: 3000\n\n"
+            yield _sse_message("status", snapshot)
+            if snapshot["status"] in TERMINAL_STATUSES:
+                return
+            
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    yield ": keepalive\n\n"
+                    continue
+                
+                yield _sse_message(event.get("type", "message"), event)
+                if event.get("type") == "status" and event.get("status") in TERMINAL_STATUSES:
+                    return
+        finally:
+            unsubscribe_transcript_events(transcript_id, queue)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.delete("/{transcript_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_transcript(
     transcript_id: int,
@@ -1,4 +1,7 @@
 import subprocess
+import tempfile
+
+import numpy as np
 
 def preprocess_audio(input_file, output_file):
     cmd = [
@@ -11,3 +14,53 @@ def preprocess_audio(input_file, output_file):
         output_file
     ]
     subprocess.run(cmd, check=True)
+
+def stream_pcm(input_file, sampling_rate=16000, window_seconds=30.0):
+    # Decode through an ffmpeg pipe and yield float32 windows of at most
+    # window_seconds: memory stays flat however long the recording is, and
+    # consumers start on the first window while ffmpeg keeps decoding
+    cmd = [
+        "ffmpeg",
+        "-nostdin",
+        "-loglevel", "error",
+        "-i", input_file,
+        "-f", "s16le",
+        "-ac", "1",
+        "-ar", str(sampling_rate),
+        "-"
+    ]
+    window_bytes = int(sampling_rate * window_seconds) * 2
+    # stderr goes to a temp file: a pipe nobody reads until EOF would block
+    # ffmpeg (and this reader) once it fills up with warnings
+    with tempfile.TemporaryFile() as errors:
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=errors)
+        try:
+            while True:
+                data = process.stdout.read(window_bytes)
+                if not data:
+                    break
+                # An odd trailing byte cannot form a sample
+                data = data[:len(data) - len(data) % 2]
+                yield np.frombuffer(data, dtype=np.int16).astype(np.float32) / 32768.0
+            if process.wait() != 0:
+                errors.seek(0)
+                raise subprocess.CalledProcessError(process.returncode, cmd, stderr=errors.read())
+        finally:
+            # Consumer stopped early (or failed): don't leave ffmpeg running
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+
+def frames(windows, frame_size):
+    # Re-chunk arbitrary windows into fixed frames; samples left over at a
+    # window boundary are carried into the next frame, and the last frame
+    # is zero-padded
+    carry = np.empty(0, dtype=np.float32)
+    for window in windows:
+        samples = np.concatenate((carry, window)) if carry.size else window
+        usable = len(samples) - len(samples) % frame_size
+        for offset in range(0, usable, frame_size):
+            yield samples[offset:offset + frame_size]
+        carry = samples[usable:]
+    if carry.size:
+        yield np.concatenate((carry, np.zeros(frame_size - carry.size, dtype=np.float32)))
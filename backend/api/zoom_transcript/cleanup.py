@@ -1,40 +1,116 @@
+import re
+from functools import lru_cache
+
 FILLERS = [
 "eee", "ee", "eh", "em", "emm", "hmm", "hmmm",
 "anu", "anu ya", "anu tuh",
 "apa ya", "apa namanya", "apa itu", "apa tadi",
 ]
 
-def remove_fillers(text):
-    for f in FILLERS:
-        text = text.replace(f, "")
-    return text.strip()
+# Filler lexicon per Whisper language code; extend or override as needed
+FILLER_LEXICONS = {
+    "id": FILLERS,
+    "en": ["uh", "uhm", "um", "umm", "erm", "hmm", "hmmm", "you know", "i mean"],
+}
+
+def _trie_regex(phrases):
+    # Prefix-factored alternation ("e(?:e(?:e)?|h|m(?:m)?)"): the regex engine
+    # walks one branch per character instead of retrying every filler, and
+    # greedy optional tails still prefer the longest phrase ("anu ya" > "anu")
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for ch in phrase:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def emit(node):
+        branches = [
+            (r"\s+" if ch == " " else re.escape(ch)) + emit(child)
+            for ch, child in sorted(node.items()) if ch
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return emit(trie)
+
+def build_filler_pattern(fillers):
+    # Word boundaries keep "em" in "pemerintah" intact; a trailing comma
+    # and the following whitespace go with the filler
+    phrases = {" ".join(f.lower().split()) for f in fillers or ()} - {""}
+    if not phrases:
+        return None
+    return re.compile(rf"\b{_trie_regex(phrases)}\b,?\s*", re.IGNORECASE)
+
+@lru_cache(maxsize=None)
+def _language_pattern(language):
+    return build_filler_pattern(FILLER_LEXICONS.get(language, ()))
+
+def _filler_pattern(language, fillers):
+    return build_filler_pattern(fillers) if fillers is not None else _language_pattern(language)
+
+# Texts are joined with NUL so a whole transcript goes through the matcher
+# in one call; NUL is neither whitespace nor a word character, so filler
+# matches and word boundaries never cross segments
+_SEPARATOR = "\x00"
+# Tidy-up patterns start with a literal so the engine can skip ahead
+_DANGLING_COMMA = re.compile(r",(?=\s*(?:[.?!\x00]|$))")
+_SPACES = re.compile(r"  +")
+_SPACE_BEFORE_PUNCT = re.compile(r" (?=[.?!,])")
+# Whole-filler segments leave only punctuation behind (" Hmm." -> ".")
+_WORD_CHAR = re.compile(r"\w")
+
+def remove_fillers_batch(texts, language="id", fillers=None):
+    pattern = _filler_pattern(language, fillers)
+    if pattern is None or not texts:
+        return [text.strip() for text in texts]
+    joined, removed = pattern.subn("", _SEPARATOR.join(t.replace(_SEPARATOR, "") for t in texts))
+    if removed:
+        # Tidy up what the removed fillers leave behind ("jadi, eee." -> "jadi.")
+        joined = _DANGLING_COMMA.sub("", joined)
+        joined = _SPACES.sub(" ", joined)
+        joined = _SPACE_BEFORE_PUNCT.sub("", joined)
+    return [text.strip() for text in joined.split(_SEPARATOR)]
+
+def remove_fillers(text, language="id", fillers=None):
+    return remove_fillers_batch([text], language, fillers)[0]
 
 def semantic_cleanup(text):
     if not text:
         return ""
     text = text.strip()
     text = text[0].upper() + text[1:]
-    if not text.endswith("."):
+    if not text.endswith((".", "?", "!")):
         text += "."
     return text
 
-def clean_segments(segments):
-    cleaned = []
+def clean_segments(segments, language="id", fillers=None):
+    kept = [
+        s for s in segments
+        if s.avg_logprob >= -1.2 and s.no_speech_prob <= 0.6
+    ]
+    texts = remove_fillers_batch([s.text for s in kept], language, fillers)
 
-    for s in segments:
-        if s.avg_logprob < -1.2:
-            continue
-        if s.no_speech_prob > 0.6:
+    cleaned = []
+    for s, text in zip(kept, texts):
+        if not _WORD_CHAR.search(text):
             continue
-
-        text = remove_fillers(s.text)
         text = semantic_cleanup(text)
 
         if text:
-            cleaned.append({
+            segment = {
                 "start": round(s.start, 2),
                 "end": round(s.end, 2),
                 "text": text
-            })
+            }
+            # word_timestamps=True: keep them for word-level speaker alignment
+            if getattr(s, "words", None):
+                segment["words"] = [
+                    {"start": round(w.start, 2), "end": round(w.end, 2), "word": w.word}
+                    for w in s.words
+                ]
+            cleaned.append(segment)
 
     return cleaned
@@ -1,21 +1,176 @@
-from pyannote.audio import Pipeline
-import torch
+import hashlib
+import os
+import pickle
+from functools import lru_cache
 
-pipeline = Pipeline.from_pretrained(
-    "pyannote/speaker-diarization",
-    use_auth_token="HF_TOKEN"
-)
+import numpy as np
 
-pipeline.to(torch.device("cuda"))
+from pipeline import fingerprint
 
-def diarize(audio_file):
-    diarization = pipeline(audio_file)
+# Same names and defaults as the app settings (core/config.py)
+ENABLE_DIARIZATION = os.environ.get("ENABLE_DIARIZATION", "true").lower() in ("1", "true", "yes")
+DIARIZATION_MODEL = os.environ.get("DIARIZATION_MODEL", "pyannote/speaker-diarization-3.0")
+HUGGINGFACE_TOKEN = os.environ.get("HUGGINGFACE_TOKEN")
+MAX_SPEAKERS = int(os.environ.get("MAX_SPEAKERS", "10"))
 
+# Long recordings are diarized in overlapping windows, then the speakers
+# found in each window are clustered into meeting-wide speakers
+WINDOW_SECONDS = 600.0
+OVERLAP_SECONDS = 30.0
+# Cosine distance under which two window speakers are the same person
+CLUSTER_THRESHOLD = 0.7
+EMBEDDING_CACHE_DIR = os.environ.get("DIARIZATION_CACHE_DIR", ".diarization_cache")
+
+def select_device():
+    import torch
+
+    return torch.device("cuda" if torch.cuda.is_available() else "cpu")
+
+@lru_cache(maxsize=1)
+def load_pipeline():
+    # Loaded on first use, on GPU when there is one
+    from pyannote.audio import Pipeline
+
+    pipeline = Pipeline.from_pretrained(DIARIZATION_MODEL, use_auth_token=HUGGINGFACE_TOKEN)
+    device = select_device()
+    pipeline.to(device)
+    print(f"[DIARIZATION] Loaded '{DIARIZATION_MODEL}' on {device}")
+    return pipeline
+
+@lru_cache(maxsize=1)
+def _audio():
+    from pyannote.audio import Audio
+
+    return Audio(sample_rate=16000, mono="downmix")
+
+def _audio_duration(audio_file):
+    return _audio().get_duration(audio_file)
+
+def _diarize_window(audio_file, start, end):
+    # Turns (absolute seconds, window-local label) and one embedding per label
+    from pyannote.core import Segment
+
+    waveform, sample_rate = _audio().crop(audio_file, Segment(start, end))
+    diarization, embeddings = load_pipeline()(
+        {"waveform": waveform, "sample_rate": sample_rate},
+        max_speakers=MAX_SPEAKERS,
+        return_embeddings=True
+    )
+    turns = [
+        (start + turn.start, start + turn.end, label)
+        for turn, _, label in diarization.itertracks(yield_label=True)
+    ]
+    return {"turns": turns, "embeddings": dict(zip(diarization.labels(), np.asarray(embeddings)))}
+
+def plan_windows(duration, window_seconds=WINDOW_SECONDS, overlap_seconds=OVERLAP_SECONDS):
+    if duration <= window_seconds:
+        return [(0.0, duration)]
+    step = window_seconds - overlap_seconds
+    windows = []
+    start = 0.0
+    while start + overlap_seconds < duration:
+        windows.append((start, min(start + window_seconds, duration)))
+        start += step
+    return windows
+
+def cluster_speakers(embeddings, window_of, max_speakers=MAX_SPEAKERS, threshold=CLUSTER_THRESHOLD):
+    # Agglomerative clustering of window speakers by centroid cosine
+    # distance. Speakers from the same window were already told apart by
+    # the model, so they never merge. Returns a cluster index per row,
+    # numbered in order of first appearance
+    vectors = np.asarray(embeddings, dtype=np.float64)
+    if not len(vectors):
+        return []
+    vectors = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    clusters = [[i] for i in range(len(vectors))]
+    n_windows = max(window_of) + 1
+    while len(clusters) > 1:
+        centroids = np.array([vectors[members].mean(axis=0) for members in clusters])
+        centroids /= np.linalg.norm(centroids, axis=1, keepdims=True)
+        distance = 1.0 - centroids @ centroids.T
+        windows = np.zeros((len(clusters), n_windows))
+        for c, members in enumerate(clusters):
+            windows[c, [window_of[i] for i in members]] = 1
+        distance[(windows @ windows.T) > 0] = np.inf
+        a, b = np.unravel_index(np.argmin(distance), distance.shape)
+        if not np.isfinite(distance[a, b]):
+            break
+        if distance[a, b] >= threshold and len(clusters) <= max_speakers:
+            break
+        clusters[a] += clusters.pop(b)
+
+    labels = [0] * len(vectors)
+    for c, members in enumerate(sorted(clusters, key=min)):
+        for i in members:
+            labels[i] = c
+    return labels
+
+def stitch(windows, results, max_speakers=MAX_SPEAKERS, threshold=CLUSTER_THRESHOLD):
+    keys, vectors, window_of = [], [], []
+    for w, result in enumerate(results):
+        for label, embedding in result["embeddings"].items():
+            # pyannote returns NaN for speakers with too little speech to embed
+            if np.all(np.isfinite(embedding)):
+                keys.append((w, label))
+                vectors.append(embedding)
+                window_of.append(w)
+    speaker_of = {
+        key: f"SPEAKER_{cluster:02d}"
+        for key, cluster in zip(keys, cluster_speakers(vectors, window_of, max_speakers, threshold))
+    }
+
+    # Each window owns the time up to the middle of its overlaps, so a turn
+    # seen twice near a boundary is only kept once
     speakers = []
-    for turn, _, speaker in diarization.itertracks(yield_label=True):
-        speakers.append({
-            "start": turn.start,
-            "end": turn.end,
-            "speaker": speaker
-        })
-    return speakers
+    for w, ((start, end), result) in enumerate(zip(windows, results)):
+        low = (start + windows[w - 1][1]) / 2 if w > 0 else start
+        high = (windows[w + 1][0] + end) / 2 if w + 1 < len(windows) else end
+        for turn_start, turn_end, label in result["turns"]:
+            speaker = speaker_of.get((w, label))
+            turn_start, turn_end = max(turn_start, low), min(turn_end, high)
+            if speaker and turn_end > turn_start:
+                speakers.append({"start": turn_start, "end": turn_end, "speaker": speaker})
+
+    speakers.sort(key=lambda sp: sp["start"])
+    merged = []
+    for sp in speakers:
+        # Rejoin turns cut at a window boundary
+        if merged and merged[-1]["speaker"] == sp["speaker"] and sp["start"] <= merged[-1]["end"]:
+            merged[-1]["end"] = max(merged[-1]["end"], sp["end"])
+        else:
+            merged.append(sp)
+    return merged
+
+def _window_results(audio_file, windows, cache_dir):
+    # Per-window turns and embeddings are cached by audio content, so
+    # re-runs (and re-clustering with other settings) skip the model, and
+    # an interrupted run resumes at the first missing window
+    os.makedirs(cache_dir, exist_ok=True)
+    audio_hash = fingerprint(audio_file)
+    results = []
+    for start, end in windows:
+        key = hashlib.sha256(
+            f"{audio_hash}:{DIARIZATION_MODEL}:{MAX_SPEAKERS}:{start}:{end}".encode()
+        ).hexdigest()
+        path = os.path.join(cache_dir, f"{key}.pkl")
+        try:
+            with open(path, "rb") as f:
+                results.append(pickle.load(f))
+            continue
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+        result = _diarize_window(audio_file, start, end)
+        with open(path + ".part", "wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(path + ".part", path)
+        results.append(result)
+    return results
+
+def diarize(audio_file, cache_dir=None):
+    if not ENABLE_DIARIZATION:
+        print("[DIARIZATION] Disabled (ENABLE_DIARIZATION=false)")
+        return []
+
+    windows = plan_windows(_audio_duration(audio_file))
+    results = _window_results(audio_file, windows, cache_dir or EMBEDDING_CACHE_DIR)
+    return stitch(windows, results)
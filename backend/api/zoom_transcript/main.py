@@ -1,55 +1,80 @@
 import json
 from zoom_audio import download_zoom_audio
 from audio_preprocess import preprocess_audio
-from vad import extract_speech
+from vad import detect_speech
 from transcribe import transcribe
 from cleanup import clean_segments
 from diarization import diarize
 from speaker_align import assign_speaker
-from qualityasurance import qa_coverage, detect_gaps, low_confidence_segments
+from qualityasurance import QAEngine
+from pipeline import Pipeline
 
 #harus integrasi ke zoom
 ZOOM_TOKEN = "YOUR_ZOOM_TOKEN"
 DOWNLOAD_URL = "ZOOM_AUDIO_DOWNLOAD_URL"
+# Stage outputs are reused across runs when their inputs are unchanged
+CACHE_DIR = ".pipeline_cache"
 
-def main():
-    raw_audio = "meeting.m4a"
-    clean_audio = "clean.wav"
-    speech_audio = "speech.wav"
+def build_pipeline():
+    pipeline = Pipeline()
+
+    @pipeline.stage("raw_audio", inputs=("download_url", "token"), produces_file=True)
+    def download(download_url, token):
+        download_zoom_audio(download_url, token, "meeting.m4a")
+        return "meeting.m4a"
 
-    download_zoom_audio(DOWNLOAD_URL, ZOOM_TOKEN, raw_audio)
-    preprocess_audio(raw_audio, clean_audio)
-    extract_speech(clean_audio, speech_audio)
+    @pipeline.stage("clean_audio", inputs=("raw_audio",), produces_file=True)
+    def preprocess(raw_audio):
+        preprocess_audio(raw_audio, "clean.wav")
+        return "clean.wav"
 
-    segments, info = transcribe(speech_audio)
-    final_transcript = clean_segments(segments)
+    @pipeline.stage("speech_regions", inputs=("clean_audio",))
+    def vad(clean_audio):
+        return detect_speech(clean_audio)
 
-    with open("output/transcript.json", "w", encoding="utf-8") as f:
-        json.dump(final_transcript, f, indent=2, ensure_ascii=False)
+    @pipeline.stage("asr", inputs=("clean_audio", "speech_regions"))
+    def asr(clean_audio, speech_regions):
+        # Transcribed a group of speech regions at a time; timestamps are
+        # already mapped back onto the meeting timeline
+        return transcribe(clean_audio, speech_regions)
 
-    coverage = sum(
-        s["end"] - s["start"] for s in final_transcript
-    ) / info.duration
+    @pipeline.stage("cleaned", inputs=("asr",))
+    def cleanup(asr):
+        segments, info = asr
+        return clean_segments(segments, language=info.language)
 
-    print(f"Transcript coverage: {coverage:.2%}")
+    # Independent of ASR: runs alongside it on the thread pool, on the
+    # full recording so speaker turns share the transcript's timeline
+    @pipeline.stage("speakers", inputs=("clean_audio",))
+    def diarization(clean_audio):
+        return diarize(clean_audio)
 
-    segments, info = transcribe(speech_audio)
-    cleaned = clean_segments(segments)
+    @pipeline.stage("transcript", inputs=("cleaned", "speakers"))
+    def align(cleaned, speakers):
+        return assign_speaker(cleaned, speakers)
 
-    speakers = diarize(speech_audio)
-    final_transcript = assign_speaker(cleaned, speakers)
+    @pipeline.stage("qa", inputs=("asr", "speakers"))
+    def qa(asr, speakers):
+        segments, info = asr
+        return QAEngine().extend(segments).report(info.duration, speakers=speakers)
 
-    qa = {
-        "coverage": qa_coverage(final_transcript, info.duration),
-        "missing_speech_segments": detect_gaps(final_transcript),
-        "low_confidence_segments": low_confidence_segments(segments)
-    }
+    @pipeline.stage("persisted", inputs=("transcript", "qa"), cache=False)
+    def persist(transcript, qa):
+        with open("output/transcript.json", "w", encoding="utf-8") as f:
+            json.dump(transcript, f, indent=2, ensure_ascii=False)
 
-    with open("output/transcript.json", "w", encoding="utf-8") as f:
-        json.dump(final_transcript, f, indent=2, ensure_ascii=False)
+        with open("output/qa_report.json", "w", encoding="utf-8") as f:
+            json.dump(qa, f, indent=2)
+        return "output"
 
-    with open("output/qa_report.json", "w", encoding="utf-8") as f:
-        json.dump(qa, f, indent=2)
+    return pipeline
+
+def main():
+    results = build_pipeline().run(
+        ["persisted"], max_workers=4, cache_dir=CACHE_DIR,
+        download_url=DOWNLOAD_URL, token=ZOOM_TOKEN,
+    )
+    print(f"Transcript coverage: {results['qa']['coverage']:.2%}")
 
 if __name__ == "__main__":
     main()
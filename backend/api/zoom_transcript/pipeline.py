@@ -0,0 +1,179 @@
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+import hashlib
+import os
+import pickle
+import shutil
+import time
+
+
+class Stage:
+    def __init__(self, name, func, inputs, executor="thread", cache=True, produces_file=False, version=1):
+        if executor not in ("thread", "process"):
+            raise ValueError(f"Unknown executor '{executor}' for stage '{name}'")
+        self.name = name
+        self.func = func
+        self.inputs = tuple(inputs)
+        # "process" stages must be module-level functions (they are pickled)
+        self.executor = executor
+        self.cache = cache
+        # Output is a file path; downstream keys hash the file's content
+        self.produces_file = produces_file
+        # Bump to invalidate cached artifacts after changing the stage
+        self.version = version
+
+
+def fingerprint(value):
+    # Files are identified by content, everything else by its pickled form
+    digest = hashlib.sha256()
+    if isinstance(value, str) and os.path.isfile(value):
+        digest.update(b"file:")
+        with open(value, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+    else:
+        digest.update(pickle.dumps(value, protocol=4))
+    return digest.hexdigest()
+
+
+class ArtifactCache:
+    # Stage outputs pickled on disk, keyed by a hash of the stage and its inputs.
+    # File outputs are copied into the cache: stages write to fixed paths, so
+    # the path alone would point at whatever the latest run left there
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, stage, key):
+        return os.path.join(self.directory, f"{stage.name}-{key}.pkl")
+
+    def load(self, stage, key):
+        try:
+            with open(self._path(stage, key), "rb") as f:
+                value = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return False, None
+        # A cached copy is only usable while it is still there
+        if stage.produces_file and not os.path.isfile(value):
+            return False, None
+        return True, value
+
+    def store(self, stage, key, value):
+        path = self._path(stage, key)
+        artifact = None
+        try:
+            if stage.produces_file:
+                artifact = os.path.join(self.directory, f"{stage.name}-{key}{os.path.splitext(value)[1]}")
+                shutil.copyfile(value, artifact + ".part")
+                os.replace(artifact + ".part", artifact)
+                value = artifact
+            with open(path + ".part", "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(path + ".part", path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as e:
+            print(f"[PIPELINE] Not caching '{stage.name}': {e}")
+            for partial in (path, artifact):
+                if partial and os.path.exists(partial + ".part"):
+                    os.remove(partial + ".part")
+
+
+class Pipeline:
+    # Stages form a DAG: each one names the stages (or run parameters) it
+    # consumes. run() computes every required stage exactly once, starting
+    # each as soon as its inputs exist, so independent stages (e.g. ASR and
+    # diarization) overlap and latency follows the critical path
+
+    def __init__(self):
+        self.stages = {}
+        self.timings = {}
+
+    def stage(self, name, inputs=(), **options):
+        def register(func):
+            if name in self.stages:
+                raise ValueError(f"Stage '{name}' is already defined")
+            self.stages[name] = Stage(name, func, inputs, **options)
+            return func
+        return register
+
+    def order(self, targets, params=()):
+        # Topological order of the stages needed for `targets`
+        ordered, visiting, done = [], set(), set(params)
+
+        def visit(name):
+            if name in done:
+                return
+            if name not in self.stages:
+                raise KeyError(f"Unknown stage or parameter '{name}'")
+            if name in visiting:
+                raise ValueError(f"Cycle detected at stage '{name}'")
+            visiting.add(name)
+            for dependency in self.stages[name].inputs:
+                visit(dependency)
+            visiting.discard(name)
+            done.add(name)
+            ordered.append(self.stages[name])
+
+        for target in targets:
+            visit(target)
+        return ordered
+
+    def _key(self, stage, keys):
+        digest = hashlib.sha256(f"{stage.name}:{stage.version}".encode())
+        for name in stage.inputs:
+            digest.update(keys[name].encode())
+        return digest.hexdigest()
+
+    def run(self, targets, max_workers=4, process_workers=1, cache_dir=None, **params):
+        pending = self.order(targets, params)
+        results = dict(params)
+        keys = {name: fingerprint(value) for name, value in params.items()} if cache_dir else {}
+        cache = ArtifactCache(cache_dir) if cache_dir else None
+        self.timings = {}
+
+        threads = ThreadPoolExecutor(max_workers=max_workers)
+        processes = None
+        running = {}
+        try:
+            while pending or running:
+                for stage in [s for s in pending if all(name in results for name in s.inputs)]:
+                    pending.remove(stage)
+                    if cache is not None:
+                        key = self._key(stage, keys)
+                        if stage.cache:
+                            hit, value = cache.load(stage, key)
+                            if hit:
+                                self._finish(stage, value, key, results, keys)
+                                self.timings[stage.name] = 0.0
+                                continue
+                    args = [results[name] for name in stage.inputs]
+                    if stage.executor == "process":
+                        processes = processes or ProcessPoolExecutor(max_workers=process_workers)
+                        future = processes.submit(stage.func, *args)
+                    else:
+                        future = threads.submit(stage.func, *args)
+                    running[future] = (stage, time.perf_counter())
+
+                if not running:
+                    continue
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    stage, started = running.pop(future)
+                    value = future.result()
+                    self.timings[stage.name] = time.perf_counter() - started
+                    print(f"[PIPELINE] {stage.name} done in {self.timings[stage.name]:.1f}s")
+                    key = self._key(stage, keys) if cache is not None else None
+                    if cache is not None and stage.cache:
+                        cache.store(stage, key, value)
+                    self._finish(stage, value, key, results, keys)
+        finally:
+            for future in running:
+                future.cancel()
+            threads.shutdown(wait=True, cancel_futures=True)
+            if processes is not None:
+                processes.shutdown(wait=True, cancel_futures=True)
+        return results
+
+    def _finish(self, stage, value, key, results, keys):
+        results[stage.name] = value
+        if key is not None:
+            keys[stage.name] = fingerprint(value) if stage.produces_file else key
@@ -1,29 +1,113 @@
+import numpy as np
+
+# Mirror the filters in cleanup.clean_segments: rows failing them are not
+# part of the transcript, so they do not count towards coverage or gaps
+MIN_AVG_LOGPROB = -1.2
+MAX_NO_SPEECH_PROB = 0.6
+
+
+def _field(seg, name):
+    value = seg.get(name) if isinstance(seg, dict) else getattr(seg, name, None)
+    return np.nan if value is None else value
+
+
+class QAEngine:
+    # Columnar store of segments (start, end, avg_logprob, no_speech_prob)
+    # that grows as segments stream in; report() derives every QA metric
+    # from the arrays in one vectorized pass and can be called at any time
+
+    def __init__(self, capacity=1024):
+        self._size = 0
+        self._columns = np.empty((4, capacity), dtype=np.float64)
+        self.texts = []
+        self.speaker_labels = []
+
+    def __len__(self):
+        return self._size
+
+    def add(self, seg):
+        if self._size == self._columns.shape[1]:
+            grown = np.empty((4, self._size * 2), dtype=np.float64)
+            grown[:, :self._size] = self._columns[:, :self._size]
+            self._columns = grown
+        self._columns[:, self._size] = (
+            _field(seg, "start"), _field(seg, "end"),
+            _field(seg, "avg_logprob"), _field(seg, "no_speech_prob"),
+        )
+        self._size += 1
+        self.texts.append(seg.get("text") if isinstance(seg, dict) else getattr(seg, "text", None))
+        self.speaker_labels.append(seg.get("speaker") if isinstance(seg, dict) else None)
+
+    def extend(self, segments):
+        for seg in segments:
+            self.add(seg)
+        return self
+
+    def track(self, segments):
+        # Pass a (one-shot) segment generator through while recording it
+        for seg in segments:
+            self.add(seg)
+            yield seg
+
+    def report(self, duration, speakers=None, gap_threshold=2.0, low_confidence_threshold=-1.4):
+        start, end, avg_logprob, no_speech_prob = self._columns[:, :self._size]
+
+        # NaN (field not available) compares False, so such rows are kept
+        kept = ~((avg_logprob < MIN_AVG_LOGPROB) | (no_speech_prob > MAX_NO_SPEECH_PROB))
+        order = np.argsort(start[kept], kind="stable")
+        kept_start = start[kept][order]
+        kept_end = end[kept][order]
+
+        if kept_start.size:
+            # Running max of end times: a long segment hides gaps after shorter ones
+            reach = np.maximum.accumulate(kept_end)
+            gap = kept_start[1:] - reach[:-1]
+            # Union of speech: overlapping segments are counted once
+            block_first = np.flatnonzero(np.concatenate(([True], gap > 0)))
+            spoken = float((np.maximum.reduceat(kept_end, block_first) - kept_start[block_first]).sum())
+        else:
+            reach = gap = np.empty(0)
+            spoken = 0.0
+        gap_index = np.flatnonzero(gap > gap_threshold)
+
+        low_index = np.flatnonzero(avg_logprob < low_confidence_threshold)
+
+        return {
+            "coverage": spoken / duration if duration else 0.0,
+            "missing_speech_segments": [
+                {"gap_start": float(reach[i]), "gap_end": float(kept_start[i + 1]), "duration": float(gap[i])}
+                for i in gap_index
+            ],
+            "low_confidence_segments": [
+                {"start": float(start[i]), "end": float(end[i]), "text": self.texts[i]}
+                for i in low_index
+            ],
+            "speaker_talk_time": self._talk_time(speakers, start, end, kept),
+        }
+
+    def _talk_time(self, speakers, start, end, kept):
+        # From diarization turns when given, else from per-segment speaker labels
+        if speakers is not None:
+            labels = np.array([sp["speaker"] for sp in speakers], dtype=object)
+            durations = np.array([sp["end"] - sp["start"] for sp in speakers], dtype=np.float64)
+        else:
+            labelled = kept & np.array([sp is not None for sp in self.speaker_labels], dtype=bool)
+            labels = np.array(self.speaker_labels, dtype=object)[labelled]
+            durations = (end - start)[labelled]
+        if not labels.size:
+            return {}
+        names, inverse = np.unique(labels.astype(str), return_inverse=True)
+        totals = np.bincount(inverse, weights=durations)
+        return {str(name): float(total) for name, total in zip(names, totals)}
+
+
 def qa_coverage(segments, duration):
-    spoken = sum(s["end"] - s["start"] for s in segments)
-    return spoken / duration
+    return QAEngine().extend(segments).report(duration)["coverage"]
 
-def detect_gaps(segments, threshold=2.0):
-    gaps = []
-    segments = sorted(segments, key=lambda x: x["start"])
 
-    for i in range(len(segments) - 1):
-        gap = segments[i+1]["start"] - segments[i]["end"]
-        if gap > threshold:
-            gaps.append({
-                "gap_start": segments[i]["end"],
-                "gap_end": segments[i+1]["start"],
-                "duration": gap
-            })
-    return gaps
+def detect_gaps(segments, threshold=2.0):
+    return QAEngine().extend(segments).report(None, gap_threshold=threshold)["missing_speech_segments"]
 
 
 def low_confidence_segments(raw_segments):
-    suspicious = []
-    for s in raw_segments:
-        if s.avg_logprob < -1.4:
-            suspicious.append({
-                "start": s.start,
-                "end": s.end,
-                "text": s.text
-            })
-    return suspicious
+    return QAEngine().extend(raw_segments).report(None)["low_confidence_segments"]
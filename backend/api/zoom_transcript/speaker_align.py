@@ -1,10 +1,56 @@
-def assign_speaker(segments, speakers):
-    for seg in segments:
-        seg["speaker"] = "UNKNOWN"
+import heapq
 
-        for sp in speakers:
-            overlap = min(seg["end"], sp["end"]) - max(seg["start"], sp["start"])
+
+def _max_overlap_speakers(intervals, speakers):
+    # Sweep line: intervals and turns are both visited in start order, and
+    # only the turns still active at an interval's start are compared, so the
+    # cost is O((n + m) log m) instead of n * m. Overlap is summed per
+    # speaker label, and the label with the most overlap wins.
+    turns = sorted(speakers, key=lambda sp: sp["start"])
+    order = sorted(range(len(intervals)), key=lambda i: intervals[i][0])
+    labels = [None] * len(intervals)
+
+    active = []  # heap of (turn end, turn index)
+    next_turn = 0
+    for i in order:
+        start, end = intervals[i]
+        while next_turn < len(turns) and turns[next_turn]["start"] < end:
+            heapq.heappush(active, (turns[next_turn]["end"], next_turn))
+            next_turn += 1
+        while active and active[0][0] <= start:
+            heapq.heappop(active)
+
+        totals = {}
+        for turn_end, t in active:
+            overlap = min(end, turn_end) - max(start, turns[t]["start"])
             if overlap > 0:
-                seg["speaker"] = sp["speaker"]
-                break
+                label = turns[t]["speaker"]
+                totals[label] = totals.get(label, 0.0) + overlap
+        if totals:
+            labels[i] = max(totals, key=totals.get)
+    return labels
+
+
+def assign_word_speakers(segments, speakers):
+    words = [w for seg in segments for w in seg.get("words") or ()]
+    labels = _max_overlap_speakers([(w["start"], w["end"]) for w in words], speakers)
+    for word, label in zip(words, labels):
+        word["speaker"] = label
+    return segments
+
+
+def assign_speaker(segments, speakers, word_level=True):
+    if word_level:
+        assign_word_speakers(segments, speakers)
+
+    segment_labels = _max_overlap_speakers([(s["start"], s["end"]) for s in segments], speakers)
+    for seg, label in zip(segments, segment_labels):
+        # With word timestamps the segment takes the speaker holding most of its words' time
+        durations = {}
+        for w in seg.get("words") or ():
+            if w.get("speaker"):
+                durations[w["speaker"]] = durations.get(w["speaker"], 0.0) + (w["end"] - w["start"])
+        if durations:
+            label = max(durations, key=durations.get)
+        seg["speaker"] = label or "UNKNOWN"
     return segments
@@ -0,0 +1,115 @@
+from bisect import bisect_left, bisect_right
+import dataclasses
+
+import numpy as np
+
+
+def with_fields(obj, **changes):
+    # faster-whisper results are NamedTuples in older releases, dataclasses in newer ones
+    if hasattr(obj, "_replace"):
+        return obj._replace(**changes)
+    return dataclasses.replace(obj, **changes)
+
+
+def group_regions(regions, max_seconds):
+    # Consecutive speech regions batched into groups of up to max_seconds of
+    # speech, one ASR call each. A longer region stays whole rather than
+    # being cut mid-word. Lazy, so `regions` may be unbounded
+    group, length = [], 0.0
+    for region in regions:
+        duration = float(region["end"]) - float(region["start"])
+        if group and length + duration > max_seconds:
+            yield group
+            group, length = [], 0.0
+        group.append(region)
+        length += duration
+    if group:
+        yield group
+
+
+def gather_groups(windows, groups, sampling_rate):
+    # For consecutive sample windows (stream_pcm) yields each group with the
+    # samples of its regions back to back, as soon as its last region has
+    # been read. Only the current window and group are held in memory. The
+    # stream is always read to its end; groups after it are dropped
+    def sample_spans(group):
+        return [
+            (int(round(float(r["start"]) * sampling_rate)), int(round(float(r["end"]) * sampling_rate)))
+            for r in group
+        ]
+
+    def joined(chunks):
+        return np.concatenate(chunks) if chunks else np.empty(0, dtype=np.float32)
+
+    groups = iter(groups)
+    group = next(groups, None)
+    spans = sample_spans(group) if group else []
+    index, chunks, position = 0, [], 0
+    for window in windows:
+        window_end = position + len(window)
+        while group is not None:
+            start, end = spans[index]
+            if start >= window_end:
+                break
+            piece = window[max(start - position, 0):max(min(end, window_end) - position, 0)]
+            if piece.size:
+                # A copy, so the rest of the window is not kept alive
+                chunks.append(piece.copy())
+            if end > window_end:
+                break
+            index += 1
+            if index == len(spans):
+                yield group, joined(chunks)
+                group = next(groups, None)
+                spans = sample_spans(group) if group else []
+                index, chunks = 0, []
+        position = window_end
+    if group is not None and chunks:
+        # The recording ended inside this group
+        yield group, joined(chunks)
+
+
+class OffsetMap:
+    # Piecewise map between the original recording and the speech-only
+    # timeline obtained by playing the VAD regions back to back. Region i
+    # starts at speech_starts[i] on the speech timeline and is shifted by
+    # shifts[i] to get back to the recording
+
+    def __init__(self, regions):
+        self.regions = [(float(r["start"]), float(r["end"])) for r in regions]
+        self.speech_starts = []
+        self.shifts = []
+        position = 0.0
+        for start, end in self.regions:
+            self.speech_starts.append(position)
+            self.shifts.append(start - position)
+            position += end - start
+        self.speech_duration = position
+
+    def to_original(self, t, is_end=False):
+        if not self.shifts:
+            return t
+        # A time on a region boundary is the end of the previous region when
+        # it closes an interval and the start of the next one when it opens it
+        find = bisect_left if is_end else bisect_right
+        i = max(find(self.speech_starts, t) - 1, 0)
+        return t + self.shifts[i]
+
+    def remap_segment(self, seg):
+        words = getattr(seg, "words", None)
+        if words:
+            words = [
+                with_fields(w, start=self.to_original(w.start), end=self.to_original(w.end, is_end=True))
+                for w in words
+            ]
+        return with_fields(
+            seg,
+            start=self.to_original(seg.start),
+            end=self.to_original(seg.end, is_end=True),
+            words=words,
+        )
+
+    def remap_segments(self, segments):
+        # Lazy, like the faster-whisper generator it wraps
+        for seg in segments:
+            yield self.remap_segment(seg)
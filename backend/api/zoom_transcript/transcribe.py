@@ -1,24 +1,65 @@
+import itertools
+
+import numpy as np
 from faster_whisper import WhisperModel
 
-def transcribe(audio_file):
+from audio_preprocess import stream_pcm
+from timeline import OffsetMap, gather_groups, group_regions, with_fields
+
+SAMPLE_RATE = 16000
+# Speech per Whisper call: bounds memory to one group, however long the meeting
+MAX_GROUP_SECONDS = 300.0
+
+TRANSCRIBE_OPTIONS = dict(
+    language="id",
+    beam_size=5,
+    best_of=5,
+    temperature=0.0,
+    word_timestamps=True,
+    vad_filter=False,
+    initial_prompt=(
+        "Ini adalah transkrip rapat formal berbahasa Indonesia. "
+        "Gunakan bahasa jelas dan baku."
+    )
+)
+
+def transcribe(audio_file, speech_regions=None):
     model = WhisperModel(
         "large-v3",
         device="cuda",
         compute_type="float16"
     )
 
-    segments, info = model.transcribe(
-        audio_file,
-        language="id",
-        beam_size=5,
-        best_of=5,
-        temperature=0.0,
-        word_timestamps=True,
-        vad_filter=False,
-        initial_prompt=(
-            "Ini adalah transkrip rapat formal berbahasa Indonesia. "
-            "Gunakan bahasa jelas dan baku."
-        )
+    # The recording is decoded as a stream and only the VAD speech regions
+    # are kept, a group at a time; each group is transcribed on its own and
+    # its timestamps are mapped back onto the original recording. Without
+    # regions the whole recording is cut into MAX_GROUP_SECONDS pieces
+    regions = speech_regions if speech_regions is not None else (
+        {"start": t, "end": t + MAX_GROUP_SECONDS} for t in itertools.count(0.0, MAX_GROUP_SECONDS)
     )
+    total_samples = 0
+
+    def counted(windows):
+        nonlocal total_samples
+        for window in windows:
+            total_samples += len(window)
+            yield window
+
+    segments, info = [], None
+    groups = gather_groups(counted(stream_pcm(audio_file, SAMPLE_RATE)),
+                           group_regions(regions, MAX_GROUP_SECONDS), SAMPLE_RATE)
+    for group, samples in groups:
+        group_segments, group_info = model.transcribe(samples, **TRANSCRIBE_OPTIONS)
+        for seg in OffsetMap(group).remap_segments(group_segments):
+            # Segment ids restart with every call: number them meeting-wide
+            segments.append(with_fields(seg, id=len(segments) + 1))
+        info = info or group_info
+
+    if info is None:
+        # No speech at all: still report the language settings
+        _, info = model.transcribe(np.zeros(0, dtype=np.float32), **TRANSCRIBE_OPTIONS)
+
+    # Report the recording's length, not the speech-only length, for QA coverage
+    info = with_fields(info, duration=total_samples / SAMPLE_RATE)
 
     return segments, info
@@ -1,36 +1,142 @@
-import torch
-import torchaudio
+import importlib.util
+import os
+from functools import lru_cache
 
-model, utils = torch.hub.load(
-    repo_or_dir="snakers4/silero-vad",
-    model="silero_vad"
-)
+import numpy as np
 
-(get_speech_timestamps, _, _, _) = utils
+from audio_preprocess import frames, stream_pcm
 
-def merge_segments(segments, min_gap=0.4):
-    merged = []
-    for s in segments:
-        if not merged:
-            merged.append(s)
-        elif s["start"] - merged[-1]["end"] < min_gap:
-            merged[-1]["end"] = s["end"]
-        else:
-            merged.append(s)
-    return merged
+SAMPLE_RATE = 16000
+# Silero scores fixed 32 ms frames at 16 kHz, each seeing the last 64
+# samples of the previous frame as context
+FRAME_SAMPLES = 512
+CONTEXT_SAMPLES = 64
 
-def extract_speech(input_wav, output_wav):
-    wav, sr = torchaudio.load(input_wav)
+def model_path():
+    # Offline only: an explicit path, a copy next to this module, or the
+    # model file shipped inside the silero-vad wheel. Nothing is downloaded
+    candidates = [
+        os.environ.get("SILERO_VAD_MODEL"),
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "models", "silero_vad.onnx"),
+    ]
+    # find_spec locates the package without importing it (and torch with it)
+    spec = importlib.util.find_spec("silero_vad")
+    if spec is not None and spec.origin:
+        candidates.append(os.path.join(os.path.dirname(spec.origin), "data", "silero_vad.onnx"))
+    for path in candidates:
+        if path and os.path.isfile(path):
+            return path
+    raise FileNotFoundError(
+        "Silero VAD model not found: set SILERO_VAD_MODEL to silero_vad.onnx "
+        "or install the silero-vad package"
+    )
 
-    speech = get_speech_timestamps(
-        wav,
-        model,
-        sampling_rate=sr
+@lru_cache(maxsize=1)
+def load_session():
+    # Loaded on first use, not at import
+    import onnxruntime
+
+    options = onnxruntime.SessionOptions()
+    # One small frame per call: thread pool hand-offs cost more than the
+    # inference itself, so run everything on the calling thread
+    options.intra_op_num_threads = 1
+    options.inter_op_num_threads = 1
+    options.execution_mode = onnxruntime.ExecutionMode.ORT_SEQUENTIAL
+    options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    return onnxruntime.InferenceSession(
+        model_path(),
+        sess_options=options,
+        providers=["CPUExecutionProvider"]
     )
 
-    speech = merge_segments(speech)
+class SileroVAD:
+    # Streaming Silero VAD on ONNX Runtime, with the start/end rules of
+    # silero's VADIterator. The recurrent state, frame context, open region
+    # and sample position all live here, so frames can come from any number
+    # of decode windows. Event positions are in samples
+
+    def __init__(self, session=None, threshold=0.5, min_silence_ms=100, speech_pad_ms=30):
+        self.session = session or load_session()
+        self.threshold = threshold
+        self.min_silence_samples = SAMPLE_RATE * min_silence_ms // 1000
+        self.speech_pad_samples = SAMPLE_RATE * speech_pad_ms // 1000
+        self._state = np.zeros((2, 1, 128), dtype=np.float32)
+        self._context = np.zeros((1, CONTEXT_SAMPLES), dtype=np.float32)
+        self._sampling_rate = np.array(SAMPLE_RATE, dtype=np.int64)
+        self.triggered = False
+        self.temp_end = 0
+        self.current_sample = 0
+
+    def probability(self, frame):
+        x = np.concatenate((self._context, frame.reshape(1, -1).astype(np.float32, copy=False)), axis=1)
+        out, self._state = self.session.run(
+            None, {"input": x, "state": self._state, "sr": self._sampling_rate}
+        )
+        self._context = x[:, -CONTEXT_SAMPLES:]
+        return float(np.asarray(out).reshape(-1)[0])
+
+    def __call__(self, frame):
+        self.current_sample += FRAME_SAMPLES
+        prob = self.probability(frame)
+
+        if prob >= self.threshold and self.temp_end:
+            self.temp_end = 0
+        if prob >= self.threshold and not self.triggered:
+            self.triggered = True
+            return {"start": max(0, self.current_sample - self.speech_pad_samples - FRAME_SAMPLES)}
+        # Hysteresis: speech only ends once the score drops well below threshold
+        if prob < self.threshold - 0.15 and self.triggered:
+            if not self.temp_end:
+                self.temp_end = self.current_sample
+            if self.current_sample - self.temp_end < self.min_silence_samples:
+                return None
+            end = self.temp_end + self.speech_pad_samples - FRAME_SAMPLES
+            self.temp_end = 0
+            self.triggered = False
+            return {"end": end}
+        return None
+
+def merge_segments(segments, min_gap=0.4):
+    # Regions are in seconds; pauses shorter than min_gap stay inside the
+    # region. Works on a stream: a region is yielded once the next one is
+    # known to start min_gap or more after it
+    current = None
+    for s in segments:
+        if current is None:
+            current = dict(s)
+        elif s["start"] - current["end"] < min_gap:
+            current["end"] = s["end"]
+        else:
+            yield current
+            current = dict(s)
+    if current is not None:
+        yield current
+
+def _raw_regions(input_file, window_seconds, min_speech):
+    vad = SileroVAD()
+    start = None
+    for frame in frames(stream_pcm(input_file, SAMPLE_RATE, window_seconds), FRAME_SAMPLES):
+        event = vad(frame)
+        if not event:
+            continue
+        if "start" in event:
+            start = event["start"] / SAMPLE_RATE
+        elif start is not None:
+            end = event["end"] / SAMPLE_RATE
+            if end - start >= min_speech:
+                yield {"start": start, "end": end}
+            start = None
+    # Speech running until the end of the recording
+    end = vad.current_sample / SAMPLE_RATE
+    if start is not None and end - start >= min_speech:
+        yield {"start": start, "end": end}
 
-    chunks = [wav[:, s["start"]:s["end"]] for s in speech]
-    speech_audio = torch.cat(chunks, dim=1)
+def stream_speech(input_file, window_seconds=30.0, min_speech=0.25, min_gap=0.4):
+    # Speech regions on the original timeline, in seconds, yielded while
+    # ffmpeg is still decoding; memory is bounded by one window
+    return merge_segments(_raw_regions(input_file, window_seconds, min_speech), min_gap)
 
-    torchaudio.save(output_wav, speech_audio, sr)
+def detect_speech(input_wav):
+    # No audio is written: ASR gathers these regions itself and maps its
+    # timestamps back onto the recording
+    return list(stream_speech(input_wav))
@@ -1,9 +1,166 @@
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
+
+CHUNK_SIZE = 1024 * 1024
+MAX_RETRIES = 5
+MAX_CONCURRENT_DOWNLOADS = 3
+# (connect, read) timeouts; a stalled read is retried from where it stopped
+TIMEOUT = (10, 60)
+
+RETRY_BACKOFF = 1.0  # seconds, doubled per retry
+
+class IncompleteDownload(Exception):
+    # Transfer stopped short; it continues from the part file on retry
+    pass
+
+_TRANSIENT = (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError, IncompleteDownload)
+_CONTENT_RANGE = re.compile(r"bytes (?:(\d+)-\d+|\*)/(\d+|\*)")
+
+_session = None
+_session_lock = threading.Lock()
+
+def get_session():
+    # One pooled session: recordings on the same host reuse connections
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=MAX_CONCURRENT_DOWNLOADS * 2)
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+def _total_size(response):
+    # Full file size from Content-Range (206/416) or Content-Length (200)
+    if "Content-Range" in response.headers:
+        match = _CONTENT_RANGE.match(response.headers["Content-Range"])
+        return int(match.group(2)) if match and match.group(2) != "*" else None
+    length = response.headers.get("Content-Length")
+    return int(length) if length is not None and "Content-Encoding" not in response.headers else None
+
+def _validator(response):
+    # What identifies this version of the remote file for If-Range: a strong
+    # ETag, else Last-Modified (weak ETags are not allowed in If-Range)
+    etag = response.headers.get("ETag")
+    if etag and not etag.startswith("W/"):
+        return etag
+    return response.headers.get("Last-Modified")
+
+def _read_meta(meta_file):
+    try:
+        with open(meta_file, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_meta(meta_file, download_url, validator):
+    with open(meta_file, "w", encoding="utf-8") as f:
+        json.dump({"url": download_url, "validator": validator}, f)
+
+def _discard(*paths):
+    for path in paths:
+        if os.path.exists(path):
+            os.remove(path)
+
+def download_zoom_audio(download_url, token, out_file, session=None, chunk_size=CHUNK_SIZE,
+                        max_retries=MAX_RETRIES, backoff=RETRY_BACKOFF):
+    # Streams to <out_file>.part in chunks (memory stays at one chunk) and
+    # resumes with an HTTP Range request after a dropped connection, also
+    # across runs. <out_file>.part.meta ties the part file to its URL and
+    # the remote version (ETag / Last-Modified); a part file from another
+    # URL is discarded, and If-Range makes the server send the whole file
+    # again if the recording changed. The file only gets its final name
+    # once its size matches
+    session = session or get_session()
+    part_file = out_file + ".part"
+    meta_file = part_file + ".meta"
+    attempt = 0
+
+    while True:
+        offset = os.path.getsize(part_file) if os.path.exists(part_file) else 0
+        meta = _read_meta(meta_file) if offset else None
+        if offset and (meta is None or meta.get("url") != download_url):
+            print(f"[DOWNLOAD] {part_file} belongs to another download; starting over")
+            _discard(part_file, meta_file)
+            offset, meta = 0, None
+        started_at = offset
+        headers = {"Authorization": f"Bearer {token}"}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+            if meta.get("validator"):
+                headers["If-Range"] = meta["validator"]
+
+        try:
+            with session.get(download_url, headers=headers, stream=True, timeout=TIMEOUT) as r:
+                if r.status_code == 416 and offset:
+                    # Nothing left to fetch: the part file may already be complete
+                    total = _total_size(r)
+                    if total == offset:
+                        break
+                    _discard(part_file, meta_file)
+                    raise IncompleteDownload(f"Partial download of {out_file} does not match the remote file; restarting")
+                if r.status_code >= 500 or r.status_code == 429:
+                    raise IncompleteDownload(f"HTTP {r.status_code} from {download_url}")
+                r.raise_for_status()
+
+                total = _total_size(r)
+                validator = _validator(r)
+                if r.status_code == 206:
+                    match = _CONTENT_RANGE.match(r.headers.get("Content-Range", ""))
+                    if not match or match.group(1) != str(offset):
+                        _discard(part_file, meta_file)
+                        raise IncompleteDownload(f"Unexpected Content-Range for {out_file}: {r.headers.get('Content-Range')}; restarting")
+                    if validator and meta.get("validator") and validator != meta["validator"]:
+                        # Server ignored If-Range and sent bytes of another version
+                        _discard(part_file, meta_file)
+                        raise IncompleteDownload(f"Remote file for {out_file} changed; restarting")
+                    if validator and not meta.get("validator"):
+                        _write_meta(meta_file, download_url, validator)
+                    mode = "ab"
+                else:
+                    # Range ignored, or If-Range did not match: start over
+                    offset = 0
+                    mode = "wb"
+                    _write_meta(meta_file, download_url, validator)
+
+                with open(part_file, mode) as f:
+                    for chunk in r.iter_content(chunk_size=chunk_size):
+                        f.write(chunk)
+                        offset += len(chunk)
+
+            if total is None or offset == total:
+                break
+            raise IncompleteDownload(f"Connection closed at {offset} of {total} bytes")
+        except _TRANSIENT as e:
+            # Only consecutive attempts that got nothing count towards max_retries
+            if os.path.exists(part_file) and os.path.getsize(part_file) > started_at:
+                attempt = 0
+            attempt += 1
+            if attempt > max_retries:
+                raise
+            delay = min(backoff * 2 ** (attempt - 1), 30)
+            print(f"[DOWNLOAD] {e}; resuming {out_file} from byte "
+                  f"{os.path.getsize(part_file) if os.path.exists(part_file) else 0} in {delay:g}s")
+            time.sleep(delay)
+
+    os.replace(part_file, out_file)
+    _discard(meta_file)
+    return out_file
 
-def download_zoom_audio(download_url, token, out_file):
-    headers = {
-        "Authorization": f"Bearer {token}"
-    }
-    r = requests.get(download_url)
-    with open(out_file, "wb") as f:
-        f.write(r.content)
+def download_many(downloads, token, max_concurrent=MAX_CONCURRENT_DOWNLOADS, session=None):
+    # downloads: [(download_url, out_file), ...]; at most max_concurrent run
+    # at a time over the shared session. Returns the output paths in order
+    session = session or get_session()
+    with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+        futures = [
+            executor.submit(download_zoom_audio, url, token, out_file, session)
+            for url, out_file in downloads
+        ]
+        return [future.result() for future in futures]
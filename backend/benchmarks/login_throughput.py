@@ -0,0 +1,118 @@
+"""
+Login throughput benchmark.
+
+Fires a burst of concurrent POST /auth/login requests against the app
+in-process while a probe keeps calling a sync endpoint (GET /users/me),
+and reports logins per second plus the probe's latency. Run it once per
+hashing mode to compare:
+
+    python benchmarks/login_throughput.py --hash-workers 2
+    python benchmarks/login_throughput.py --hash-workers 0   # threadpool only
+
+Uses a throwaway SQLite database unless DATABASE_URL is already set.
+"""
+from pathlib import Path
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+
+def _configure(args: argparse.Namespace) -> None:
+    # Settings are read at import time, so configure before importing the app
+    if "DATABASE_URL" not in os.environ:
+        db_path = Path(tempfile.mkdtemp()) / "login_benchmark.db"
+        os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+    os.environ["PASSWORD_HASH_WORKERS"] = str(args.hash_workers)
+    os.environ["BCRYPT_ROUNDS"] = str(args.rounds)
+
+
+async def _run(args: argparse.Namespace) -> None:
+    import httpx
+
+    from core.jwt import create_access_token
+    from core.security import hash_password, shutdown_password_hasher
+    from database.base import Base, SessionLocal, engine
+    from main import app
+    from domains.user.model import User
+
+    Base.metadata.create_all(bind=engine)
+    password = "benchmark-password"
+    hashed = hash_password(password)
+    db = SessionLocal()
+    emails = [f"bench{i}@example.com" for i in range(args.users)]
+    existing = {email for (email,) in db.query(User.email).filter(User.email.in_(emails))}
+    db.add_all(
+        User(email=email, full_name="Benchmark", hashed_password=hashed, is_active=True, is_verified=True)
+        for email in emails if email not in existing
+    )
+    db.commit()
+    probe_user = db.query(User).filter(User.email == emails[0]).first()
+    probe_headers = {"Authorization": "Bearer " + create_access_token({"sub": str(probe_user.id), "email": probe_user.email})}
+    db.close()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Warm up the hashing pool and the user cache
+        await client.post("/auth/login", json={"email": emails[0], "password": password})
+        await client.get("/users/me", headers=probe_headers)
+
+        semaphore = asyncio.Semaphore(args.concurrency)
+        probe_latencies = []
+        done = asyncio.Event()
+
+        async def login(i: int) -> int:
+            async with semaphore:
+                response = await client.post(
+                    "/auth/login",
+                    json={"email": emails[i % len(emails)], "password": password}
+                )
+                return response.status_code
+
+        async def probe() -> None:
+            while not done.is_set():
+                started = time.perf_counter()
+                await client.get("/users/me", headers=probe_headers)
+                probe_latencies.append(time.perf_counter() - started)
+                await asyncio.sleep(0.01)
+
+        probe_task = asyncio.create_task(probe())
+        started = time.perf_counter()
+        statuses = await asyncio.gather(*(login(i) for i in range(args.logins)))
+        elapsed = time.perf_counter() - started
+        done.set()
+        await probe_task
+
+    shutdown_password_hasher()
+
+    failures = sum(1 for code in statuses if code != 200)
+    latencies_ms = sorted(latency * 1000 for latency in probe_latencies)
+    p95 = latencies_ms[int(len(latencies_ms) * 0.95) - 1] if len(latencies_ms) >= 20 else max(latencies_ms)
+    print(f"hash workers      : {args.hash_workers or 'threadpool'} (bcrypt rounds {args.rounds})")
+    print(f"logins            : {args.logins} in {elapsed:.2f}s ({args.logins / elapsed:.1f}/s), {failures} failed")
+    print(f"/users/me probes  : {len(latencies_ms)}")
+    print(f"probe latency p50 : {statistics.median(latencies_ms):.1f} ms")
+    print(f"probe latency p95 : {p95:.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--logins", type=int, default=200, help="Login requests in the burst")
+    parser.add_argument("--concurrency", type=int, default=50, help="Logins in flight at once")
+    parser.add_argument("--users", type=int, default=20, help="Distinct accounts to log in")
+    parser.add_argument("--hash-workers", type=int, default=2, help="PASSWORD_HASH_WORKERS (0 = threadpool)")
+    parser.add_argument("--rounds", type=int, default=12, help="BCRYPT_ROUNDS")
+    args = parser.parse_args()
+
+    _configure(args)
+    asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Response compression with Accept-Encoding negotiation.
+
+Brotli ("br") is preferred when the optional `brotli` package is installed
+and the client accepts it; gzip is the fallback. Streaming responses are
+flushed per chunk so NDJSON and other incremental bodies stay incremental.
+Server-Sent Events, media, already-compressed formats and responses that
+set Content-Encoding themselves are passed through untouched.
+"""
+from typing import Optional
+import zlib
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+# Bodies smaller than this are sent as-is (headers would eat the savings)
+MINIMUM_SIZE = 1024
+
+# Chunks at least this large are compressed off the event loop
+THREAD_MINIMUM_SIZE = 256 * 1024
+
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+EXCLUDED_CONTENT_TYPES = (
+    "text/event-stream",
+    "audio/",
+    "video/",
+    "image/",
+    "application/zip",
+    "application/gzip",
+    "application/vnd.openxmlformats-officedocument.",
+)
+
+
+def supported_encodings() -> tuple:
+    """Encodings this process can produce, in order of preference."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Pick the response encoding from an Accept-Encoding header.
+
+    Args:
+        accept_encoding: Raw header value (may be None)
+
+    Returns:
+        "br", "gzip", or None for identity
+    """
+    if not accept_encoding:
+        return None
+
+    accepted = {}
+    for item in accept_encoding.lower().split(","):
+        name, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip()] = quality
+
+    candidates = [
+        encoding for encoding in supported_encodings()
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0
+    ]
+    if not candidates:
+        return None
+    # Highest q-value wins; ties keep server preference (br before gzip)
+    return max(candidates, key=lambda encoding: accepted.get(encoding, accepted.get("*", 0.0)))
+
+
+class StreamCompressor:
+    """Incremental compressor for one response body."""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            self._compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        """Compress a chunk; flushes so the client can decode it immediately."""
+        if self.encoding == "br":
+            out = self._compressor.process(data)
+            return out + (self._compressor.finish() if final else self._compressor.flush())
+        out = self._compressor.compress(data)
+        return out + self._compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    """Compress a complete body (e.g. for caching pre-encoded responses)."""
+    return StreamCompressor(encoding).compress(body, final=True)
+
+
+class CompressionMiddleware:
+    """ASGI middleware applying br/gzip to eligible responses."""
+
+    def __init__(self, app: ASGIApp, minimum_size: int = MINIMUM_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        await _CompressionResponder(self.app, encoding, self.minimum_size)(scope, receive, send)
+
+
+class _CompressionResponder:
+    """Per-request send wrapper; holds the start message until the first body chunk."""
+
+    def __init__(self, app: ASGIApp, encoding: str, minimum_size: int):
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.send: Send = None
+        self.start_message: Optional[Message] = None
+        self.passthrough = False
+        self.compressor: Optional[StreamCompressor] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message) -> None:
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "").lower()
+            self.passthrough = (
+                "content-encoding" in headers
+                or message["status"] in (204, 206, 304)
+                or content_type.startswith(EXCLUDED_CONTENT_TYPES)
+            )
+            if self.passthrough:
+                await self.send(message)
+            else:
+                self.start_message = message
+            return
+
+        if message_type != "http.response.body" or self.passthrough:
+            if self.start_message is not None:
+                # e.g. http.response.pathsend: file bodies are sent as-is
+                self.passthrough = True
+                await self.send(self.start_message)
+                self.start_message = None
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.start_message is not None:
+            start, self.start_message = self.start_message, None
+            headers = MutableHeaders(raw=start["headers"])
+            headers.add_vary_header("Accept-Encoding")
+
+            if not more_body and len(body) < self.minimum_size:
+                self.passthrough = True
+                await self.send(start)
+                await self.send(message)
+                return
+
+            self.compressor = StreamCompressor(self.encoding)
+            headers["Content-Encoding"] = self.encoding
+            if "content-length" in headers:
+                del headers["Content-Length"]
+            body = await self._compress(body, final=not more_body)
+            if not more_body:
+                headers["Content-Length"] = str(len(body))
+            await self.send(start)
+        else:
+            body = await self._compress(body, final=not more_body)
+
+        await self.send({"type": "http.response.body", "body": body, "more_body": more_body})
+
+    async def _compress(self, data: bytes, final: bool) -> bytes:
+        if len(data) >= THREAD_MINIMUM_SIZE:
+            return await run_in_threadpool(self.compressor.compress, data, final)
+        return self.compressor.compress(data, final)
@@ -21,6 +21,7 @@ class Settings(BaseSettings):
     # Database Configuration
     # ============================================================
     DATABASE_URL: str
+    ASYNC_DATABASE_URL: Optional[str] = None  # Defaults to DATABASE_URL with its asyncio driver (asyncpg/aiosqlite)
     
     # ============================================================
     # JWT & Authentication
@@ -29,11 +30,16 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    STREAM_TOKEN_EXPIRE_MINUTES: int = 10  # Transcript-scoped tokens for links/EventSource/<audio> (?token=)
+    AUTH_USER_CACHE_SECONDS: int = 30  # TTL of cached user state per token lookup (0 = query every request)
+    AUTH_USER_CACHE_BACKEND: str = "memory"  # memory (per process) or postgres (LISTEN/NOTIFY invalidation)
     
     # ============================================================
     # Security Configuration
     # ============================================================
     PASSWORD_MIN_LENGTH: int = 8
+    BCRYPT_ROUNDS: int = 12  # Raising it upgrades existing hashes on their next login
+    PASSWORD_HASH_WORKERS: int = 2  # Processes reserved for bcrypt (0 = default threadpool)
     OTP_EXPIRE_MINUTES: int = 10
     OTP_LENGTH: int = 6
     
@@ -60,6 +66,13 @@ class Settings(BaseSettings):
     TRANSCRIPTS_DIR: str = "./transcripts"
     UPLOADS_DIR: str = "./uploads"
     
+    # ============================================================
+    # Upload Configuration
+    # ============================================================
+    MAX_UPLOAD_SIZE_MB: int = 100  # Single-request uploads
+    MAX_RESUMABLE_UPLOAD_SIZE_MB: int = 4096  # Chunked/resumable uploads (long meetings)
+    RESUMABLE_UPLOAD_EXPIRE_HOURS: int = 24
+    
     # ============================================================
     # AI/ML Model Configuration
     # ============================================================
@@ -94,6 +107,30 @@ class Settings(BaseSettings):
     ENABLE_SUMMARIZATION: bool = True
     ENABLE_DIARIZATION: bool = True
     
+    # ============================================================
+    # Transcript Events (server push)
+    # ============================================================
+    TRANSCRIPT_EVENTS_BACKEND: str = "memory"  # memory (single process) or postgres (LISTEN/NOTIFY)
+    
+    # ============================================================
+    # Transcript Listing & Caching
+    # ============================================================
+    TRANSCRIPT_COUNT_CACHE_SECONDS: int = 60  # TTL of per-user totals for GET /transcripts?include_total=true
+    TRANSCRIPT_RESPONSE_CACHE_BYTES: int = 64 * 1024 * 1024  # LRU budget for serialized DONE transcripts
+    TRANSCRIPT_CLIENT_MAX_AGE: int = 3600  # Cache-Control max-age for DONE transcripts (seconds)
+    
+    # ============================================================
+    # Audio Retention (playback via GET /transcripts/{id}/audio)
+    # ============================================================
+    AUDIO_RETENTION_DAYS: Optional[int] = 30  # 0 = delete right after transcription, None = keep forever
+    AUDIO_RETENTION_SWEEP_MINUTES: int = 60  # How often expired audio files are purged
+    
+    # ============================================================
+    # Zoom Bot Configuration
+    # ============================================================
+    ZOOM_BOT_LOW_RESOURCE: bool = False  # Low-resource Chrome profile for dense hosting
+    ZOOM_BOT_RSS_BUDGET_MB: Optional[int] = None  # Per-bot RSS budget (warns when exceeded)
+    
     # ============================================================
     # Webhook Configuration
     # ============================================================
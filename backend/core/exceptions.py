@@ -49,3 +49,21 @@ class ValidationError(AppException):
     """Raised when validation fails."""
     def __init__(self, message: str):
         super().__init__(message, status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+
+class UploadSessionNotFoundError(AppException):
+    """Raised when a resumable upload session is missing or expired."""
+    def __init__(self, message: str = "Upload session not found or expired"):
+        super().__init__(message, status.HTTP_404_NOT_FOUND)
+
+
+class UploadConflictError(AppException):
+    """Raised when a resumable upload request does not match the session state."""
+    def __init__(self, message: str):
+        super().__init__(message, status.HTTP_409_CONFLICT)
+
+
+class InvalidCursorError(AppException):
+    """Raised when a pagination cursor cannot be decoded."""
+    def __init__(self, message: str = "Invalid pagination cursor"):
+        super().__init__(message, status.HTTP_400_BAD_REQUEST)
@@ -37,6 +37,24 @@ def create_refresh_token(data: Dict[str, Any]) -> str:
     return encoded_jwt
 
 
+def create_stream_token(user_id: int, transcript_id: int) -> str:
+    """
+    Create a short-lived token valid only for one transcript's URLs.
+    
+    Used where the client cannot send an Authorization header (download
+    links, EventSource, <audio src>), so the token ends up in the query
+    string and access logs; it grants nothing beyond that transcript.
+    """
+    expire = datetime.utcnow() + timedelta(minutes=settings.STREAM_TOKEN_EXPIRE_MINUTES)
+    to_encode = {
+        "sub": str(user_id),
+        "tid": transcript_id,
+        "exp": expire,
+        "type": "stream"
+    }
+    return jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
+
+
 def decode_token(token: str) -> Dict[str, Any]:
     """Decode and validate JWT token."""
     try:
@@ -64,3 +82,15 @@ def verify_refresh_token(token: str) -> Dict[str, Any]:
         raise InvalidTokenError("Invalid token type")
     
     return payload
+
+
+def verify_stream_token(token: str, transcript_id: int) -> Dict[str, Any]:
+    """Verify a stream token issued for transcript_id and return payload."""
+    payload = decode_token(token)
+    
+    if payload.get("type") != "stream":
+        raise InvalidTokenError("Invalid token type")
+    if payload.get("tid") != transcript_id:
+        raise InvalidTokenError("Token is not valid for this transcript")
+    
+    return payload
@@ -0,0 +1,155 @@
+"""
+HTTP Range responses for large local files (audio playback).
+
+Bodies are read through a read-only memory map in fixed slices, so a seek
+in the player only touches the pages of the requested range and no
+per-request read buffers are allocated. Only single byte ranges are
+served; multi-range requests get the full file, which RFC 9110 allows.
+"""
+from email.utils import format_datetime, parsedate_to_datetime
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator, Optional, Tuple
+import mimetypes
+import mmap
+import os
+
+from fastapi import Request
+from fastapi.responses import Response, StreamingResponse
+
+# Slice size yielded per ASGI body message
+RANGE_CHUNK_SIZE = 256 * 1024
+
+# Upper bound for an open-ended "bytes=N-" request, so a player's probe
+# for the rest of a multi-GB file does not pin a connection for minutes
+MAX_OPEN_RANGE = 16 * 1024 * 1024
+
+
+class RangeNotSatisfiable(Exception):
+    """The requested range lies outside the file."""
+
+
+def parse_range_header(value: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single "bytes=" range.
+
+    Args:
+        value: Range header value
+        size: File size in bytes
+
+    Returns:
+        Inclusive (start, end), or None to serve the whole file
+
+    Raises:
+        RangeNotSatisfiable: If the range starts past the end of the file
+    """
+    if not value or not value.strip().lower().startswith("bytes="):
+        return None
+    spec = value.strip()[6:]
+    if "," in spec:
+        return None
+
+    first, _, last = spec.strip().partition("-")
+    try:
+        if first == "":
+            # Suffix range: the last N bytes
+            length = int(last)
+            if length <= 0:
+                raise RangeNotSatisfiable()
+            return max(0, size - length), size - 1
+        start = int(first)
+        end = int(last) if last else min(size - 1, start + MAX_OPEN_RANGE - 1)
+    except ValueError:
+        return None
+
+    if start >= size or start < 0:
+        raise RangeNotSatisfiable()
+    if end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+def _iter_mmap(path: Path, start: int, end: int) -> Iterator[bytes]:
+    """Yield bytes [start, end] of a file from a read-only memory map."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        position = start
+        while position <= end:
+            stop = min(position + RANGE_CHUNK_SIZE, end + 1)
+            yield mapped[position:stop]
+            position = stop
+
+
+def ranged_file_response(
+    path: Path,
+    request: Request,
+    media_type: Optional[str] = None,
+    headers: Optional[dict] = None
+) -> Response:
+    """
+    Serve a local file with Range/If-Range support.
+
+    Args:
+        path: File to serve (must exist)
+        request: Incoming request (Range, If-Range headers)
+        media_type: Content-Type; guessed from the suffix if omitted
+        headers: Extra response headers
+
+    Returns:
+        206 with the requested slice, 200 with the full file, or 416
+    """
+    stat = os.stat(path)
+    size = stat.st_size
+    modified = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+    etag = f'"{stat.st_mtime_ns:x}-{size:x}"'
+    media_type = media_type or mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+
+    response_headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+        "Last-Modified": format_datetime(modified, usegmt=True),
+        **(headers or {})
+    }
+
+    byte_range = None
+    if size > 0 and _if_range_matches(request.headers.get("if-range"), etag, modified):
+        try:
+            byte_range = parse_range_header(request.headers.get("range"), size)
+        except RangeNotSatisfiable:
+            return Response(
+                status_code=416,
+                headers={**response_headers, "Content-Range": f"bytes */{size}"}
+            )
+
+    if size == 0:
+        return Response(content=b"", media_type=media_type, headers=response_headers)
+
+    if byte_range is None:
+        start, end, status_code = 0, size - 1, 200
+    else:
+        (start, end), status_code = byte_range, 206
+        response_headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    response_headers["Content-Length"] = str(end - start + 1)
+
+    if request.method == "HEAD":
+        return Response(status_code=status_code, media_type=media_type, headers=response_headers)
+
+    # Sync iterator: Starlette advances it in the threadpool, so page faults
+    # on the mapped file never block the event loop
+    return StreamingResponse(
+        _iter_mmap(path, start, end),
+        status_code=status_code,
+        media_type=media_type,
+        headers=response_headers
+    )
+
+
+def _if_range_matches(if_range: Optional[str], etag: str, modified: datetime) -> bool:
+    """A Range is only honoured if If-Range (when present) still matches the file."""
+    if not if_range:
+        return True
+    if if_range.startswith('"'):
+        return if_range == etag
+    try:
+        return parsedate_to_datetime(if_range) >= modified.replace(microsecond=0)
+    except (TypeError, ValueError):
+        return False
@@ -0,0 +1,19 @@
+"""
+JSON response class backed by orjson.
+
+FastAPI's own ORJSONResponse is deprecated in recent releases, so the app
+ships its own; main.py installs it as the default response class.
+"""
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson (datetimes, enums, numpy arrays natively)."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_OPTIONS)
@@ -1,9 +1,28 @@
-from passlib.context import CryptContext
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple
+import asyncio
+import multiprocessing
 import secrets
 import string
+import threading
+
+from passlib.context import CryptContext
+
+from core.config import settings
+
 
+# Hashes with fewer rounds than BCRYPT_ROUNDS are upgraded on the next login
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS
+)
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt is CPU-bound and holds the GIL for most of its work, so async
+# callers hash in separate processes instead of the request threadpool
+_hash_pool: Optional[ProcessPoolExecutor] = None
+_hash_pool_lock = threading.Lock()
 
 
 def hash_password(password: str) -> str:
@@ -16,6 +35,65 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and rehash it if its cost is below BCRYPT_ROUNDS.
+
+    Returns:
+        (valid, new_hash) - new_hash is None unless the stored hash should be replaced
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+def _get_hash_pool() -> Optional[ProcessPoolExecutor]:
+    global _hash_pool
+    if settings.PASSWORD_HASH_WORKERS <= 0:
+        return None
+    with _hash_pool_lock:
+        if _hash_pool is None:
+            # spawn: forking a threaded server process is unsafe, and the
+            # workers only need to import this module
+            _hash_pool = ProcessPoolExecutor(
+                max_workers=settings.PASSWORD_HASH_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _hash_pool
+
+
+async def _run_hasher(func, *args):
+    pool = _get_hash_pool()
+    if pool is None:
+        return await asyncio.to_thread(func, *args)
+    return await asyncio.get_running_loop().run_in_executor(pool, func, *args)
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password in the password hashing pool."""
+    return await _run_hasher(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password in the password hashing pool."""
+    return await _run_hasher(verify_password, plain_password, hashed_password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str,
+    hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """verify_and_update_password in the password hashing pool."""
+    return await _run_hasher(verify_and_update_password, plain_password, hashed_password)
+
+
+def shutdown_password_hasher() -> None:
+    """Stop the hashing worker processes (app shutdown)."""
+    global _hash_pool
+    with _hash_pool_lock:
+        if _hash_pool is not None:
+            _hash_pool.shutdown(wait=False, cancel_futures=True)
+            _hash_pool = None
+
+
 def generate_otp(length: int = 6) -> str:
     """Generate a random numeric OTP."""
     return ''.join(secrets.choice(string.digits) for _ in range(length))
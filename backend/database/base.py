@@ -1,4 +1,6 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from core.config import settings
@@ -8,6 +10,37 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+# asyncio drivers for each sync dialect in DATABASE_URL
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+    "mysql": "aiomysql",
+}
+
+
+def get_async_database_url(url: str) -> str:
+    """Derive the asyncio DATABASE_URL (e.g. postgresql+asyncpg) from a sync one."""
+    sa_url = make_url(url)
+    driver = ASYNC_DRIVERS.get(sa_url.get_backend_name())
+    if driver is None:
+        return url
+    return sa_url.set(drivername=f"{sa_url.get_backend_name()}+{driver}").render_as_string(hide_password=False)
+
+
+# Async engine for `async def` routes so DB I/O never blocks the event loop.
+# expire_on_commit=False keeps attributes loaded after commit, since lazy
+# refreshes are not allowed outside an await.
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL or get_async_database_url(settings.DATABASE_URL),
+    pool_pre_ping=True
+)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 
 def get_db():
     """Dependency for getting database session."""
@@ -16,3 +49,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """Dependency for getting an async database session (for async routes)."""
+    async with AsyncSessionLocal() as db:
+        yield db
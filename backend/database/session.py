@@ -1,3 +1,3 @@
-from database.base import get_db
+from database.base import get_db, get_async_db
 
-__all__ = ["get_db"]
+__all__ = ["get_db", "get_async_db"]
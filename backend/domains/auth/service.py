@@ -1,10 +1,11 @@
 from datetime import datetime, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from domains.user.model import User
-from domains.user.service import UserService
+from domains.user.service import UserService, AsyncUserService
 from domains.user.schemas import UserCreate
 from domains.auth.schemas import LoginRequest, SignupRequest, OTPVerifyRequest, TokenResponse
-from core.security import verify_password, generate_otp
+from core.security import verify_password, verify_and_update_password_async, generate_otp
 from core.jwt import create_access_token, create_refresh_token, verify_refresh_token
 from core.config import settings
 from core.exceptions import (
@@ -113,3 +114,43 @@ class AuthService:
             access_token=access_token,
             refresh_token=new_refresh_token
         )
+
+
+class AsyncAuthService:
+    """Async variants of AuthService; password hashing runs in the hashing pool."""
+    
+    @staticmethod
+    async def signup(db: AsyncSession, signup_data: SignupRequest) -> User:
+        """Register a new user (OTP disabled - auto verified)."""
+        user = await AsyncUserService.create(db, UserCreate(**signup_data.dict()))
+        user = await AsyncUserService.verify_user(db, user)
+        print(f"✅ [DEV] User {user.email} auto-verified (OTP disabled)")
+        return user
+    
+    @staticmethod
+    async def login(db: AsyncSession, login_data: LoginRequest) -> TokenResponse:
+        """Authenticate user and return tokens, upgrading outdated password hashes."""
+        user = await AsyncUserService.get_by_email(db, login_data.email)
+        if not user:
+            raise InvalidCredentialsError()
+        
+        valid, new_hash = await verify_and_update_password_async(login_data.password, user.hashed_password)
+        if not valid:
+            raise InvalidCredentialsError()
+        
+        if not user.is_verified:
+            raise InvalidCredentialsError("Please verify your email first")
+        
+        if not user.is_active:
+            raise InvalidCredentialsError("Account is deactivated")
+        
+        if new_hash:
+            # Stored hash used fewer rounds than BCRYPT_ROUNDS
+            user.hashed_password = new_hash
+            await db.commit()
+        
+        token_data = {"sub": str(user.id), "email": user.email}
+        return TokenResponse(
+            access_token=create_access_token(token_data),
+            refresh_token=create_refresh_token(token_data)
+        )
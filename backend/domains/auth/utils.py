@@ -1,15 +1,18 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import Optional
-from core.jwt import verify_access_token
+from core.jwt import verify_access_token, verify_stream_token
 from core.exceptions import InvalidTokenError
 from domains.user.model import User
-from domains.user.service import UserService
-from database.session import get_db
+from domains.user.service import UserService, AsyncUserService
+from domains.user.cache import cache_user, get_cached_user
+from database.session import get_db, get_async_db
 
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
 
 
 def get_current_user(
@@ -17,12 +20,19 @@ def get_current_user(
     db: Session = Depends(get_db)
 ) -> User:
     """Get current authenticated user from JWT token."""
+    return _authenticate_token(credentials.credentials, db)
+
+
+def _authenticate_token(token: str, db: Session) -> User:
+    """Resolve an access token to an active user or raise 401/403."""
     try:
-        token = credentials.credentials
         payload = verify_access_token(token)
         user_id = int(payload.get("sub"))
         
-        user = UserService.get_by_id(db, user_id)
+        user = get_cached_user(user_id)
+        if user is None:
+            user = UserService.get_by_id(db, user_id)
+            cache_user(user)
         
         if not user.is_active:
             raise HTTPException(
@@ -56,3 +66,85 @@ def get_current_active_user(
             detail="Email not verified"
         )
     return current_user
+
+
+async def _authenticate_token_async(
+    token: str,
+    db: AsyncSession,
+    transcript_id: Optional[int] = None
+) -> User:
+    """Async variant of _authenticate_token; with transcript_id, expects a stream token for it."""
+    try:
+        if transcript_id is None:
+            payload = verify_access_token(token)
+        else:
+            payload = verify_stream_token(token, transcript_id)
+        user_id = int(payload.get("sub"))
+        
+        user = get_cached_user(user_id)
+        if user is None:
+            user = await AsyncUserService.get_by_id(db, user_id)
+            # End the read transaction so the pooled connection is not held
+            # while the route streams a request/response body
+            await db.commit()
+            cache_user(user)
+        
+        if not user.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="User account is deactivated"
+            )
+        
+        return user
+        
+    except InvalidTokenError as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=str(e),
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
+
+async def get_current_user_async(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_async_db)
+) -> User:
+    """Get current authenticated user without a threadpool hop (for async routes)."""
+    return await _authenticate_token_async(credentials.credentials, db)
+
+
+async def get_current_active_user_async(
+    current_user: User = Depends(get_current_user_async)
+) -> User:
+    """Async variant of get_current_active_user."""
+    return get_current_active_user(current_user)
+
+
+async def get_current_active_user_for_stream(
+    transcript_id: int,
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+    token: Optional[str] = Query(None, description="Stream token from POST /transcripts/{id}/stream-token"),
+    db: AsyncSession = Depends(get_async_db)
+) -> User:
+    """
+    Like get_current_active_user_async, but also accepts ?token= for clients
+    that cannot set headers (download links, EventSource, <audio src>).
+    
+    Only short-lived stream tokens scoped to the transcript in the path are
+    accepted in the query string, never the access token itself.
+    """
+    if credentials:
+        return get_current_active_user(await _authenticate_token_async(credentials.credentials, db))
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    return get_current_active_user(await _authenticate_token_async(token, db, transcript_id))
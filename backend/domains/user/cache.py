@@ -0,0 +1,153 @@
+"""
+Short-lived cache of authenticated users.
+NO FastAPI imports, NO HTTP context.
+
+Every authenticated request resolves the token subject to a user, mostly
+to check is_active / is_verified. Those rarely change, so a snapshot is
+kept for AUTH_USER_CACHE_SECONDS and requests within that window need no
+query at all. UserService invalidates the entry whenever it changes a
+user. With the "postgres" backend the invalidation is broadcast via
+LISTEN/NOTIFY so every worker process drops its copy; with "memory" other
+processes may serve the old state until the TTL expires.
+"""
+from typing import Dict, Optional, Tuple
+import logging
+import select
+import threading
+import time
+
+from core.config import settings
+from domains.user.model import User
+
+logger = logging.getLogger(__name__)
+
+# Columns kept in the snapshot; credentials and OTP state are never cached
+CACHED_COLUMNS = ("id", "email", "full_name", "is_active", "is_verified", "created_at", "updated_at")
+
+# Bound on cached users per process
+USER_CACHE_MAX_ENTRIES = 10_000
+
+_user_cache: Dict[int, Tuple[float, dict]] = {}
+_user_cache_lock = threading.Lock()
+
+
+def get_cached_user(user_id: int) -> Optional[User]:
+    """
+    Return a detached copy of a cached user, or None on miss/expiry.
+
+    The copy is a fresh transient instance, so callers cannot share or
+    accidentally persist each other's state.
+    """
+    with _user_cache_lock:
+        entry = _user_cache.get(user_id)
+    if entry is None or entry[0] <= time.monotonic():
+        return None
+    return User(**entry[1])
+
+
+def cache_user(user: User) -> None:
+    """Store a snapshot of a freshly loaded user."""
+    if settings.AUTH_USER_CACHE_SECONDS <= 0:
+        return
+    if _relay is not None:
+        _relay.ensure_listening()
+
+    snapshot = {column: getattr(user, column) for column in CACHED_COLUMNS}
+    now = time.monotonic()
+    with _user_cache_lock:
+        if len(_user_cache) >= USER_CACHE_MAX_ENTRIES and user.id not in _user_cache:
+            for user_id in [uid for uid, (expires, _) in _user_cache.items() if expires <= now]:
+                del _user_cache[user_id]
+            if len(_user_cache) >= USER_CACHE_MAX_ENTRIES:
+                # Still full: drop the oldest insertion
+                del _user_cache[next(iter(_user_cache))]
+        _user_cache[user.id] = (now + settings.AUTH_USER_CACHE_SECONDS, snapshot)
+
+
+def _evict_local(user_id: int) -> None:
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
+
+
+def invalidate_user(user_id: int) -> None:
+    """Drop a user's cached state (call after committing a change to the user)."""
+    _evict_local(user_id)
+    if _relay is not None:
+        _relay.publish(user_id)
+
+
+def clear_user_cache() -> None:
+    """Drop every cached user in this process."""
+    with _user_cache_lock:
+        _user_cache.clear()
+
+
+class PostgresInvalidationRelay:
+    """
+    Broadcasts user invalidations to all processes via Postgres LISTEN/NOTIFY.
+
+    publish() sends NOTIFY on a dedicated connection; a daemon thread
+    LISTENs and evicts the notified user IDs from the local cache.
+    """
+
+    CHANNEL = "user_cache_invalidations"
+
+    def __init__(self, dsn: str):
+        self.dsn = dsn
+        self._publish_lock = threading.Lock()
+        self._publish_conn = None
+        self._listener: Optional[threading.Thread] = None
+
+    def _connect(self):
+        import psycopg2
+        import psycopg2.extensions
+
+        conn = psycopg2.connect(self.dsn)
+        conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+        return conn
+
+    def publish(self, user_id: int) -> None:
+        with self._publish_lock:
+            try:
+                if self._publish_conn is None or self._publish_conn.closed:
+                    self._publish_conn = self._connect()
+                with self._publish_conn.cursor() as cur:
+                    cur.execute("SELECT pg_notify(%s, %s)", (self.CHANNEL, str(user_id)))
+            except Exception as e:
+                logger.warning(f"Failed to NOTIFY user invalidation, other workers rely on the TTL: {e}")
+                self._publish_conn = None
+
+    def ensure_listening(self) -> None:
+        """Start the LISTEN thread once per process."""
+        if self._listener is not None and self._listener.is_alive():
+            return
+        self._listener = threading.Thread(target=self._listen_forever, daemon=True)
+        self._listener.start()
+
+    def _listen_forever(self) -> None:
+        while True:
+            try:
+                conn = self._connect()
+                with conn.cursor() as cur:
+                    cur.execute(f"LISTEN {self.CHANNEL}")
+                # Invalidations may have been missed while disconnected
+                clear_user_cache()
+                while True:
+                    if select.select([conn], [], [], 5.0) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        notify = conn.notifies.pop(0)
+                        try:
+                            _evict_local(int(notify.payload))
+                        except ValueError:
+                            logger.warning(f"Ignoring malformed user invalidation: {notify.payload!r}")
+            except Exception as e:
+                logger.error(f"User cache invalidation listener failed, reconnecting: {e}")
+                clear_user_cache()
+                time.sleep(2)
+
+
+_relay: Optional[PostgresInvalidationRelay] = None
+if settings.AUTH_USER_CACHE_BACKEND == "postgres":
+    _relay = PostgresInvalidationRelay(settings.DATABASE_URL.replace("postgresql+psycopg2://", "postgresql://"))
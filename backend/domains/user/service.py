@@ -1,9 +1,12 @@
 from datetime import datetime
 from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from domains.user.model import User
+from domains.user.cache import invalidate_user
 from domains.user.schemas import UserCreate, UserUpdate
-from core.security import hash_password
+from core.security import hash_password, hash_password_async
 from core.exceptions import UserNotFoundError, UserAlreadyExistsError
 
 
@@ -55,6 +58,7 @@ class UserService:
             user.hashed_password = hash_password(user_data.password)
         
         db.commit()
+        invalidate_user(user.id)
         db.refresh(user)
         return user
     
@@ -74,5 +78,101 @@ class UserService:
         user.otp_code = None
         user.otp_expires_at = None
         db.commit()
+        invalidate_user(user.id)
         db.refresh(user)
         return user
+    
+    @staticmethod
+    def set_active(db: Session, user: User, is_active: bool) -> User:
+        """Activate or deactivate a user account (takes effect on the next request)."""
+        user.is_active = is_active
+        db.commit()
+        invalidate_user(user.id)
+        db.refresh(user)
+        return user
+
+
+class AsyncUserService:
+    """Async variants of UserService for `async def` routes and dependencies."""
+    
+    @staticmethod
+    async def get_by_id(db: AsyncSession, user_id: int) -> User:
+        """Get user by ID."""
+        user = await db.get(User, user_id)
+        if not user:
+            raise UserNotFoundError()
+        return user
+    
+    @staticmethod
+    async def get_by_email(db: AsyncSession, email: str) -> Optional[User]:
+        """Get user by email."""
+        result = await db.execute(select(User).where(User.email == email))
+        return result.scalars().first()
+    
+    @staticmethod
+    async def create(db: AsyncSession, user_data: UserCreate) -> User:
+        """Create a new user."""
+        existing_user = await AsyncUserService.get_by_email(db, user_data.email)
+        if existing_user:
+            raise UserAlreadyExistsError()
+        
+        # bcrypt is CPU-bound; runs in the password hashing pool
+        hashed_password = await hash_password_async(user_data.password)
+        
+        user = User(
+            email=user_data.email,
+            full_name=user_data.full_name,
+            hashed_password=hashed_password,
+            is_active=True,
+            is_verified=False
+        )
+        
+        db.add(user)
+        await db.commit()
+        await db.refresh(user)
+        return user
+    
+    @staticmethod
+    async def update(db: AsyncSession, user_id: int, user_data: UserUpdate) -> User:
+        """Update user information."""
+        user = await AsyncUserService.get_by_id(db, user_id)
+        
+        if user_data.full_name is not None:
+            user.full_name = user_data.full_name
+        
+        if user_data.password is not None:
+            user.hashed_password = await hash_password_async(user_data.password)
+        
+        await db.commit()
+        invalidate_user(user.id)
+        await db.refresh(user)
+        return user
+    
+    @staticmethod
+    async def set_otp(db: AsyncSession, user: User, otp_code: str, expires_at: datetime) -> User:
+        """Set OTP for user verification."""
+        user.otp_code = otp_code
+        user.otp_expires_at = expires_at
+        await db.commit()
+        await db.refresh(user)
+        return user
+    
+    @staticmethod
+    async def verify_user(db: AsyncSession, user: User) -> User:
+        """Mark user as verified."""
+        user.is_verified = True
+        user.otp_code = None
+        user.otp_expires_at = None
+        await db.commit()
+        invalidate_user(user.id)
+        await db.refresh(user)
+        return user
+    
+    @staticmethod
+    async def set_active(db: AsyncSession, user: User, is_active: bool) -> User:
+        """Activate or deactivate a user account (takes effect on the next request)."""
+        user.is_active = is_active
+        await db.commit()
+        invalidate_user(user.id)
+        await db.refresh(user)
+        return user
@@ -0,0 +1,80 @@
+"""
+Serialized response cache for finished transcripts.
+NO FastAPI imports, NO HTTP context.
+
+A DONE transcript never changes, so its JSON body can be built (and
+compressed) once and reused. Entries are keyed by (transcript_id,
+updated_at, content encoding): any write bumps updated_at, which makes
+the old entry unreachable instead of stale, and LRU eviction removes it
+eventually.
+"""
+from collections import OrderedDict
+from datetime import datetime
+from typing import Hashable, Optional, Tuple
+import threading
+
+from core.config import settings
+
+CacheKey = Tuple[int, datetime, str]
+
+
+class ByteLRUCache:
+    """Thread-safe LRU cache of byte strings bounded by total size."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """Return the cached value and mark it most recently used."""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: bytes) -> None:
+        """
+        Store a value, evicting least recently used entries to fit.
+        Values larger than a quarter of the budget are not cached so a
+        single huge transcript cannot flush everything else.
+        """
+        if len(value) > self.max_bytes // 4:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self._entries[key] = value
+            self.size += len(value)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= len(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+# Process-wide cache of GET /transcripts/{id} bodies for DONE transcripts
+transcript_response_cache = ByteLRUCache(settings.TRANSCRIPT_RESPONSE_CACHE_BYTES)
+
+
+def transcript_cache_key(
+    transcript_id: int,
+    updated_at: datetime,
+    encoding: Optional[str] = None
+) -> CacheKey:
+    """Cache key that changes whenever the transcript row is updated."""
+    return (transcript_id, updated_at, encoding or "identity")
@@ -0,0 +1,198 @@
+"""
+Transcript event bus - pushes status transitions and progress to listeners.
+NO FastAPI imports, NO HTTP context.
+
+Workers publish from any thread; SSE handlers subscribe from the event
+loop. With the default "memory" backend events stay in-process. The
+"postgres" backend relays them through LISTEN/NOTIFY so API processes
+receive events published by workers in other processes.
+"""
+from typing import Any, Dict, Optional, Set, Tuple
+import asyncio
+import json
+import logging
+import select
+import threading
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Per-subscriber queue bound; the oldest event is dropped for slow consumers
+SUBSCRIBER_QUEUE_SIZE = 100
+
+# Postgres NOTIFY payloads must stay below 8000 bytes
+NOTIFY_PAYLOAD_LIMIT = 7900
+
+TERMINAL_STATUSES = {"DONE", "FAILED"}
+
+
+def _offer(queue: asyncio.Queue, event: Dict[str, Any]) -> None:
+    """Put without blocking, dropping the oldest event when full."""
+    if queue.full():
+        try:
+            queue.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+    queue.put_nowait(event)
+
+
+class TranscriptEventBus:
+    """Thread-safe in-process pub/sub keyed by transcript ID."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: Dict[int, Set[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = {}
+
+    def subscribe(self, transcript_id: int) -> asyncio.Queue:
+        """
+        Register a listener; must be called from a running event loop.
+
+        Returns:
+            Queue receiving event dicts for this transcript
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers.setdefault(transcript_id, set()).add((loop, queue))
+        return queue
+
+    def unsubscribe(self, transcript_id: int, queue: asyncio.Queue) -> None:
+        """Remove a listener registered with subscribe()."""
+        with self._lock:
+            subscribers = self._subscribers.get(transcript_id)
+            if not subscribers:
+                return
+            subscribers.difference_update({item for item in subscribers if item[1] is queue})
+            if not subscribers:
+                del self._subscribers[transcript_id]
+
+    def subscriber_count(self, transcript_id: int) -> int:
+        """Number of active listeners for a transcript."""
+        with self._lock:
+            return len(self._subscribers.get(transcript_id, ()))
+
+    def publish(self, transcript_id: int, event: Dict[str, Any]) -> None:
+        """Deliver an event to local listeners; safe to call from any thread."""
+        with self._lock:
+            subscribers = list(self._subscribers.get(transcript_id, ()))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(_offer, queue, event)
+            except RuntimeError:
+                # Listener's loop already closed; it will unsubscribe itself
+                pass
+
+
+class PostgresNotifyRelay:
+    """
+    Relays transcript events between processes via Postgres LISTEN/NOTIFY.
+
+    publish() sends NOTIFY on a dedicated connection; a daemon thread
+    LISTENs and forwards every notification to the local bus.
+    """
+
+    CHANNEL = "transcript_events"
+
+    def __init__(self, dsn: str, bus: TranscriptEventBus):
+        self.dsn = dsn
+        self.bus = bus
+        self._publish_lock = threading.Lock()
+        self._publish_conn = None
+        self._listener: Optional[threading.Thread] = None
+
+    def _connect(self):
+        import psycopg2
+        import psycopg2.extensions
+
+        conn = psycopg2.connect(self.dsn)
+        conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+        return conn
+
+    def publish(self, transcript_id: int, event: Dict[str, Any]) -> None:
+        payload = json.dumps({"transcript_id": transcript_id, "event": event}, default=str)
+        if len(payload) > NOTIFY_PAYLOAD_LIMIT:
+            # Too large for NOTIFY: send without bulky fields, listeners refetch
+            slim = {k: v for k, v in event.items() if k != "segments"}
+            slim["truncated"] = True
+            payload = json.dumps({"transcript_id": transcript_id, "event": slim}, default=str)
+
+        with self._publish_lock:
+            try:
+                if self._publish_conn is None or self._publish_conn.closed:
+                    self._publish_conn = self._connect()
+                with self._publish_conn.cursor() as cur:
+                    cur.execute("SELECT pg_notify(%s, %s)", (self.CHANNEL, payload))
+            except Exception as e:
+                logger.warning(f"Failed to NOTIFY transcript event, delivering locally only: {e}")
+                self._publish_conn = None
+                self.bus.publish(transcript_id, event)
+
+    def ensure_listening(self) -> None:
+        """Start the LISTEN thread once per process."""
+        if self._listener is not None and self._listener.is_alive():
+            return
+        self._listener = threading.Thread(target=self._listen_forever, daemon=True)
+        self._listener.start()
+
+    def _listen_forever(self) -> None:
+        import time
+
+        while True:
+            try:
+                conn = self._connect()
+                with conn.cursor() as cur:
+                    cur.execute(f"LISTEN {self.CHANNEL}")
+                logger.info(f"Listening for transcript events on '{self.CHANNEL}'")
+                while True:
+                    if select.select([conn], [], [], 5.0) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        notify = conn.notifies.pop(0)
+                        try:
+                            message = json.loads(notify.payload)
+                            self.bus.publish(int(message["transcript_id"]), message["event"])
+                        except (ValueError, KeyError) as e:
+                            logger.warning(f"Ignoring malformed transcript event: {e}")
+            except Exception as e:
+                logger.error(f"Transcript event listener failed, reconnecting: {e}")
+                time.sleep(2)
+
+
+# Process-wide bus used by the API and workers
+event_bus = TranscriptEventBus()
+
+_relay: Optional[PostgresNotifyRelay] = None
+if settings.TRANSCRIPT_EVENTS_BACKEND == "postgres":
+    _relay = PostgresNotifyRelay(settings.DATABASE_URL.replace("postgresql+psycopg2://", "postgresql://"), event_bus)
+
+
+def publish_transcript_event(transcript_id: int, event_type: str, **data: Any) -> None:
+    """
+    Publish an event for a transcript.
+
+    Args:
+        transcript_id: ID of the transcript
+        event_type: "status" for lifecycle transitions, "progress" for worker
+            stages/percentages, "segments" for batches of saved segments
+        **data: Event payload (e.g. status, error_message, stage, progress,
+            offset and segments)
+    """
+    event = {"type": event_type, "transcript_id": transcript_id, **data}
+    if _relay is not None:
+        _relay.publish(transcript_id, event)
+    elif event_bus.subscriber_count(transcript_id):
+        event_bus.publish(transcript_id, event)
+
+
+def subscribe_transcript_events(transcript_id: int) -> asyncio.Queue:
+    """Subscribe the current event loop to a transcript's events."""
+    if _relay is not None:
+        _relay.ensure_listening()
+    return event_bus.subscribe(transcript_id)
+
+
+def unsubscribe_transcript_events(transcript_id: int, queue: asyncio.Queue) -> None:
+    """Remove a subscription created by subscribe_transcript_events()."""
+    event_bus.unsubscribe(transcript_id, queue)
@@ -0,0 +1,250 @@
+"""
+Transcript export renderers (SRT, WebVTT, plain text, DOCX).
+NO FastAPI imports, NO HTTP context.
+
+Renderers consume segment rows as an async iterator (see
+AsyncTranscriptService.stream_segments) and yield encoded chunks, so
+memory stays constant however long the meeting is. DOCX is written as a
+minimal WordprocessingML package through zipfile on an unseekable sink,
+which lets the archive be emitted while it is being built.
+"""
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import AsyncIterable, AsyncIterator, List, Optional
+from xml.sax.saxutils import escape
+import enum
+import io
+import os
+import re
+import uuid
+import zipfile
+
+import aiofiles
+import aiofiles.os
+
+from core.config import settings
+
+# Rendered artifacts of DONE transcripts, reused for repeat downloads
+EXPORT_DIR = Path(settings.TRANSCRIPTS_DIR) / "exports"
+
+# Segments rendered per yielded chunk
+EXPORT_BATCH_SIZE = 200
+
+
+class ExportFormat(str, enum.Enum):
+    """Supported export formats."""
+    SRT = "srt"
+    VTT = "vtt"
+    TXT = "txt"
+    DOCX = "docx"
+
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.SRT: "application/x-subrip; charset=utf-8",
+    ExportFormat.VTT: "text/vtt; charset=utf-8",
+    ExportFormat.TXT: "text/plain; charset=utf-8",
+    ExportFormat.DOCX: "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+# Characters XML 1.0 does not allow, even escaped
+_INVALID_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+_DOCX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+
+_DOCX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+_DOCX_DOCUMENT_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+)
+
+_DOCX_DOCUMENT_END = '</w:body></w:document>'
+
+
+def format_timestamp(seconds: float, separator: str = ",") -> str:
+    """HH:MM:SS,mmm (SRT) or HH:MM:SS.mmm (WebVTT)."""
+    millis = max(0, int(round(seconds * 1000)))
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}{separator}{millis:03d}"
+
+
+def _clock(seconds: float) -> str:
+    """HH:MM:SS for plain text and DOCX."""
+    return format_timestamp(seconds)[:8]
+
+
+def _text(row) -> str:
+    return (row.text or "").strip()
+
+
+def srt_cue(index: int, row) -> str:
+    speaker = f"{row.speaker}: " if row.speaker else ""
+    return (
+        f"{index}\n"
+        f"{format_timestamp(row.start)} --> {format_timestamp(row.end)}\n"
+        f"{speaker}{_text(row)}\n\n"
+    )
+
+
+def vtt_cue(row) -> str:
+    # Cue text cannot contain "-->" and must escape markup characters
+    body = escape(_text(row).replace("-->", "->"))
+    if row.speaker:
+        body = f"<v {escape(row.speaker)}>{body}"
+    return f"{format_timestamp(row.start, '.')} --> {format_timestamp(row.end, '.')}\n{body}\n\n"
+
+
+def txt_line(row) -> str:
+    speaker = f" {row.speaker}:" if row.speaker else ""
+    return f"[{_clock(row.start)}]{speaker} {_text(row)}\n"
+
+
+def docx_paragraph(row) -> str:
+    label = f"[{_clock(row.start)}]" + (f" {row.speaker}:" if row.speaker else "")
+    text = _INVALID_XML_CHARS.sub("", _text(row))
+    return (
+        '<w:p>'
+        f'<w:r><w:rPr><w:b/></w:rPr><w:t xml:space="preserve">{escape(label)} </w:t></w:r>'
+        f'<w:r><w:t xml:space="preserve">{escape(text)}</w:t></w:r>'
+        '</w:p>'
+    )
+
+
+def _docx_title(title: str) -> str:
+    text = escape(_INVALID_XML_CHARS.sub("", title))
+    return f'<w:p><w:r><w:rPr><w:b/><w:sz w:val="32"/></w:rPr><w:t>{text}</w:t></w:r></w:p>'
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only, unseekable buffer drained after each batch."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def _render_text(rows: AsyncIterable, export_format: ExportFormat) -> AsyncIterator[bytes]:
+    batch: List[str] = ["WEBVTT\n\n"] if export_format == ExportFormat.VTT else []
+    index = 0
+    async for row in rows:
+        index += 1
+        if export_format == ExportFormat.SRT:
+            batch.append(srt_cue(index, row))
+        elif export_format == ExportFormat.VTT:
+            batch.append(vtt_cue(row))
+        else:
+            batch.append(txt_line(row))
+        if len(batch) >= EXPORT_BATCH_SIZE:
+            yield "".join(batch).encode("utf-8")
+            batch = []
+    if batch:
+        yield "".join(batch).encode("utf-8")
+
+
+async def _render_docx(rows: AsyncIterable, title: Optional[str]) -> AsyncIterator[bytes]:
+    sink = _ChunkSink()
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", _DOCX_CONTENT_TYPES)
+        archive.writestr("_rels/.rels", _DOCX_RELS)
+        with archive.open("word/document.xml", "w") as document:
+            document.write(_DOCX_DOCUMENT_START.encode("utf-8"))
+            if title:
+                document.write(_docx_title(title).encode("utf-8"))
+            pending = 0
+            async for row in rows:
+                document.write(docx_paragraph(row).encode("utf-8"))
+                pending += 1
+                if pending >= EXPORT_BATCH_SIZE:
+                    pending = 0
+                    chunk = sink.drain()
+                    if chunk:
+                        yield chunk
+            document.write(_DOCX_DOCUMENT_END.encode("utf-8"))
+    yield sink.drain()
+
+
+def render_export(
+    rows: AsyncIterable,
+    export_format: ExportFormat,
+    title: Optional[str] = None
+) -> AsyncIterator[bytes]:
+    """
+    Render segment rows into an export format, chunk by chunk.
+
+    Args:
+        rows: Async iterator of rows with start, end, speaker, text
+        export_format: Target format
+        title: Optional heading (DOCX only)
+
+    Returns:
+        Async iterator of encoded chunks
+    """
+    if export_format == ExportFormat.DOCX:
+        return _render_docx(rows, title)
+    return _render_text(rows, export_format)
+
+
+def export_artifact_path(transcript_id: int, updated_at: datetime, export_format: ExportFormat) -> Path:
+    """Cache location of a rendered export; changes whenever the transcript is updated."""
+    version = int(updated_at.replace(tzinfo=timezone.utc).timestamp() * 1_000_000)
+    return EXPORT_DIR / f"{transcript_id}-{version}.{export_format.value}"
+
+
+async def cache_while_streaming(chunks: AsyncIterable[bytes], artifact: Path) -> AsyncIterator[bytes]:
+    """
+    Pass chunks through while writing them to `artifact`.
+
+    The file is written under a temporary name and only moved into place
+    once the export completed, so an interrupted download never leaves a
+    truncated artifact behind. Older versions of the same export are removed.
+    """
+    artifact.parent.mkdir(parents=True, exist_ok=True)
+    partial = artifact.with_name(f".{artifact.name}.{uuid.uuid4().hex}.part")
+    completed = False
+    try:
+        async with aiofiles.open(partial, "wb") as f:
+            async for chunk in chunks:
+                await f.write(chunk)
+                yield chunk
+        completed = True
+    finally:
+        if completed:
+            os.replace(partial, artifact)
+            transcript_id = artifact.name.split("-", 1)[0]
+            for stale in artifact.parent.glob(f"{transcript_id}-*{artifact.suffix}"):
+                if stale != artifact:
+                    stale.unlink(missing_ok=True)
+        else:
+            try:
+                await aiofiles.os.remove(partial)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,348 @@
+"""
+Streaming ingest for transcript audio uploads.
+Validates, hashes and writes upload bytes to disk in a single pass,
+so large files never block the event loop or get spooled twice.
+"""
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AsyncIterable, Dict, List, Optional, Union
+import hashlib
+import logging
+import uuid
+
+import aiofiles
+import aiofiles.os
+from fastapi import HTTPException
+
+from domains.zoom_resume.transcript.validation import FileValidator
+
+try:
+    from python_multipart.multipart import MultipartParser, parse_options_header
+    from python_multipart.exceptions import FormParserError
+except ModuleNotFoundError:  # older python-multipart releases
+    from multipart.multipart import MultipartParser, parse_options_header
+    from multipart.exceptions import FormParserError
+
+logger = logging.getLogger(__name__)
+
+# Upper bound for plain (non-file) multipart fields
+MAX_FORM_FIELD_SIZE = 64 * 1024
+
+
+@dataclass
+class StoredUpload:
+    """An upload that has been fully validated and written to disk."""
+    path: Path
+    filename: str
+    size: int
+    sha256: str
+    container: str
+    fields: Dict[str, str] = field(default_factory=dict)
+
+
+class StreamingUploadWriter:
+    """
+    Incrementally validates, hashes and writes a single uploaded file.
+
+    MAX_FILE_SIZE is enforced as bytes arrive and the container magic bytes
+    are checked from the first chunk, so invalid uploads are rejected before
+    the rest of the body is read.
+    """
+
+    def __init__(self, filename: str, dest_dir: Union[str, Path], prefix: str = ""):
+        self.ext = FileValidator.validate_filename(filename)
+        self.filename = filename
+        self.path = Path(dest_dir) / f"{prefix}{uuid.uuid4().hex}{self.ext}"
+        self.size = 0
+        self.container: Optional[str] = None
+        self._hash = hashlib.sha256()
+        self._head = b""
+        self._file = None
+
+    async def write(self, chunk: bytes) -> None:
+        """Validate and append one chunk of file data."""
+        if not chunk:
+            return
+
+        self.size += len(chunk)
+        FileValidator.validate_size(self.size)
+
+        if self.container is None:
+            # Hold back data until there is enough to sniff the container
+            self._head += chunk
+            if len(self._head) < FileValidator.SNIFF_BYTES:
+                return
+            self.container = FileValidator.validate_container(self.ext, self._head)
+            chunk, self._head = self._head, b""
+
+        await self._append(chunk)
+
+    async def finalize(self) -> StoredUpload:
+        """
+        Flush and close the file once all data has been written.
+
+        Raises:
+            HTTPException: 400 if the file is empty or too short to identify
+        """
+        if self.size == 0:
+            raise HTTPException(
+                status_code=400,
+                detail="File is empty"
+            )
+
+        if self.container is None:
+            self.container = FileValidator.validate_container(self.ext, self._head)
+            await self._append(self._head)
+            self._head = b""
+
+        await self._file.close()
+        self._file = None
+
+        return StoredUpload(
+            path=self.path,
+            filename=self.filename,
+            size=self.size,
+            sha256=self._hash.hexdigest(),
+            container=self.container
+        )
+
+    async def abort(self) -> None:
+        """Close and remove any partially written file."""
+        if self._file is not None:
+            await self._file.close()
+            self._file = None
+        try:
+            await aiofiles.os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    async def _append(self, data: bytes) -> None:
+        self._hash.update(data)
+        if self._file is None:
+            self._file = await aiofiles.open(self.path, "wb")
+        await self._file.write(data)
+
+
+class _MultipartUploadParser:
+    """
+    Feeds a multipart/form-data body through python-multipart and routes the
+    target file part into a StreamingUploadWriter.
+
+    Parser callbacks are synchronous, so file data is queued and written
+    with await after each chunk is parsed (same approach as Starlette).
+    """
+
+    def __init__(self, boundary: bytes, dest_dir: Union[str, Path], field_name: str, prefix: str):
+        self.dest_dir = dest_dir
+        self.field_name = field_name
+        self.prefix = prefix
+        self.writer: Optional[StreamingUploadWriter] = None
+        self.upload: Optional[StoredUpload] = None
+        self.fields: Dict[str, str] = {}
+
+        self._pending: List[Optional[bytes]] = []
+        self._part_kind: Optional[str] = None
+        self._part_name = ""
+        self._part_data = bytearray()
+        self._headers: Dict[bytes, bytes] = {}
+        self._header_name = b""
+        self._header_value = b""
+
+        self.parser = MultipartParser(boundary, {
+            "on_part_begin": self._on_part_begin,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+        })
+
+    def _on_part_begin(self) -> None:
+        self._headers = {}
+        self._part_kind = None
+        self._part_data = bytearray()
+
+    def _on_header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header_name += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int) -> None:
+        self._header_value += data[start:end]
+
+    def _on_header_end(self) -> None:
+        self._headers[self._header_name.lower()] = self._header_value
+        self._header_name = b""
+        self._header_value = b""
+
+    def _on_headers_finished(self) -> None:
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        self._part_name = options.get(b"name", b"").decode("utf-8", "replace")
+        filename = options.get(b"filename")
+
+        if filename is None:
+            self._part_kind = "field"
+        elif self._part_name == self.field_name and self.writer is None:
+            # Extension is checked here, before any file data is read
+            self.writer = StreamingUploadWriter(
+                filename.decode("utf-8", "replace"),
+                self.dest_dir,
+                prefix=self.prefix
+            )
+            self._part_kind = "file"
+        else:
+            self._part_kind = "skip"
+
+    def _on_part_data(self, data: bytes, start: int, end: int) -> None:
+        if self._part_kind == "file":
+            self._pending.append(data[start:end])
+        elif self._part_kind == "field":
+            if len(self._part_data) + (end - start) > MAX_FORM_FIELD_SIZE:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Form field '{self._part_name}' is too large"
+                )
+            self._part_data.extend(data[start:end])
+
+    def _on_part_end(self) -> None:
+        if self._part_kind == "file":
+            self._pending.append(None)  # end-of-file marker
+        elif self._part_kind == "field":
+            self.fields[self._part_name] = self._part_data.decode("utf-8", "replace")
+
+    async def _flush(self) -> None:
+        for item in self._pending:
+            if item is None:
+                self.upload = await self.writer.finalize()
+            else:
+                await self.writer.write(item)
+        self._pending.clear()
+
+    async def parse(self, stream: AsyncIterable[bytes]) -> StoredUpload:
+        try:
+            async for chunk in stream:
+                self.parser.write(chunk)
+                await self._flush()
+            self.parser.finalize()
+            await self._flush()
+        except FormParserError as e:
+            await self._abort()
+            raise HTTPException(
+                status_code=400,
+                detail=f"Malformed multipart body: {e}"
+            )
+        except BaseException:
+            await self._abort()
+            raise
+
+        if self.upload is None:
+            await self._abort()
+            raise HTTPException(
+                status_code=400,
+                detail=f"No file uploaded in field '{self.field_name}'"
+            )
+
+        self.upload.fields = self.fields
+        return self.upload
+
+    async def _abort(self) -> None:
+        if self.writer is not None and self.upload is None:
+            await self.writer.abort()
+
+
+async def stream_upload(
+    content_type: Optional[str],
+    stream: AsyncIterable[bytes],
+    dest_dir: Union[str, Path],
+    field_name: str = "file",
+    prefix: str = ""
+) -> StoredUpload:
+    """
+    Stream a multipart/form-data request body straight to disk.
+
+    The body is read chunk by chunk; the file part named `field_name` is
+    validated (extension, size, magic bytes), hashed and written with
+    aiofiles in the same pass. Other simple form fields are returned in
+    StoredUpload.fields.
+
+    Args:
+        content_type: Request Content-Type header (must carry a boundary)
+        stream: Async iterator over raw body chunks (e.g. Request.stream())
+        dest_dir: Directory to write the file into
+        field_name: Name of the multipart file field
+        prefix: Optional prefix for the generated filename
+
+    Returns:
+        StoredUpload describing the written file
+
+    Raises:
+        HTTPException: 400 for invalid body/file, 413 if MAX_FILE_SIZE is exceeded
+    """
+    mime, params = parse_options_header(content_type or "")
+    boundary = params.get(b"boundary")
+    if mime != b"multipart/form-data" or not boundary:
+        raise HTTPException(
+            status_code=400,
+            detail="Expected a multipart/form-data request with a boundary"
+        )
+
+    upload = await _MultipartUploadParser(boundary, dest_dir, field_name, prefix).parse(stream)
+    logger.info(
+        f"Stored upload {upload.filename} -> {upload.path} "
+        f"({upload.size} bytes, {upload.container}, sha256={upload.sha256})"
+    )
+    return upload
+
+
+class ResumableChunkWriter:
+    """
+    Writes one chunk request of a resumable upload into its partial file.
+
+    Data is written at the session's current offset and `offset` advances
+    as bytes hit the disk, so a dropped connection still leaves a usable
+    offset to resume from. The container magic bytes are checked on the
+    first chunk of the file.
+    """
+
+    def __init__(self, path: Union[str, Path], offset: int, length: int, ext: str):
+        self.path = Path(path)
+        self.offset = offset
+        self.length = length
+        self.ext = ext
+        self._head = b""
+
+    async def write_stream(self, stream: AsyncIterable[bytes]) -> int:
+        """
+        Append a request body at the current offset.
+
+        Args:
+            stream: Async iterator over raw body chunks
+
+        Returns:
+            New offset after all data was written
+
+        Raises:
+            HTTPException: 413 past the declared length, 400 for bad magic bytes
+        """
+        async with aiofiles.open(self.path, "r+b") as f:
+            await f.seek(self.offset)
+            async for chunk in stream:
+                if not chunk:
+                    continue
+                FileValidator.validate_size(self.offset + len(self._head) + len(chunk), self.length)
+
+                if self.offset == 0 and len(self._head) + len(chunk) < FileValidator.SNIFF_BYTES:
+                    self._head += chunk
+                    continue
+                if self.offset == 0:
+                    chunk, self._head = self._head + chunk, b""
+                    FileValidator.validate_container(self.ext, chunk)
+
+                await f.write(chunk)
+                self.offset += len(chunk)
+
+            if self._head:
+                # Chunk shorter than the sniff window; checked again on completion
+                await f.write(self._head)
+                self.offset += len(self._head)
+                self._head = b""
+        return self.offset
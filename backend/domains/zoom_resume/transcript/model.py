@@ -2,7 +2,7 @@
 Transcript database model for meeting transcriptions.
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, JSON, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import Column, Integer, BigInteger, Float, String, Text, JSON, DateTime, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 import enum
 
@@ -40,6 +40,7 @@ class Transcript(Base):
     language = Column(String(10), nullable=True)
     full_text = Column(Text, nullable=True)
     segments_json = Column("segments_json", JSON, nullable=True)
+    segments_count = Column(Integer, nullable=True)  # Denormalized for list pages
     
     @property
     def segments(self):
@@ -49,12 +50,77 @@ class Transcript(Base):
     # Error tracking
     error_message = Column(Text, nullable=True)
     
+    # Audio retention: file is purged after this time (None = kept or already gone)
+    audio_expires_at = Column(DateTime, nullable=True, index=True)
+    
     # Timestamps
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
     
     # Relationships
     user = relationship("User", back_populates="transcripts")
+    segment_rows = relationship(
+        "TranscriptSegmentRecord",
+        back_populates="transcript",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise"
+    )
+    
+    __table_args__ = (
+        # Keyset pagination for GET /transcripts (newest first per user)
+        Index("idx_transcripts_user_created_id", "user_id", "created_at", "id"),
+    )
     
     def __repr__(self):
         return f"<Transcript(id={self.id}, user_id={self.user_id}, status={self.status})>"
+
+
+class TranscriptSegmentRecord(Base):
+    """One transcript segment, stored per row for time-range queries."""
+    
+    __tablename__ = "transcript_segments"
+    
+    id = Column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True)
+    transcript_id = Column(Integer, ForeignKey("transcripts.id", ondelete="CASCADE"), nullable=False)
+    
+    # Segment number within the transcript (TranscriptSegment.id)
+    seq = Column(Integer, nullable=False)
+    start = Column("start_time", Float, nullable=False)
+    end = Column("end_time", Float, nullable=False)
+    speaker = Column(String(50), nullable=True)
+    text = Column(Text, nullable=False)
+    
+    # Relationships
+    transcript = relationship("Transcript", back_populates="segment_rows")
+    
+    __table_args__ = (
+        # Time-range slices: WHERE transcript_id = ? AND start_time < ? ORDER BY start_time
+        Index("idx_transcript_segments_transcript_start", "transcript_id", "start_time"),
+    )
+    
+    def __repr__(self):
+        return f"<TranscriptSegmentRecord(transcript_id={self.transcript_id}, seq={self.seq}, start={self.start})>"
+
+
+class UploadSession(Base):
+    """Resumable (chunked) audio upload in progress."""
+    
+    __tablename__ = "upload_sessions"
+    
+    id = Column(String(32), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    
+    # Declared file and partial data on disk
+    filename = Column(String(255), nullable=False)
+    file_path = Column(String(500), nullable=False)
+    upload_length = Column(BigInteger, nullable=False)
+    upload_offset = Column(BigInteger, nullable=False, default=0)
+    
+    # Timestamps
+    expires_at = Column(DateTime, nullable=False, index=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    
+    def __repr__(self):
+        return f"<UploadSession(id={self.id}, offset={self.upload_offset}/{self.upload_length})>"
@@ -47,9 +47,66 @@ class TranscriptStatusResponse(BaseModel):
         from_attributes = True
 
 
+class TranscriptSummary(BaseModel):
+    """List item schema; omits full_text and segments."""
+    id: int
+    user_id: int
+    audio_url: str
+    status: str
+    language: Optional[str] = None
+    segments_count: Optional[int] = None
+    error_message: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+
 class TranscriptListResponse(BaseModel):
-    """Response schema for paginated transcript list."""
-    total: int
-    items: List[TranscriptResponse]
-    skip: int
+    """Response schema for a keyset-paginated transcript list."""
+    items: List[TranscriptSummary]
     limit: int
+    next_cursor: Optional[str] = Field(None, description="Pass as ?cursor= to fetch the next page; null on the last page")
+    total: Optional[int] = Field(None, description="Only set when include_total=true (cached briefly)")
+
+
+class TranscriptSearchHit(BaseModel):
+    """A matching segment, with its position in the meeting."""
+    transcript_id: int
+    segment_id: int
+    start: float
+    end: float
+    speaker: Optional[str] = None
+    text: str
+    score: float
+
+
+class TranscriptSearchResponse(BaseModel):
+    """Response schema for transcript search, best match first."""
+    query: str
+    items: List[TranscriptSearchHit]
+
+
+class UploadSessionCreate(BaseModel):
+    """Request schema for starting a resumable upload."""
+    filename: str = Field(..., description="Original filename (extension is validated)")
+    size: int = Field(..., gt=0, description="Total file size in bytes")
+
+
+class UploadSessionResponse(BaseModel):
+    """Response schema for resumable upload state."""
+    id: str
+    filename: str
+    upload_length: int
+    upload_offset: int
+    expires_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+
+class StreamTokenResponse(BaseModel):
+    """Short-lived token for one transcript's export, audio and events URLs."""
+    token: str = Field(..., description="Pass as ?token= where headers cannot be set")
+    expires_in: int = Field(..., description="Lifetime in seconds")
@@ -0,0 +1,338 @@
+"""
+Transcript full-text search - Pure business logic.
+NO FastAPI imports, NO HTTP context.
+
+Segments are indexed at save time in a backend chosen by DATABASE_URL:
+- SQLite: FTS5 virtual table `transcript_search` (rowid = segment id), ranked by bm25
+- PostgreSQL: `transcript_segments.search_vector` tsvector with a GIN index, ranked by ts_rank
+
+Both backends index text that was already normalized by `normalize_text`
+(lowercase, accents folded, Indonesian stopwords removed, affixes stripped,
+original words kept next to their stems) and queries are stemmed the same
+way, so "pertemuannya" matches "temu" and "perte" prefix-matches "pertemuan".
+"""
+from typing import Any, Dict, List, Optional
+import re
+import unicodedata
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from core.config import settings
+
+# "sqlite" or "postgresql"
+SEARCH_BACKEND = make_url(settings.DATABASE_URL).get_backend_name()
+
+_WORD_RE = re.compile(r"[0-9a-z]+")
+
+# Frequent function words that carry no search value
+STOPWORDS = frozenset("""
+    yang dan di ke dari ini itu untuk dengan ada tidak akan pada juga dalam
+    atau sudah saya kita kami kamu anda dia mereka ya oke jadi kalau karena
+    bisa tapi lagi sama sih kan nah eh ah oh the a an of to and is in it
+""".split())
+
+_PARTICLES = ("lah", "kah", "pun")  # not "-tah": pemerintah, perintah
+_POSSESSIVES = ("nya",)  # -ku/-mu clash with roots like "temu", "ilmu"
+_SUFFIXES = ("kan", "an", "i")
+# Noun confixes (pe-an, per-an, ke-an) take "-an", so "-kan" after them is
+# usually root "k" + "-an": perbaikan, pemasukan
+_AN_FIRST_PREFIXES = ("pe", "ke")
+# Prefix/suffix pairs that never form a confix, so the ending is part of
+# the root: me-an (memakan), di-an, te-an, be-i, ke-i, ke-kan, se-i, se-kan
+_INVALID_CONFIX = {
+    "me": ("an",), "di": ("an",), "te": ("an",),
+    "be": ("i",), "ke": ("i", "kan"), "se": ("i", "kan"),
+}
+
+# Outer prefixes: (prefix, letters the root may have started with when a
+# vowel follows). Nasal prefixes drop the root's first consonant (me+pakai
+# -> memakai, me+kirim -> mengirim, me+sampai -> menyampaikan) but also
+# attach to roots starting with a vowel or the nasal itself (me+ambil ->
+# mengambil, me+makan -> memakan). Without a dictionary both readings are
+# kept; the first one is the usual stem.
+_OUTER_PREFIXES = (
+    ("meny", ("s", "ny")), ("peny", ("s", "ny")),
+    ("meng", ("k", "")), ("peng", ("k", "")),
+    ("mem", ("p", "m")), ("pem", ("p", "m")),
+    ("men", ("t", "n")), ("pen", ("t", "n")),
+    ("ber", ("",)), ("ter", ("",)), ("per", ("",)),
+    ("me", ("",)), ("pe", ("",)), ("be", ("",)),
+    ("di", ("",)), ("ke", ("",)), ("se", ("",)),
+)
+
+# Prefixes that can follow an outer one (di-per-baiki, ke-ber-hasilan)
+_INNER_PREFIXES = ("per", "ber", "ter")
+
+_VOWELS = frozenset("aeiou")
+
+# Frequent roots starting with "m", preferred over the "p" reading of a
+# nasal prefix (pemasukan: masuk, not pasuk)
+_M_ROOTS = frozenset("""
+    masuk makan minta minum mulai milik mohon main mati maju muat mandi
+""".split())
+
+MIN_STEM_LENGTH = 3
+
+
+def _strip_suffix(word: str, suffixes) -> str:
+    for suffix in suffixes:
+        if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM_LENGTH:
+            return word[:-len(suffix)]
+    return word
+
+
+def _strip_derivational_suffix(word: str, prefix: str) -> List[str]:
+    """Readings of a word's confix suffix, most likely first."""
+    invalid = _INVALID_CONFIX.get(prefix[:2], ())
+    readings = []
+    for suffix in _SUFFIXES:
+        if suffix in invalid or not word.endswith(suffix) or len(word) - len(suffix) < MIN_STEM_LENGTH:
+            continue
+        # "-i" after a vowel is part of the root: pakai, mulai, sampai
+        if suffix == "i" and word[-2] in _VOWELS:
+            continue
+        readings.append(word[:-len(suffix)])
+    if not readings:
+        return [word]
+    # A word ending in "-kan" fits both "-kan" and "-an"; keep both
+    if prefix[:2] in _AN_FIRST_PREFIXES:
+        readings.reverse()
+    return readings
+
+
+def _strip_inner_prefix(word: str) -> str:
+    for prefix in _INNER_PREFIXES:
+        if word.startswith(prefix) and len(word) - len(prefix) >= MIN_STEM_LENGTH:
+            return word[len(prefix):]
+    return word
+
+
+def stem_variants(word: str) -> List[str]:
+    """
+    Light rule-based Indonesian stemmer (no dictionary).
+    
+    Strips particles and possessives, up to two prefixes, and a derivational
+    suffix only as part of a confix (me-kan, pe-an, di-i, ...), since a bare
+    "-an"/"-i" is too often part of the root ("makan", "sampai"). It is not
+    linguistically exact; it only has to map inflections of a word to the
+    same key on both the index and the query side.
+    
+    Returns:
+        Candidate stems, most likely first; more than one after a nasal
+        prefix whose root could start with either letter (mengirim: kirim,
+        irim) or when "-kan" could also be root "k" + "-an" (perbaikan:
+        baik, bai)
+    """
+    if len(word) <= 4 or word.isdigit():
+        return [word]
+    
+    word = _strip_suffix(word, _PARTICLES)
+    word = _strip_suffix(word, _POSSESSIVES)
+    
+    for prefix, restored in _OUTER_PREFIXES:
+        rest = word[len(prefix):]
+        if not word.startswith(prefix) or len(rest) < MIN_STEM_LENGTH:
+            continue
+        candidates = [letters + rest for letters in restored] if rest[0] in _VOWELS else [rest]
+        stems = []
+        for candidate in candidates:
+            stems.extend(_strip_derivational_suffix(_strip_inner_prefix(candidate), prefix))
+        stems.sort(key=lambda stem: stem not in _M_ROOTS)
+        return list(dict.fromkeys(stems))
+    return [word]
+
+
+def stem_indonesian(word: str) -> str:
+    """Most likely stem of a word (see stem_variants)."""
+    return stem_variants(word)[0]
+
+
+def _words(value: str) -> List[str]:
+    """Lowercase, fold accents and split into non-stopword words."""
+    folded = unicodedata.normalize("NFKD", value.lower())
+    folded = "".join(ch for ch in folded if not unicodedata.combining(ch))
+    return [word for word in _WORD_RE.findall(folded) if word not in STOPWORDS]
+
+
+def tokenize(value: str) -> List[str]:
+    """
+    Index tokens: every stem candidate of each word, plus the word itself
+    when it differs, so search-as-you-type can prefix-match unstemmed input.
+    """
+    tokens = []
+    for word in _words(value):
+        tokens.extend(dict.fromkeys(stem_variants(word) + [word]))
+    return tokens
+
+
+def normalize_text(value: str) -> str:
+    """Normalized document text as stored in the search index."""
+    return " ".join(tokenize(value))
+
+
+def build_match_query(query: str) -> Optional[str]:
+    """
+    Translate user input into the backend's query syntax.
+    
+    Every word must match one of its stems. The last word may still be
+    incomplete (search-as-you-type), so it also matches as an unstemmed
+    prefix of the indexed words: stemming "perte" would give "rte".
+
+    Returns:
+        Query string, or None if nothing searchable remains
+    """
+    words = list(dict.fromkeys(_words(query)))
+    if not words:
+        return None
+    
+    postgres = SEARCH_BACKEND == "postgresql"
+    groups = []
+    for i, word in enumerate(words):
+        keys = stem_variants(word)
+        terms = list(keys) if postgres else [f'"{key}"' for key in keys]
+        if i == len(words) - 1:
+            terms = [term for key, term in zip(keys, terms) if key != word]
+            terms.append(f"{word}:*" if postgres else f'"{word}"*')
+        if len(terms) == 1:
+            groups.append(terms[0])
+        else:
+            groups.append("(" + (" | " if postgres else " OR ").join(terms) + ")")
+    return (" & " if postgres else " AND ").join(groups)
+
+
+class TranscriptSearchService:
+    """Maintains and queries the segment search index."""
+
+    @staticmethod
+    def ensure_index(conn) -> None:
+        """
+        Create the search structures for the configured backend if missing.
+
+        Args:
+            conn: SQLAlchemy connection (committed by the caller)
+        """
+        if SEARCH_BACKEND == "postgresql":
+            conn.execute(text(
+                "ALTER TABLE transcript_segments ADD COLUMN IF NOT EXISTS search_vector tsvector"
+            ))
+            conn.execute(text("""
+                CREATE INDEX IF NOT EXISTS idx_transcript_segments_search
+                ON transcript_segments USING GIN (search_vector)
+            """))
+        else:
+            conn.execute(text("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS transcript_search USING fts5(
+                    search_text,
+                    transcript_id UNINDEXED,
+                    user_id UNINDEXED,
+                    tokenize = 'unicode61 remove_diacritics 2'
+                )
+            """))
+
+    @staticmethod
+    def remove_transcript(db: Session, transcript_id: int) -> None:
+        """Drop index entries of a transcript (call before its segments are deleted)."""
+        if SEARCH_BACKEND == "postgresql":
+            return  # search_vector lives on the segment rows
+        db.execute(
+            text("""
+                DELETE FROM transcript_search WHERE rowid IN (
+                    SELECT id FROM transcript_segments WHERE transcript_id = :transcript_id
+                )
+            """),
+            {"transcript_id": transcript_id}
+        )
+
+    @staticmethod
+    def index_transcript(db: Session, transcript_id: int, user_id: int) -> int:
+        """
+        Index the stored segments of a transcript.
+        Runs inside the caller's transaction (see TranscriptService.save_result).
+
+        Args:
+            db: Database session
+            transcript_id: ID of the transcript
+            user_id: Owner, stored for per-user filtering
+
+        Returns:
+            Number of segments indexed
+        """
+        segments = db.execute(
+            text("SELECT id, text FROM transcript_segments WHERE transcript_id = :transcript_id"),
+            {"transcript_id": transcript_id}
+        ).all()
+
+        rows = [
+            {"id": segment_id, "doc": normalize_text(segment_text or "")}
+            for segment_id, segment_text in segments
+        ]
+        if not rows:
+            return 0
+
+        if SEARCH_BACKEND == "postgresql":
+            db.execute(
+                text("UPDATE transcript_segments SET search_vector = to_tsvector('simple', :doc) WHERE id = :id"),
+                rows
+            )
+        else:
+            db.execute(
+                text("""
+                    INSERT INTO transcript_search (rowid, search_text, transcript_id, user_id)
+                    VALUES (:id, :doc, :transcript_id, :user_id)
+                """),
+                [{**row, "transcript_id": transcript_id, "user_id": user_id} for row in rows]
+            )
+        return len(rows)
+
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        user_id: int,
+        query: str,
+        limit: int = 20
+    ) -> List[Dict[str, Any]]:
+        """
+        Ranked segment-level hits across a user's transcripts.
+
+        Args:
+            db: Async database session
+            user_id: Only search this user's transcripts
+            query: Free-text user query
+            limit: Maximum number of hits
+
+        Returns:
+            Hits with transcript_id, segment_id, start, end, speaker, text, score;
+            best match first
+        """
+        match = build_match_query(query)
+        if match is None:
+            return []
+
+        if SEARCH_BACKEND == "postgresql":
+            sql = text("""
+                SELECT s.transcript_id, s.seq AS segment_id, s.start_time AS start, s.end_time AS "end",
+                       s.speaker, s.text, ts_rank(s.search_vector, q) AS score
+                FROM transcript_segments s
+                JOIN transcripts t ON t.id = s.transcript_id,
+                     to_tsquery('simple', :match) q
+                WHERE s.search_vector @@ q AND t.user_id = :user_id
+                ORDER BY score DESC, s.transcript_id DESC, s.start_time
+                LIMIT :limit
+            """)
+        else:
+            # bm25() is lower-is-better; negate so higher score = better match
+            sql = text("""
+                SELECT s.transcript_id, s.seq AS segment_id, s.start_time AS start, s.end_time AS "end",
+                       s.speaker, s.text, -bm25(transcript_search) AS score
+                FROM transcript_search
+                JOIN transcript_segments s ON s.id = transcript_search.rowid
+                WHERE transcript_search MATCH :match AND transcript_search.user_id = :user_id
+                ORDER BY bm25(transcript_search), s.transcript_id DESC, s.start_time
+                LIMIT :limit
+            """)
+
+        result = await db.execute(sql, {"match": match, "user_id": user_id, "limit": limit})
+        return [dict(row._mapping) for row in result]
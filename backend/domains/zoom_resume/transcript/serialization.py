@@ -0,0 +1,61 @@
+"""
+Fast JSON serialization for stored transcripts.
+NO FastAPI imports, NO HTTP context.
+
+Segments in segments_json were produced by our own pipeline and already
+validated when saved, so re-validating every segment through Pydantic on
+each read is wasted work. These helpers emit the same shape as
+TranscriptResponse straight from the row with orjson.
+"""
+from typing import Any, Dict, List, Optional
+
+import orjson
+
+from domains.zoom_resume.transcript.model import Transcript
+
+DEFAULT_SPEAKER = "Speaker 1"  # Same default as schemas.TranscriptSegment
+
+
+def segments_payload(segments: Optional[List[Dict[str, Any]]]) -> Optional[List[Dict[str, Any]]]:
+    """Project stored segments onto the TranscriptSegment fields."""
+    if segments is None:
+        return None
+    return [
+        {
+            "id": seg.get("id", index),
+            "start": float(seg.get("start", 0.0)),
+            "end": float(seg.get("end", 0.0)),
+            "text": seg.get("text", ""),
+            "speaker": seg.get("speaker") or DEFAULT_SPEAKER,
+        }
+        for index, seg in enumerate(segments)
+    ]
+
+
+def transcript_payload(transcript: Transcript) -> Dict[str, Any]:
+    """TranscriptResponse-shaped dict for a transcript row."""
+    return {
+        "id": transcript.id,
+        "user_id": transcript.user_id,
+        "audio_url": transcript.audio_url,
+        "status": transcript.status,
+        "language": transcript.language,
+        "full_text": transcript.full_text,
+        "segments": segments_payload(transcript.segments),
+        "error_message": transcript.error_message,
+        "created_at": transcript.created_at,
+        "updated_at": transcript.updated_at,
+    }
+
+
+def dump_transcript_json(transcript: Transcript) -> bytes:
+    """
+    Serialize a transcript to TranscriptResponse JSON without Pydantic.
+
+    Args:
+        transcript: Transcript row (full_text and segments loaded)
+
+    Returns:
+        UTF-8 JSON bytes
+    """
+    return orjson.dumps(transcript_payload(transcript))
@@ -3,16 +3,170 @@ Transcript service layer - Pure business logic.
 NO FastAPI imports, NO HTTP context.
 Reusable by API, workers, and Zoom webhook.
 """
-from typing import List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+from sqlalchemy import delete, func, insert, select, tuple_, update
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
+import base64
 import logging
+import threading
+import time
 
-from domains.zoom_resume.transcript.model import Transcript, TranscriptStatus
+from core.config import settings
+from core.exceptions import InvalidCursorError
+from domains.zoom_resume.transcript.model import Transcript, TranscriptSegmentRecord, TranscriptStatus
+from domains.zoom_resume.transcript.events import publish_transcript_event
+from domains.zoom_resume.transcript.search import TranscriptSearchService
 
 logger = logging.getLogger(__name__)
 
+# Columns for list pages; never loads full_text or segments_json
+SUMMARY_COLUMNS = (
+    Transcript.id,
+    Transcript.user_id,
+    Transcript.audio_url,
+    Transcript.status,
+    Transcript.language,
+    Transcript.segments_count,
+    Transcript.error_message,
+    Transcript.created_at,
+    Transcript.updated_at,
+)
+
+SEGMENT_COLUMNS = (
+    TranscriptSegmentRecord.seq,
+    TranscriptSegmentRecord.start,
+    TranscriptSegmentRecord.end,
+    TranscriptSegmentRecord.speaker,
+    TranscriptSegmentRecord.text,
+)
+
+# Segments per "segments" event; small enough for a Postgres NOTIFY payload
+SEGMENT_EVENT_BATCH = 20
+
+# Per-user transcript totals: {user_id: (expires_at, total)}
+_total_cache: Dict[int, Tuple[float, int]] = {}
+_total_cache_lock = threading.Lock()
+
+
+def encode_cursor(created_at: datetime, transcript_id: int) -> str:
+    """Encode the (created_at, id) position of a row as an opaque cursor."""
+    raw = f"{created_at.isoformat()}|{transcript_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_cursor.
+    
+    Raises:
+        InvalidCursorError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, transcript_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(created_at), int(transcript_id)
+    except (ValueError, UnicodeDecodeError):
+        raise InvalidCursorError()
+
+
+def _summary_page_query(user_id: int, limit: int, cursor: Optional[str]):
+    """
+    Keyset query for one page of summaries, newest first.
+    Fetches limit + 1 rows so the caller knows whether another page exists.
+    Served by the (user_id, created_at, id) index regardless of page depth.
+    """
+    query = select(*SUMMARY_COLUMNS).where(Transcript.user_id == user_id)
+    if cursor:
+        created_at, transcript_id = decode_cursor(cursor)
+        query = query.where(
+            tuple_(Transcript.created_at, Transcript.id) < tuple_(created_at, transcript_id)
+        )
+    return query.order_by(Transcript.created_at.desc(), Transcript.id.desc()).limit(limit + 1)
+
+
+def _split_page(rows: List[Row], limit: int) -> Tuple[List[Row], Optional[str]]:
+    """Trim the look-ahead row and build the next cursor."""
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1].created_at, rows[-1].id)
+
+
+def segment_records(transcript_id: int, segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Map pipeline segment dicts to transcript_segments rows."""
+    return [
+        {
+            "transcript_id": transcript_id,
+            "seq": seg.get("id", index),
+            "start": float(seg.get("start", 0.0)),
+            "end": float(seg.get("end", 0.0)),
+            "speaker": seg.get("speaker"),
+            "text": seg.get("text", ""),
+        }
+        for index, seg in enumerate(segments)
+    ]
+
+
+def _segment_range_query(
+    transcript_id: int,
+    start_from: Optional[float] = None,
+    end_to: Optional[float] = None,
+    speaker: Optional[str] = None,
+    limit: Optional[int] = None
+):
+    """
+    Segments overlapping [start_from, end_to), in time order.
+    The start_time bound and ordering are served by the
+    (transcript_id, start_time) index.
+    """
+    query = select(*SEGMENT_COLUMNS).where(TranscriptSegmentRecord.transcript_id == transcript_id)
+    if end_to is not None:
+        query = query.where(TranscriptSegmentRecord.start < end_to)
+    if start_from is not None:
+        query = query.where(TranscriptSegmentRecord.end > start_from)
+    if speaker:
+        query = query.where(TranscriptSegmentRecord.speaker == speaker)
+    query = query.order_by(TranscriptSegmentRecord.start, TranscriptSegmentRecord.seq)
+    if limit:
+        query = query.limit(limit)
+    return query
+
+
+def _update_search_index(db: Session, operation, *args) -> None:
+    """
+    Run a search index update in a savepoint.
+    A search index problem must not lose the transcription result, so
+    failures are logged and only the savepoint is rolled back.
+    """
+    try:
+        with db.begin_nested():
+            operation(db, *args)
+    except Exception as e:
+        logger.warning(f"Search index update failed for transcript {args[0]}: {e}")
+
+
+def _get_cached_total(user_id: int) -> Optional[int]:
+    with _total_cache_lock:
+        entry = _total_cache.get(user_id)
+    if entry and entry[0] > time.monotonic():
+        return entry[1]
+    return None
+
+
+def _set_cached_total(user_id: int, total: int) -> None:
+    with _total_cache_lock:
+        _total_cache[user_id] = (time.monotonic() + settings.TRANSCRIPT_COUNT_CACHE_SECONDS, total)
+
+
+def invalidate_transcript_count(user_id: int) -> None:
+    """Drop the cached total for a user after transcripts are added or removed."""
+    with _total_cache_lock:
+        _total_cache.pop(user_id, None)
+
 
 class TranscriptService:
     """Pure domain service for transcript business logic."""
@@ -42,6 +196,7 @@ class TranscriptService:
         db.add(transcript)
         db.commit()
         db.refresh(transcript)
+        invalidate_transcript_count(user_id)
         return transcript
     
     @staticmethod
@@ -77,6 +232,13 @@ class TranscriptService:
         
         db.commit()
         db.refresh(transcript)
+        
+        publish_transcript_event(
+            transcript_id,
+            "status",
+            status=TranscriptStatus(status).value,
+            error_message=error_message
+        )
         return transcript
     
     @staticmethod
@@ -96,6 +258,42 @@ class TranscriptService:
         except Exception as e:
             logger.warning(f"Failed to delete audio file {audio_url}: {e}")
     
+    @staticmethod
+    def purge_expired_audio(db: Session, now: Optional[datetime] = None, batch_size: int = 500) -> int:
+        """
+        Delete audio files whose retention period has ended.
+        
+        Args:
+            db: Database session
+            now: Reference time (default: utcnow)
+            batch_size: Maximum transcripts handled per call
+            
+        Returns:
+            Number of transcripts whose audio was purged
+        """
+        now = now or datetime.utcnow()
+        expired = db.execute(
+            select(Transcript.id, Transcript.audio_url)
+            .where(Transcript.audio_expires_at.is_not(None), Transcript.audio_expires_at <= now)
+            .order_by(Transcript.audio_expires_at)
+            .limit(batch_size)
+        ).all()
+        if not expired:
+            return 0
+        
+        for _, audio_url in expired:
+            TranscriptService.cleanup_audio_file(audio_url)
+        
+        # Keep updated_at: content did not change, so ETags stay valid
+        db.execute(
+            update(Transcript)
+            .where(Transcript.id.in_([transcript_id for transcript_id, _ in expired]))
+            .values(audio_expires_at=None, updated_at=Transcript.updated_at)
+        )
+        db.commit()
+        logger.info(f"Purged audio of {len(expired)} transcripts past retention")
+        return len(expired)
+    
     @staticmethod
     def save_result(
         db: Session,
@@ -103,7 +301,7 @@ class TranscriptService:
         language: str,
         full_text: str,
         segments: List[dict],
-        cleanup_file: bool = True
+        cleanup_file: Optional[bool] = None
     ) -> Transcript:
         """
         Save transcription results and mark as DONE.
@@ -115,7 +313,9 @@ class TranscriptService:
             language: Detected language
             full_text: Full transcription text
             segments: List of transcript segments
-            cleanup_file: Whether to delete audio file after save (default: True)
+            cleanup_file: Whether to delete audio file after save. Defaults to
+                AUDIO_RETENTION_DAYS: 0 deletes now, otherwise the file is kept
+                for playback and purged by purge_expired_audio()
             
         Returns:
             Updated Transcript instance
@@ -130,12 +330,44 @@ class TranscriptService:
         transcript.language = language
         transcript.full_text = full_text
         transcript.segments_json = segments
+        transcript.segments_count = len(segments)
         transcript.status = TranscriptStatus.DONE
         transcript.updated_at = datetime.utcnow()
         
+        if cleanup_file is None:
+            cleanup_file = settings.AUDIO_RETENTION_DAYS == 0
+        if not cleanup_file and settings.AUDIO_RETENTION_DAYS:
+            transcript.audio_expires_at = transcript.updated_at + timedelta(days=settings.AUDIO_RETENTION_DAYS)
+        
+        # Normalized copy for time-range reads and search (same transaction)
+        _update_search_index(db, TranscriptSearchService.remove_transcript, transcript_id)
+        db.execute(
+            delete(TranscriptSegmentRecord).where(TranscriptSegmentRecord.transcript_id == transcript_id)
+        )
+        records = segment_records(transcript_id, segments)
+        if records:
+            db.execute(insert(TranscriptSegmentRecord), records)
+            _update_search_index(db, TranscriptSearchService.index_transcript, transcript_id, transcript.user_id)
+        
         db.commit()
         db.refresh(transcript)
         
+        # Saved segments go out before DONE, which closes the event streams
+        for i in range(0, len(segments), SEGMENT_EVENT_BATCH):
+            publish_transcript_event(
+                transcript_id,
+                "segments",
+                offset=i,
+                segments=segments[i:i + SEGMENT_EVENT_BATCH]
+            )
+        publish_transcript_event(
+            transcript_id,
+            "status",
+            status=TranscriptStatus.DONE.value,
+            language=language,
+            segments_count=len(segments)
+        )
+        
         # Cleanup audio file after successful save
         if cleanup_file:
             TranscriptService.cleanup_audio_file(transcript.audio_url)
@@ -192,6 +424,79 @@ class TranscriptService:
         
         return transcripts, total
     
+    @staticmethod
+    def list_summaries_by_user(
+        db: Session,
+        user_id: int,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Row], Optional[str]]:
+        """
+        List transcript summaries for a user with keyset pagination.
+        
+        Args:
+            db: Database session
+            user_id: ID of the user
+            limit: Maximum number of records to return
+            cursor: Cursor from the previous page (None for the first page)
+            
+        Returns:
+            Tuple of (summary rows, next cursor or None on the last page)
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        rows = db.execute(_summary_page_query(user_id, limit, cursor)).all()
+        return _split_page(rows, limit)
+    
+    @staticmethod
+    def count_by_user(db: Session, user_id: int, use_cache: bool = True) -> int:
+        """
+        Count a user's transcripts, cached for TRANSCRIPT_COUNT_CACHE_SECONDS.
+        
+        Args:
+            db: Database session
+            user_id: ID of the user
+            use_cache: Whether a cached total may be returned
+            
+        Returns:
+            Total number of transcripts
+        """
+        total = _get_cached_total(user_id) if use_cache else None
+        if total is None:
+            total = db.scalar(
+                select(func.count()).select_from(Transcript).where(Transcript.user_id == user_id)
+            )
+            _set_cached_total(user_id, total)
+        return total
+    
+    @staticmethod
+    def list_segments(
+        db: Session,
+        transcript_id: int,
+        start_from: Optional[float] = None,
+        end_to: Optional[float] = None,
+        speaker: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> List[Row]:
+        """
+        Get the segments of a transcript overlapping a time range.
+        
+        Args:
+            db: Database session
+            transcript_id: ID of the transcript
+            start_from: Range start in seconds (None for the beginning)
+            end_to: Range end in seconds (None for the end)
+            speaker: Only segments from this speaker
+            limit: Maximum number of segments
+            
+        Returns:
+            Rows with seq, start, end, speaker, text ordered by start
+        """
+        return db.execute(
+            _segment_range_query(transcript_id, start_from, end_to, speaker, limit)
+        ).all()
+    
     @staticmethod
     def get_latest_transcript(db: Session) -> Optional[Transcript]:
         """
@@ -204,3 +509,255 @@ class TranscriptService:
             Latest Transcript instance or None
         """
         return db.query(Transcript).order_by(Transcript.created_at.desc()).first()
+
+
+class AsyncTranscriptService:
+    """
+    Async variants of TranscriptService for `async def` routes.
+    Same semantics as the sync methods, but awaits an AsyncSession so
+    queries never block the event loop.
+    """
+    
+    @staticmethod
+    async def create_transcript(
+        db: AsyncSession,
+        user_id: int,
+        audio_url: str
+    ) -> Transcript:
+        """
+        Create a new transcript with PENDING status.
+        
+        Args:
+            db: Async database session
+            user_id: ID of the user creating the transcript
+            audio_url: URL or path to the audio file
+            
+        Returns:
+            Created Transcript instance
+        """
+        transcript = Transcript(
+            user_id=user_id,
+            audio_url=audio_url,
+            status=TranscriptStatus.PENDING
+        )
+        db.add(transcript)
+        await db.commit()
+        await db.refresh(transcript)
+        invalidate_transcript_count(user_id)
+        return transcript
+    
+    @staticmethod
+    async def update_status(
+        db: AsyncSession,
+        transcript_id: int,
+        status: TranscriptStatus,
+        error_message: Optional[str] = None
+    ) -> Transcript:
+        """
+        Update transcript status.
+        
+        Args:
+            db: Async database session
+            transcript_id: ID of the transcript
+            status: New status
+            error_message: Error message if status is FAILED
+            
+        Returns:
+            Updated Transcript instance
+            
+        Raises:
+            ValueError: If transcript not found
+        """
+        transcript = await db.get(Transcript, transcript_id)
+        if not transcript:
+            raise ValueError(f"Transcript {transcript_id} not found")
+        
+        transcript.status = status
+        if error_message:
+            transcript.error_message = error_message
+        transcript.updated_at = datetime.utcnow()
+        
+        await db.commit()
+        await db.refresh(transcript)
+        
+        publish_transcript_event(
+            transcript_id,
+            "status",
+            status=TranscriptStatus(status).value,
+            error_message=error_message
+        )
+        return transcript
+    
+    @staticmethod
+    async def get_by_id(
+        db: AsyncSession,
+        transcript_id: int,
+        user_id: Optional[int] = None
+    ) -> Optional[Transcript]:
+        """
+        Get transcript by ID with optional user authorization check.
+        
+        Args:
+            db: Async database session
+            transcript_id: ID of the transcript
+            user_id: Optional user ID for authorization check
+            
+        Returns:
+            Transcript instance or None
+        """
+        query = select(Transcript).where(Transcript.id == transcript_id)
+        
+        if user_id is not None:
+            query = query.where(Transcript.user_id == user_id)
+        
+        result = await db.execute(query)
+        return result.scalars().first()
+    
+    @staticmethod
+    async def get_summary(
+        db: AsyncSession,
+        transcript_id: int,
+        user_id: Optional[int] = None
+    ) -> Optional[Row]:
+        """
+        Get the summary columns of a transcript (no full_text/segments).
+        
+        Args:
+            db: Async database session
+            transcript_id: ID of the transcript
+            user_id: Optional user ID for authorization check
+            
+        Returns:
+            Summary row or None
+        """
+        query = select(*SUMMARY_COLUMNS).where(Transcript.id == transcript_id)
+        
+        if user_id is not None:
+            query = query.where(Transcript.user_id == user_id)
+        
+        result = await db.execute(query)
+        return result.first()
+    
+    @staticmethod
+    async def stream_segments(
+        db: AsyncSession,
+        transcript_id: int,
+        start_from: Optional[float] = None,
+        end_to: Optional[float] = None,
+        speaker: Optional[str] = None,
+        limit: Optional[int] = None,
+        batch_size: int = 500
+    ) -> AsyncIterator[Row]:
+        """
+        Stream the segments of a transcript overlapping a time range.
+        Rows are fetched in batches, so memory stays bounded for long meetings.
+        
+        Args:
+            db: Async database session
+            transcript_id: ID of the transcript
+            start_from: Range start in seconds (None for the beginning)
+            end_to: Range end in seconds (None for the end)
+            speaker: Only segments from this speaker
+            limit: Maximum number of segments
+            batch_size: Rows fetched per round trip
+            
+        Yields:
+            Rows with seq, start, end, speaker, text ordered by start
+        """
+        query = _segment_range_query(transcript_id, start_from, end_to, speaker, limit)
+        result = await db.stream(query.execution_options(yield_per=batch_size))
+        async for row in result:
+            yield row
+    
+    @staticmethod
+    async def list_by_user(
+        db: AsyncSession,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 20
+    ) -> Tuple[List[Transcript], int]:
+        """
+        List transcripts for a user with pagination.
+        
+        Args:
+            db: Async database session
+            user_id: ID of the user
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+            
+        Returns:
+            Tuple of (list of transcripts, total count)
+        """
+        total = await db.scalar(
+            select(func.count()).select_from(Transcript).where(Transcript.user_id == user_id)
+        )
+        result = await db.execute(
+            select(Transcript)
+            .where(Transcript.user_id == user_id)
+            .order_by(Transcript.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        return list(result.scalars().all()), total
+    
+    @staticmethod
+    async def list_summaries_by_user(
+        db: AsyncSession,
+        user_id: int,
+        limit: int = 20,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Row], Optional[str]]:
+        """
+        List transcript summaries for a user with keyset pagination.
+        
+        Args:
+            db: Async database session
+            user_id: ID of the user
+            limit: Maximum number of records to return
+            cursor: Cursor from the previous page (None for the first page)
+            
+        Returns:
+            Tuple of (summary rows, next cursor or None on the last page)
+            
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
+        result = await db.execute(_summary_page_query(user_id, limit, cursor))
+        return _split_page(result.all(), limit)
+    
+    @staticmethod
+    async def count_by_user(db: AsyncSession, user_id: int, use_cache: bool = True) -> int:
+        """
+        Count a user's transcripts, cached for TRANSCRIPT_COUNT_CACHE_SECONDS.
+        
+        Args:
+            db: Async database session
+            user_id: ID of the user
+            use_cache: Whether a cached total may be returned
+            
+        Returns:
+            Total number of transcripts
+        """
+        total = _get_cached_total(user_id) if use_cache else None
+        if total is None:
+            total = await db.scalar(
+                select(func.count()).select_from(Transcript).where(Transcript.user_id == user_id)
+            )
+            _set_cached_total(user_id, total)
+        return total
+    
+    @staticmethod
+    async def get_latest_transcript(db: AsyncSession) -> Optional[Transcript]:
+        """
+        Get the most recent transcript (any user).
+        
+        Args:
+            db: Async database session
+            
+        Returns:
+            Latest Transcript instance or None
+        """
+        result = await db.execute(
+            select(Transcript).order_by(Transcript.created_at.desc()).limit(1)
+        )
+        return result.scalars().first()
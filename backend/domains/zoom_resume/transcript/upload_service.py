@@ -0,0 +1,241 @@
+"""
+Resumable upload service layer - Pure business logic.
+NO FastAPI imports, NO HTTP context.
+
+Implements the session side of a tus-style protocol: create a session,
+append byte ranges at the recorded offset, then finalize into a Transcript.
+"""
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Optional
+import asyncio
+import logging
+import os
+import uuid
+import weakref
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from core.config import settings
+from core.exceptions import UploadSessionNotFoundError, UploadConflictError
+from domains.zoom_resume.transcript.model import Transcript, UploadSession
+from domains.zoom_resume.transcript.service import TranscriptService
+
+logger = logging.getLogger(__name__)
+
+# One lock per upload id while a chunk is being written; entries disappear
+# once no request holds the lock
+_chunk_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+
+class UploadSessionService:
+    """Pure domain service for resumable upload sessions."""
+    
+    @staticmethod
+    def create_session(
+        db: Session,
+        user_id: int,
+        filename: str,
+        upload_length: int,
+        partial_dir: Path
+    ) -> UploadSession:
+        """
+        Create an upload session with an empty partial file.
+        
+        Args:
+            db: Database session
+            user_id: ID of the uploading user
+            filename: Original filename (already validated)
+            upload_length: Declared total size in bytes
+            partial_dir: Directory holding partial uploads
+            
+        Returns:
+            Created UploadSession instance
+        """
+        UploadSessionService.purge_expired(db)
+        
+        upload_id = uuid.uuid4().hex
+        partial_dir.mkdir(parents=True, exist_ok=True)
+        file_path = partial_dir / f"{upload_id}.part"
+        file_path.touch()
+        
+        upload = UploadSession(
+            id=upload_id,
+            user_id=user_id,
+            filename=filename,
+            file_path=str(file_path),
+            upload_length=upload_length,
+            upload_offset=0,
+            expires_at=datetime.utcnow() + timedelta(hours=settings.RESUMABLE_UPLOAD_EXPIRE_HOURS)
+        )
+        db.add(upload)
+        db.commit()
+        db.refresh(upload)
+        return upload
+    
+    @staticmethod
+    def get_session(db: Session, upload_id: str, user_id: int) -> UploadSession:
+        """
+        Get an active upload session owned by the user.
+        
+        Raises:
+            UploadSessionNotFoundError: If missing, owned by someone else, or expired
+        """
+        upload = db.query(UploadSession).filter(
+            UploadSession.id == upload_id,
+            UploadSession.user_id == user_id
+        ).first()
+        
+        if not upload or upload.expires_at < datetime.utcnow():
+            raise UploadSessionNotFoundError()
+        return upload
+    
+    @staticmethod
+    def check_offset(upload: UploadSession, offset: Optional[int]) -> None:
+        """
+        Verify a chunk starts exactly at the recorded offset.
+        
+        The partial file must also hold at least the recorded bytes; bytes
+        past the offset (from an interrupted chunk) are overwritten.
+        
+        Raises:
+            UploadConflictError: If the client offset differs from the server's,
+                or the partial file is shorter than the recorded offset
+        """
+        if offset is None or offset != upload.upload_offset:
+            raise UploadConflictError(
+                f"Upload-Offset mismatch: expected {upload.upload_offset}, got {offset}"
+            )
+        on_disk = os.path.getsize(upload.file_path) if os.path.exists(upload.file_path) else 0
+        if on_disk < upload.upload_offset:
+            raise UploadConflictError(
+                f"Partial upload holds {on_disk} bytes, expected {upload.upload_offset}"
+            )
+    
+    @staticmethod
+    def record_offset(db: Session, upload: UploadSession, offset: int) -> UploadSession:
+        """Persist the number of bytes received so far."""
+        if offset != upload.upload_offset:
+            upload.upload_offset = offset
+            upload.updated_at = datetime.utcnow()
+            db.commit()
+            db.refresh(upload)
+        return upload
+    
+    @staticmethod
+    def complete(db: Session, upload: UploadSession, dest_dir: Path) -> Transcript:
+        """
+        Finalize a fully received upload into a PENDING Transcript.
+        
+        Args:
+            db: Database session
+            upload: Session whose offset equals its declared length
+            dest_dir: Directory for finished audio files
+            
+        Returns:
+            Created Transcript instance
+            
+        Raises:
+            UploadConflictError: If bytes are still missing
+        """
+        if upload.upload_offset != upload.upload_length:
+            raise UploadConflictError(
+                f"Upload incomplete: {upload.upload_offset} of {upload.upload_length} bytes received"
+            )
+        
+        partial_path = Path(upload.file_path)
+        ext = Path(upload.filename).suffix.lower()
+        final_path = dest_dir / f"{uuid.uuid4().hex}{ext}"
+        
+        # Drop any bytes written past the recorded offset by an interrupted chunk
+        os.truncate(partial_path, upload.upload_length)
+        partial_path.replace(final_path)
+        
+        transcript = TranscriptService.create_transcript(
+            db,
+            user_id=upload.user_id,
+            audio_url=str(final_path)
+        )
+        
+        db.delete(upload)
+        db.commit()
+        logger.info(f"Upload {upload.id} finalized into transcript {transcript.id}")
+        return transcript
+    
+    @staticmethod
+    def abort(db: Session, upload: UploadSession) -> None:
+        """Delete an upload session and its partial file."""
+        TranscriptService.cleanup_audio_file(upload.file_path)
+        db.delete(upload)
+        db.commit()
+    
+    @staticmethod
+    def purge_expired(db: Session) -> int:
+        """
+        Remove expired sessions and their partial files.
+        
+        Returns:
+            Number of sessions removed
+        """
+        expired = db.query(UploadSession).filter(
+            UploadSession.expires_at < datetime.utcnow()
+        ).all()
+        
+        for upload in expired:
+            TranscriptService.cleanup_audio_file(upload.file_path)
+            db.delete(upload)
+        if expired:
+            db.commit()
+            logger.info(f"Purged {len(expired)} expired upload sessions")
+        return len(expired)
+
+
+class AsyncUploadSessionService:
+    """Async variants of the UploadSessionService calls made by async chunk routes."""
+    
+    @staticmethod
+    def chunk_lock(upload_id: str) -> asyncio.Lock:
+        """
+        Get the lock serializing chunk writes to one upload in this process.
+        
+        Hold it from reading the session until the new offset is recorded, so
+        two requests at the same Upload-Offset never write the partial file
+        at once.
+        """
+        lock = _chunk_locks.get(upload_id)
+        if lock is None:
+            lock = asyncio.Lock()
+            _chunk_locks[upload_id] = lock
+        return lock
+    
+    @staticmethod
+    async def get_session(db: AsyncSession, upload_id: str, user_id: int) -> UploadSession:
+        """
+        Get an active upload session owned by the user.
+        
+        Raises:
+            UploadSessionNotFoundError: If missing, owned by someone else, or expired
+        """
+        result = await db.execute(
+            select(UploadSession).where(
+                UploadSession.id == upload_id,
+                UploadSession.user_id == user_id
+            )
+        )
+        upload = result.scalars().first()
+        
+        if not upload or upload.expires_at < datetime.utcnow():
+            raise UploadSessionNotFoundError()
+        return upload
+    
+    @staticmethod
+    async def record_offset(db: AsyncSession, upload: UploadSession, offset: int) -> UploadSession:
+        """Persist the number of bytes received so far."""
+        if offset != upload.upload_offset:
+            upload.upload_offset = offset
+            upload.updated_at = datetime.utcnow()
+            await db.commit()
+            await db.refresh(upload)
+        return upload
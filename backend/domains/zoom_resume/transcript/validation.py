@@ -1,43 +1,146 @@
 """
 File validation for transcript uploads.
-Validates file size, extension, and optionally MIME type.
+Validates file size, extension, and container magic bytes.
 """
 from fastapi import UploadFile, HTTPException
 from pathlib import Path
-from typing import Set
+from typing import Dict, Optional, Set
+
+from core.config import settings
 
 
 class FileValidator:
     """Validates uploaded audio files for security and resource protection."""
     
-    MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
+    MAX_FILE_SIZE = settings.MAX_UPLOAD_SIZE_MB * 1024 * 1024  # 100MB by default
+    MAX_RESUMABLE_FILE_SIZE = settings.MAX_RESUMABLE_UPLOAD_SIZE_MB * 1024 * 1024
     ALLOWED_EXTENSIONS: Set[str] = {".wav", ".mp3", ".m4a", ".flac", ".webm", ".ogg"}
     
+    # Containers accepted for each extension (as detected by sniff_container)
+    EXTENSION_CONTAINERS: Dict[str, Set[str]] = {
+        ".wav": {"wav"},
+        ".mp3": {"mp3"},
+        ".m4a": {"mp4"},
+        ".flac": {"flac"},
+        ".webm": {"webm"},
+        ".ogg": {"ogg"},
+    }
+    
+    # Bytes needed from the start of the file to identify every container above
+    SNIFF_BYTES = 12
+    
     @staticmethod
-    def validate_upload(file: UploadFile) -> None:
+    def validate_filename(filename: Optional[str]) -> str:
         """
-        Validate uploaded file for security and resource constraints.
+        Validate upload filename and return its lowercased extension.
         
         Args:
-            file: FastAPI UploadFile object
+            filename: Client-supplied filename
+            
+        Returns:
+            Extension including the dot (e.g. ".wav")
             
         Raises:
-            HTTPException: If validation fails (400 for invalid format, 413 for too large)
+            HTTPException: 400 if filename is missing or extension not allowed
         """
-        # Validate filename exists
-        if not file.filename:
+        if not filename:
             raise HTTPException(
                 status_code=400,
                 detail="Filename is required"
             )
         
-        # Validate file extension
-        ext = Path(file.filename).suffix.lower()
+        ext = Path(filename).suffix.lower()
         if ext not in FileValidator.ALLOWED_EXTENSIONS:
             raise HTTPException(
                 status_code=400,
                 detail=f"Invalid file extension '{ext}'. Allowed: {', '.join(FileValidator.ALLOWED_EXTENSIONS)}"
             )
+        return ext
+    
+    @staticmethod
+    def sniff_container(head: bytes) -> Optional[str]:
+        """
+        Identify the audio container from the first bytes of a file.
+        
+        Args:
+            head: At least SNIFF_BYTES from the start of the file
+            
+        Returns:
+            One of "wav", "mp3", "mp4", "flac", "webm", "ogg", or None if unknown
+        """
+        if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+            return "wav"
+        if head[:4] == b"fLaC":
+            return "flac"
+        if head[:4] == b"OggS":
+            return "ogg"
+        if head[:4] == b"\x1a\x45\xdf\xa3":
+            return "webm"
+        if head[4:8] == b"ftyp":
+            return "mp4"
+        if head[:3] == b"ID3" or (len(head) >= 2 and head[0] == 0xFF and (head[1] & 0xE0) == 0xE0):
+            return "mp3"
+        return None
+    
+    @staticmethod
+    def validate_container(ext: str, head: bytes) -> str:
+        """
+        Check that the file content matches its extension.
+        
+        Args:
+            ext: Extension returned by validate_filename
+            head: First bytes of the file
+            
+        Returns:
+            Detected container name
+            
+        Raises:
+            HTTPException: 400 if the content is not a supported audio container
+        """
+        container = FileValidator.sniff_container(head)
+        if container is None or container not in FileValidator.EXTENSION_CONTAINERS.get(ext, set()):
+            raise HTTPException(
+                status_code=400,
+                detail=f"File content does not match a supported '{ext}' audio container"
+            )
+        return container
+    
+    @staticmethod
+    def validate_size(size: int, max_size: Optional[int] = None) -> None:
+        """
+        Enforce a size limit on a (possibly partial) byte count.
+        
+        Args:
+            size: Bytes received so far
+            max_size: Limit in bytes (default: MAX_FILE_SIZE)
+        
+        Raises:
+            HTTPException: 413 if size exceeds the limit
+        """
+        limit = FileValidator.MAX_FILE_SIZE if max_size is None else max_size
+        if size > limit:
+            max_mb = limit // (1024 * 1024)
+            raise HTTPException(
+                status_code=413,
+                detail=f"File too large. Maximum size: {max_mb}MB"
+            )
+    
+    @staticmethod
+    def validate_upload(file: UploadFile) -> None:
+        """
+        Validate an already-spooled upload for security and resource constraints.
+        
+        Prefer the streaming path in ingest.py for new endpoints; this seeks
+        over the whole spooled file to measure it.
+        
+        Args:
+            file: FastAPI UploadFile object
+            
+        Raises:
+            HTTPException: If validation fails (400 for invalid format, 413 for too large)
+        """
+        # Validate filename and extension
+        FileValidator.validate_filename(file.filename)
         
         # Validate file size
         file.file.seek(0, 2)  # Seek to end
@@ -50,9 +153,4 @@ class FileValidator:
                 detail="File is empty"
             )
         
-        if size > FileValidator.MAX_FILE_SIZE:
-            max_mb = FileValidator.MAX_FILE_SIZE // (1024 * 1024)
-            raise HTTPException(
-                status_code=413,
-                detail=f"File too large. Maximum size: {max_mb}MB"
-            )
+        FileValidator.validate_size(size)
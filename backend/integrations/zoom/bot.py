@@ -17,7 +17,7 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException, NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
-from .bot_utils import manage_cookies, extract_zoom_details, create_tar_archive, audio_file_path
+from .bot_utils import manage_cookies, extract_zoom_details, create_tar_archive, audio_file_path, append_jsonl, iter_jsonl, ProcessTreeSampler
 
 # Optional dependencies - comment out if not available
 # from monitoring import init_highlight
@@ -25,9 +25,149 @@ from .bot_utils import manage_cookies, extract_zoom_details, create_tar_archive,
 
 logger = logging.getLogger(__name__)
 
+# localStorage keys written by the transcript extension, mapped to the
+# record kind used in the incremental captions log
+CAPTION_SOURCES = {
+    'transcript': 'transcript',
+    'chatMessages': 'chat',
+}
+
+# Returns only entries newer than the given per-key cursors so each drain
+# transfers a bounded slice instead of the whole blob. A cursor remembers
+# the array length and a stable key (timestamp + text) of the last drained
+# entry. When that entry moved (array trimmed) the slice starts after it;
+# when it is gone but the array did not shrink, it was edited in place and
+# is sent again; only a shorter array restarts the slice at 0
+DRAIN_CAPTIONS_SCRIPT = """
+const cursors = arguments[0];
+const entryKey = (entry) => {
+    if (entry && typeof entry === 'object') {
+        const stamp = entry.timestamp ?? entry.time ?? null;
+        const text = entry.text ?? entry.message ?? null;
+        if (stamp !== null || text !== null) {
+            return JSON.stringify([stamp, text]);
+        }
+    }
+    return JSON.stringify(entry);
+};
+const result = {};
+for (const key of Object.keys(cursors)) {
+    let items = [];
+    try {
+        items = JSON.parse(localStorage.getItem(key) || '[]');
+    } catch (e) {
+        items = [];
+    }
+    if (!Array.isArray(items)) {
+        items = [];
+    }
+    const cursor = cursors[key] || {index: 0, key: null};
+    // ok: new entries follow the cursor; moved: the cursor entry was found
+    // elsewhere (array trimmed); edited: the cursor entry changed in place
+    // and is sent again as an update; reset: the array got shorter and the
+    // cursor entry is gone, so everything is sent again
+    let start = 0;
+    let resync = 'ok';
+    if (cursor.key !== null && cursor.index > 0) {
+        if (cursor.index <= items.length && entryKey(items[cursor.index - 1]) === cursor.key) {
+            start = cursor.index;
+        } else {
+            let found = -1;
+            for (let i = items.length - 1; i >= 0; i--) {
+                if (entryKey(items[i]) === cursor.key) {
+                    found = i;
+                    break;
+                }
+            }
+            if (found >= 0) {
+                start = found + 1;
+                resync = 'moved';
+            } else if (cursor.index <= items.length) {
+                start = cursor.index - 1;
+                resync = 'edited';
+            } else {
+                resync = 'reset';
+            }
+        }
+    }
+    result[key] = {
+        resync: resync,
+        entries: items.slice(start),
+        cursor: {
+            index: items.length,
+            key: items.length ? entryKey(items[items.length - 1]) : cursor.key,
+        },
+    };
+}
+return result;
+"""
+
+
+# Low-resource Chrome profile for dense bot hosting. The bot only needs the
+# meeting audio and the caption DOM, so rendering, video and background
+# services are cut back as far as Zoom Web still tolerates. Site isolation
+# stays on: the bot renders third-party content, and the renderer cap below
+# already bounds the process count.
+LOW_RESOURCE_CHROME_ARGS = [
+    '--window-size=1024,640',
+    '--force-device-scale-factor=1',
+    '--blink-settings=imagesEnabled=false',
+    '--disable-software-rasterizer',
+    '--disable-gpu-compositing',
+    '--disable-accelerated-video-decode',
+    '--disable-background-networking',
+    '--disable-component-update',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--disable-domain-reliability',
+    '--disable-client-side-phishing-detection',
+    '--disable-breakpad',
+    '--metrics-recording-only',
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--renderer-process-limit=2',
+    '--js-flags=--max-old-space-size=512',
+]
+
+LOW_RESOURCE_DISABLED_FEATURES = [
+    'Translate',
+    'MediaRouter',
+    'OptimizationHints',
+    'AutofillServerCommunication',
+    'BackForwardCache',
+    'CalculateNativeWinOcclusion',
+    'HardwareMediaKeyHandling',
+]
+
+# Injected before any page script runs: stops every remote video track as
+# soon as it arrives (so it is never decoded) and hides video/canvas
+# elements so nothing is composited
+DROP_INCOMING_VIDEO_SCRIPT = """
+(() => {
+    const NativePC = window.RTCPeerConnection;
+    if (NativePC) {
+        // A subclass keeps the prototype, instanceof checks and static
+        // methods such as RTCPeerConnection.generateCertificate
+        window.RTCPeerConnection = class RTCPeerConnection extends NativePC {
+            constructor(...args) {
+                super(...args);
+                this.addEventListener('track', (event) => {
+                    if (event.track && event.track.kind === 'video') {
+                        event.track.stop();
+                    }
+                });
+            }
+        };
+    }
+    const style = document.createElement('style');
+    style.textContent = 'video, canvas { display: none !important; }';
+    document.addEventListener('DOMContentLoaded', () => document.head.appendChild(style));
+})();
+"""
+
 
 class JoinZoomMeet:
-    def __init__(self, meetlink, start_time_utc=None, end_time_utc=None, min_record_time=3600, bot_name="Zoom Bot", presigned_url_combined=None, presigned_url_audio=None, max_waiting_time=1800, project_settings=None, custom_logger=None, bot_id=None):
+    def __init__(self, meetlink, start_time_utc=None, end_time_utc=None, min_record_time=3600, bot_name="Zoom Bot", presigned_url_combined=None, presigned_url_audio=None, max_waiting_time=1800, project_settings=None, custom_logger=None, bot_id=None, low_resource=False, rss_budget_mb=None):
         self.meeting_id, self.meeting_pwd = extract_zoom_details(meetlink)
         self.start_time_utc = start_time_utc
         self.end_time_utc = end_time_utc
@@ -46,6 +186,19 @@ class JoinZoomMeet:
         os.makedirs("out", exist_ok=True)
         self.output_file = f"out/{self.id}"
         
+        # Incremental caption/chat log (JSONL), drained periodically from the browser
+        self.captions_file = f"{self.output_file}_captions.jsonl"
+        self.caption_cursors = {key: {'index': 0, 'key': None} for key in CAPTION_SOURCES}
+        self.caption_drain_interval = 30  # seconds
+        self.last_caption_drain = None
+        
+        # Chrome footprint profile and per-bot resource accounting
+        self.low_resource = low_resource
+        self.rss_budget_mb = rss_budget_mb
+        self.resource_sampler = ProcessTreeSampler()
+        self.resource_sample_interval = 60  # seconds
+        self.last_resource_sample = None
+        
         # Cache directory for Chrome user data (will be cleaned up on session end)
         self.cache_dir = f"CueMeet{self.id}"
         
@@ -63,7 +216,8 @@ class JoinZoomMeet:
     def setup_browser(self):
         options = Options()
         options.add_argument('--headless')
-        options.add_argument('--start-maximized')
+        if not self.low_resource:
+            options.add_argument('--start-maximized')
         options.add_argument('--disable-notifications')
         options.add_argument('--disable-infobars')
         options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/127.0.0.0 Safari/537.36')
@@ -92,6 +246,12 @@ class JoinZoomMeet:
 
         # Load the extensions
         options.add_argument('--load-extension=transcript_extension')
+
+        if self.low_resource:
+            for arg in LOW_RESOURCE_CHROME_ARGS:
+                options.add_argument(arg)
+            options.add_argument(f"--disable-features={','.join(LOW_RESOURCE_DISABLED_FEATURES)}")
+            logging.info("Low-resource Chrome profile enabled")
         options.add_experimental_option("prefs", {
             "download.prompt_for_download": False,
             "download.directory_upgrade": True,
@@ -107,6 +267,11 @@ class JoinZoomMeet:
                 service=browser_service,
                 options=options
             )
+            if self.low_resource:
+                self.browser.execute_cdp_cmd(
+                    'Page.addScriptToEvaluateOnNewDocument',
+                    {'source': DROP_INCOMING_VIDEO_SCRIPT}
+                )
             self.browser.execute_script("""
                 window.alert = function() { return; }
                 window.confirm = function() { return true; }
@@ -326,6 +491,8 @@ class JoinZoomMeet:
                     logging.error(f"[END_SIGNAL] Audio file NOT found after stopping recording: {audio_file}")
                     print(f"[END_SIGNAL] ERROR: Audio file missing!", flush=True)
                 
+                self.save_resource_summary()
+                
                 # Save transcript JSON from browser localStorage
                 if self.browser:
                     try:
@@ -549,39 +716,148 @@ class JoinZoomMeet:
             logging.info("No recording was started, nothing to stop.")
 
 
-    def save_transcript(self):
+    def drain_captions(self):
+        """
+        Append caption and chat entries logged after the last drained one to the JSONL log.
+        
+        Only the new slice crosses the WebDriver bridge and nothing is kept in
+        memory afterwards, so captions are available on disk while the meeting
+        runs and survive a browser or bot crash. A last entry that changed in
+        place since the previous drain is logged again as an update record,
+        which replaces the earlier one when the transcript is saved.
+        
+        Returns:
+            int: Number of new or updated entries written
+        """
         if not self.browser:
-            logging.error("Browser is not available. Cannot save transcript.")
-            return
+            return 0
         
-        try:
-            transcript_data = self.browser.execute_script("return localStorage.getItem('transcript');")
-            chat_messages_data = self.browser.execute_script("return localStorage.getItem('chatMessages');")
-            meeting_title = self.browser.execute_script("return localStorage.getItem('meetingTitle');")
+        drained = self.browser.execute_script(DRAIN_CAPTIONS_SCRIPT, self.caption_cursors)
+        self.last_caption_drain = time.perf_counter()
+        if not drained:
+            return 0
+        
+        written = 0
+        for key, kind in CAPTION_SOURCES.items():
+            chunk = drained.get(key) or {}
+            resync = chunk.get('resync')
+            entries = chunk.get('entries') or []
+            records = [{'type': kind, 'entry': entry} for entry in entries]
+            if resync == 'edited' and records:
+                # Live captions grow in place while someone speaks
+                records[0]['update'] = True
+            elif resync == 'moved':
+                logging.warning(f"localStorage '{key}' was trimmed under the cursor, resuming after the last logged entry")
+            elif resync == 'reset':
+                logging.warning(f"localStorage '{key}' shrank and lost the last logged entry, logging it again from the start")
+            if records:
+                written += append_jsonl(self.captions_file, records)
+            if chunk.get('cursor'):
+                self.caption_cursors[key] = chunk['cursor']
+        
+        if written:
+            logging.info(f"Drained {written} new caption/chat entries to {self.captions_file}")
+        return written
+
+
+    def _write_caption_array(self, file, kind):
+        """Stream entries of one kind from the captions log into an open JSON file."""
+        # An update record replaces the entry logged just before it
+        first = True
+        pending = None
+        for record in iter_jsonl(self.captions_file):
+            if record.get('type') != kind:
+                continue
+            if pending is not None and not record.get('update'):
+                file.write('[\n    ' if first else ',\n    ')
+                file.write(json.dumps(pending.get('entry'), ensure_ascii=False))
+                first = False
+            pending = record
+        if pending is not None:
+            file.write('[\n    ' if first else ',\n    ')
+            file.write(json.dumps(pending.get('entry'), ensure_ascii=False))
+            first = False
+        file.write('null' if first else '\n  ]')
 
-            transcript = json.loads(transcript_data) if transcript_data else None
-            chat_messages = json.loads(chat_messages_data) if chat_messages_data else None
 
-            # Create a dictionary to hold all the data
-            transcript_json = {
+    def save_transcript(self):
+        meeting_title = None
+        if self.browser:
+            try:
+                # Pick up anything written since the last periodic drain
+                self.drain_captions()
+                meeting_title = self.browser.execute_script("return localStorage.getItem('meetingTitle');")
+            except Exception as e:
+                logging.error(f"Final caption drain failed, saving captured entries only: {e}")
+        else:
+            logging.warning("Browser is not available. Saving transcript from captured entries only.")
+        
+        try:
+            header = {
                 'title': meeting_title if meeting_title else None,
                 'meeting_start_time': self.event_start_time.isoformat() if self.event_start_time else None,
                 'meeting_end_time': datetime.now(timezone.utc).isoformat(),
-                'transcript': transcript,
-                'chat_messages': chat_messages,
             }
-
-            # Write the dictionary to a JSON file
+            
+            # Build the JSON file from the captions log without loading it into memory
             full_path = os.path.join(os.getcwd(), f"{self.output_file}.json")
             with open(full_path, 'w', encoding='utf-8') as file:
-                json.dump(transcript_json, file, ensure_ascii=False, indent=2)
+                file.write('{\n')
+                for key, value in header.items():
+                    file.write(f'  {json.dumps(key)}: {json.dumps(value, ensure_ascii=False)},\n')
+                file.write('  "transcript": ')
+                self._write_caption_array(file, 'transcript')
+                file.write(',\n  "chat_messages": ')
+                self._write_caption_array(file, 'chat')
+                file.write('\n}\n')
             logging.info(f"Transcript saved to {self.output_file}.json")
-        except json.JSONDecodeError as e:
-            logging.error(f"Invalid JSON format in localStorage: {e}")
         except Exception as e:
             logging.error(f"Error downloading transcript: {e}")
 
 
+    def sample_resources(self):
+        """Sample RSS/CPU of chromedriver, Chrome and FFmpeg for this bot."""
+        root_pids = []
+        try:
+            if self.browser:
+                root_pids.append(self.browser.service.process.pid)
+        except Exception:
+            pass
+        if self.recording_process:
+            root_pids.append(self.recording_process.pid)
+        
+        usage = self.resource_sampler.sample(root_pids)
+        self.last_resource_sample = time.perf_counter()
+        if not usage:
+            return None
+        
+        logging.info(
+            f"[RESOURCES] rss={usage['rss_mb']}MB cpu={usage['cpu_percent']}% "
+            f"processes={usage['processes']} low_resource={self.low_resource}"
+        )
+        if self.rss_budget_mb and usage['rss_mb'] > self.rss_budget_mb:
+            logging.warning(f"[RESOURCES] RSS {usage['rss_mb']}MB exceeds budget of {self.rss_budget_mb}MB")
+        return usage
+
+
+    def save_resource_summary(self):
+        """Write peak RSS / mean CPU for the session to out/<bot_id>_resources.json."""
+        if not self.resource_sampler.samples:
+            return
+        summary = self.resource_sampler.summary()
+        summary.update({
+            'bot_id': self.id,
+            'low_resource': self.low_resource,
+            'rss_budget_mb': self.rss_budget_mb,
+        })
+        try:
+            with open(f"{self.output_file}_resources.json", 'w', encoding='utf-8') as file:
+                json.dump(summary, file, indent=2)
+            logging.info(f"[RESOURCES] Session summary: {summary}")
+        except Exception as e:
+            logging.warning(f"Failed to write resource summary: {e}")
+
+
     def upload_files(self):
         try: 
             if self.presigned_url_combined:
@@ -636,6 +912,7 @@ class JoinZoomMeet:
                     logging.info("Transcript is saved.")
                 except Exception as e:
                     logging.error(f"Failed to save transcript: {e}")
+            self.save_resource_summary()
             time.sleep(20)
             if self.browser:
                 try:
@@ -841,6 +1118,18 @@ class JoinZoomMeet:
                 self.check_admission()
                 self.check_unmute_request()
 
+                if self.recording_started and (
+                    self.last_caption_drain is None
+                    or current_time - self.last_caption_drain >= self.caption_drain_interval
+                ):
+                    self.drain_captions()
+
+                if (
+                    self.last_resource_sample is None
+                    or current_time - self.last_resource_sample >= self.resource_sample_interval
+                ):
+                    self.sample_resources()
+
                 if self.check_waiting_room() is False:
                     # We are in the meeting
                     members = self.attendee_count()
@@ -922,7 +1211,8 @@ class ZoomBot(JoinZoomMeet):
     """Simplified Zoom bot wrapper for backward compatibility."""
     
     def __init__(self, meeting_link: str, bot_name: str = "Meeting Transcript Bot", 
-                 min_record_time: int = 7200, output_dir: str = "recordings", bot_id: str = None):
+                 min_record_time: int = 7200, output_dir: str = "recordings", bot_id: str = None,
+                 low_resource: bool = False, rss_budget_mb: int = None):
         # Call parent with compatible parameters
         super().__init__(
             meetlink=meeting_link,
@@ -933,5 +1223,7 @@ class ZoomBot(JoinZoomMeet):
             presigned_url_combined=None,
             presigned_url_audio=None,
             max_waiting_time=1800,
-            bot_id=bot_id
+            bot_id=bot_id,
+            low_resource=low_resource,
+            rss_budget_mb=rss_budget_mb
         )
\ No newline at end of file
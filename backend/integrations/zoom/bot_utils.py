@@ -5,6 +5,8 @@ Extracted from cuemeet-zoom-bot.
 
 import tarfile
 import logging
+import json
+import math
 import re
 import os
 from urllib.parse import urlparse, urlunparse
@@ -87,6 +89,128 @@ def create_tar_archive(json_file, opus_file, output_file):
     return None
 
 
+def append_jsonl(path, records):
+    """
+    Append records to a JSON Lines file, one object per line.
+    
+    The file is flushed and fsynced so captured data survives a crash
+    of the bot process or the browser.
+    
+    Args:
+        path: Path to the .jsonl file
+        records: Iterable of JSON-serializable objects
+        
+    Returns:
+        int: Number of records written
+    """
+    count = 0
+    with open(path, 'a', encoding='utf-8') as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False))
+            f.write('\n')
+            count += 1
+        f.flush()
+        os.fsync(f.fileno())
+    return count
+
+
+def iter_jsonl(path):
+    """
+    Yield records from a JSON Lines file without loading it into memory.
+    
+    Missing files yield nothing; a truncated trailing line (e.g. from a
+    crash mid-write) is skipped.
+    """
+    if not os.path.exists(path):
+        return
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                logging.warning(f"Skipping malformed line in {path}")
+
+
+class ProcessTreeSampler:
+    """
+    Samples RSS and CPU usage of a set of root processes and their children.
+    
+    Used to measure the per-bot footprint (chromedriver, Chrome renderers,
+    FFmpeg) so hosts can be packed against a known budget. Requires psutil;
+    sampling is a no-op when it is not installed.
+    """
+    
+    def __init__(self):
+        self._procs = {}
+        self.samples = 0
+        self.peak_rss_mb = 0.0
+        self.cpu_percent_total = 0.0
+        self.last = None
+    
+    def sample(self, root_pids):
+        """
+        Take one sample across the given root PIDs and all descendants.
+        
+        Args:
+            root_pids: Iterable of process IDs (None entries are ignored)
+            
+        Returns:
+            dict: {'rss_mb', 'cpu_percent', 'processes'} or None without psutil
+        """
+        try:
+            import psutil
+        except ImportError:
+            return None
+        
+        seen = {}
+        for pid in root_pids:
+            if not pid:
+                continue
+            try:
+                root = psutil.Process(pid)
+                for proc in [root] + root.children(recursive=True):
+                    # Reuse Process objects so cpu_percent() measures since the last sample
+                    seen[proc.pid] = self._procs.get(proc.pid, proc)
+            except psutil.NoSuchProcess:
+                continue
+        
+        rss = 0
+        cpu = 0.0
+        for proc in seen.values():
+            try:
+                rss += proc.memory_info().rss
+                cpu += proc.cpu_percent(interval=None)
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        self._procs = seen
+        
+        rss_mb = rss / (1024 * 1024)
+        self.samples += 1
+        self.peak_rss_mb = max(self.peak_rss_mb, rss_mb)
+        self.cpu_percent_total += cpu
+        self.last = {'rss_mb': round(rss_mb, 1), 'cpu_percent': round(cpu, 1), 'processes': len(seen)}
+        return self.last
+    
+    def summary(self):
+        """
+        Return peak RSS and mean CPU over all samples taken so far.
+        
+        suggested_rss_budget_mb is the measured peak plus 20% headroom,
+        rounded up to 10 MB: the value to use for ZOOM_BOT_RSS_BUDGET_MB
+        after a representative meeting.
+        """
+        return {
+            'samples': self.samples,
+            'peak_rss_mb': round(self.peak_rss_mb, 1),
+            'suggested_rss_budget_mb': int(math.ceil(self.peak_rss_mb * 1.2 / 10) * 10) if self.samples else None,
+            'avg_cpu_percent': round(self.cpu_percent_total / self.samples, 1) if self.samples else 0.0,
+            'last': self.last,
+        }
+
+
 def audio_file_path(audio_file):
     """Get full path to audio file."""
     return os.path.join(os.getcwd(), audio_file)
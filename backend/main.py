@@ -146,16 +146,22 @@
 import os
 import shutil
 import uuid
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, Dict
 
 from fastapi import FastAPI, File, UploadFile, HTTPException, Depends, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from core.compression import CompressionMiddleware
 from core.config import settings
-from database.base import Base, engine, get_db
-from domains.auth.utils import get_current_active_user
+from core.responses import ORJSONResponse
+from core.security import shutdown_password_hasher
+from database.base import Base, engine, get_db, get_async_db
+from domains.auth.utils import get_current_active_user, get_current_active_user_async
 from domains.user.model import User
 from api.auth import router as auth_router
 from api.users import router as users_router
@@ -165,18 +171,34 @@ from domains.zoom_resume.transcript.whisper import transcribe_audio_file
 from domains.zoom_resume.transcript.model import Transcript, TranscriptStatus
 
 # 
-from domains.zoom_resume.transcript.service import TranscriptService
+from domains.zoom_resume.transcript.service import TranscriptService, AsyncTranscriptService
 from workers.meeting.transcribe_worker import enqueue_transcript
+from workers.meeting.audio_retention_worker import start_audio_retention_sweeper
 
 
 
 # Create database tables
 Base.metadata.create_all(bind=engine)
 
+# Full-text search structures (FTS5 table / tsvector column) are not ORM tables
+from domains.zoom_resume.transcript.search import TranscriptSearchService
+with engine.begin() as conn:
+    TranscriptSearchService.ensure_index(conn)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Purge meeting audio past AUDIO_RETENTION_DAYS in the background
+    start_audio_retention_sweeper()
+    yield
+    shutdown_password_hasher()
+
+
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
-    debug=settings.DEBUG
+    debug=settings.DEBUG,
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # CORS Configuration
@@ -188,6 +210,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# br/gzip for large JSON payloads (transcripts, segment streams)
+app.add_middleware(CompressionMiddleware)
+
 # Include routers
 app.include_router(auth_router)
 app.include_router(users_router)
@@ -198,6 +223,12 @@ UPLOAD_DIR = Path("uploads")
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def _save_upload_file(upload: UploadFile, file_path: Path) -> None:
+    """Copy an UploadFile to disk (blocking; run in the threadpool)."""
+    with file_path.open("wb") as buffer:
+        shutil.copyfileobj(upload.file, buffer)
+
+
 @app.get("/")
 def root():
     return {
@@ -228,8 +259,8 @@ def get_latest_transcript(
 @app.post("/transcribe")
 async def transcribe_endpoint(
     file: UploadFile = File(...),
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_active_user)
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_active_user_async)
 ) -> Dict[str, Any]:
     """
     Legacy endpoint for transcription.
@@ -238,7 +269,6 @@ async def transcribe_endpoint(
     For immediate results, use this endpoint.
     For async processing with status tracking, use POST /transcripts/upload.
     """
-    from domains.zoom_resume.transcript.service import TranscriptService
     from workers.meeting.transcribe_worker import enqueue_transcript
     
     # Validate file extension
@@ -253,18 +283,17 @@ async def transcribe_endpoint(
 
     try:
         # Save uploaded file
-        with file_path.open("wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        await run_in_threadpool(_save_upload_file, file, file_path)
 
         # Create transcript record in database
-        transcript = TranscriptService.create_transcript(
+        transcript = await AsyncTranscriptService.create_transcript(
             db,
             user_id=current_user.id,
             audio_url=str(file_path)
         )
         
         # Update status to PROCESSING
-        TranscriptService.update_status(db, transcript.id, TranscriptStatus.PROCESSING)
+        await AsyncTranscriptService.update_status(db, transcript.id, TranscriptStatus.PROCESSING)
         
         # Enqueue for async processing (background worker)
         enqueue_transcript(transcript.id)
@@ -290,7 +319,7 @@ async def transcribe_endpoint(
         # Unexpected error - update transcript if exists
         if transcript:
             try:
-                TranscriptService.update_status(
+                await AsyncTranscriptService.update_status(
                     db,
                     transcript.id,
                     TranscriptStatus.FAILED,
@@ -314,7 +343,7 @@ async def transcribe_endpoint(
 async def upload_meeting_audio(
     audio: UploadFile = File(...),
     meeting_id: str = File(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     Endpoint untuk Node.js Zoom Bot
@@ -336,18 +365,17 @@ async def upload_meeting_audio(
 
     try:
         # save file
-        with file_path.open("wb") as buffer:
-            shutil.copyfileobj(audio.file, buffer)
+        await run_in_threadpool(_save_upload_file, audio, file_path)
 
         # create transcript DB entry
-        transcript = TranscriptService.create_transcript(
+        transcript = await AsyncTranscriptService.create_transcript(
             db=db,
             user_id=1,  # meeting bot (no user)
             audio_url=str(file_path)
         )
 
         # update status
-        TranscriptService.update_status(
+        await AsyncTranscriptService.update_status(
             db,
             transcript.id,
             TranscriptStatus.PROCESSING
@@ -365,7 +393,7 @@ async def upload_meeting_audio(
 
     except Exception as e:
         if transcript:
-            TranscriptService.update_status(
+            await AsyncTranscriptService.update_status(
                 db,
                 transcript.id,
                 TranscriptStatus.FAILED,
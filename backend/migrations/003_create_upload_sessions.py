@@ -0,0 +1,60 @@
+"""
+Database migration: Create upload_sessions table (resumable uploads)
+
+Revision ID: 003
+Create Date: 2026-10-19
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import text
+from database.base import engine
+
+
+def upgrade():
+    """Create upload_sessions table."""
+    with engine.connect() as conn:
+        conn.execute(text("""
+            CREATE TABLE IF NOT EXISTS upload_sessions (
+                id VARCHAR(32) PRIMARY KEY,
+                user_id INTEGER NOT NULL,
+                filename VARCHAR(255) NOT NULL,
+                file_path VARCHAR(500) NOT NULL,
+                upload_length BIGINT NOT NULL,
+                upload_offset BIGINT NOT NULL DEFAULT 0,
+                expires_at TIMESTAMP NOT NULL,
+                created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+            )
+        """))
+        
+        # Create indexes
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_upload_sessions_user_id ON upload_sessions(user_id)
+        """))
+        
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_upload_sessions_expires_at ON upload_sessions(expires_at)
+        """))
+        
+        conn.commit()
+        print("✅ Upload sessions table created successfully")
+
+
+def downgrade():
+    """Drop upload_sessions table."""
+    with engine.connect() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS upload_sessions"))
+        conn.commit()
+        print("✅ Upload sessions table dropped")
+
+
+if __name__ == "__main__":
+    print("Running migration: Create upload_sessions table")
+    upgrade()
@@ -0,0 +1,61 @@
+"""
+Database migration: Keyset pagination index and segments_count for transcript lists
+
+Revision ID: 004
+Create Date: 2026-10-19
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import inspect, text
+from database.base import engine
+
+
+def upgrade():
+    """Add transcripts.segments_count and the (user_id, created_at, id) index."""
+    columns = {c["name"] for c in inspect(engine).get_columns("transcripts")}
+    
+    with engine.connect() as conn:
+        if "segments_count" not in columns:
+            conn.execute(text("ALTER TABLE transcripts ADD COLUMN segments_count INTEGER"))
+        
+        # Backfill from existing segment arrays
+        if engine.dialect.name == "postgresql":
+            conn.execute(text("""
+                UPDATE transcripts
+                SET segments_count = json_array_length(segments_json)
+                WHERE segments_count IS NULL AND json_typeof(segments_json) = 'array'
+            """))
+        else:
+            conn.execute(text("""
+                UPDATE transcripts
+                SET segments_count = json_array_length(segments_json)
+                WHERE segments_count IS NULL AND json_type(segments_json) = 'array'
+            """))
+        
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_transcripts_user_created_id
+            ON transcripts(user_id, created_at DESC, id DESC)
+        """))
+        
+        conn.commit()
+        print("✅ Transcript list index and segments_count added successfully")
+
+
+def downgrade():
+    """Drop the keyset index and segments_count column."""
+    with engine.connect() as conn:
+        conn.execute(text("DROP INDEX IF EXISTS idx_transcripts_user_created_id"))
+        conn.execute(text("ALTER TABLE transcripts DROP COLUMN segments_count"))
+        conn.commit()
+        print("✅ Transcript list index and segments_count dropped")
+
+
+if __name__ == "__main__":
+    print("Running migration: Transcript list keyset pagination")
+    upgrade()
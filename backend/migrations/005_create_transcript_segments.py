@@ -0,0 +1,98 @@
+"""
+Database migration: Create transcript_segments table and backfill from segments_json
+
+Revision ID: 005
+Create Date: 2026-10-19
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import text
+from database.base import engine
+
+BACKFILL_BATCH = 1000
+# Transcripts (each with its whole segments_json) held in memory at a time
+BACKFILL_FETCH = 50
+
+
+def upgrade():
+    """Create transcript_segments table and copy existing segments into it."""
+    id_column = "BIGSERIAL PRIMARY KEY" if engine.dialect.name == "postgresql" else "INTEGER PRIMARY KEY AUTOINCREMENT"
+    
+    with engine.connect() as conn:
+        conn.execute(text(f"""
+            CREATE TABLE IF NOT EXISTS transcript_segments (
+                id {id_column},
+                transcript_id INTEGER NOT NULL,
+                seq INTEGER NOT NULL,
+                start_time FLOAT NOT NULL,
+                end_time FLOAT NOT NULL,
+                speaker VARCHAR(50),
+                text TEXT NOT NULL,
+                FOREIGN KEY (transcript_id) REFERENCES transcripts(id) ON DELETE CASCADE
+            )
+        """))
+        
+        # Create indexes
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS idx_transcript_segments_transcript_start
+            ON transcript_segments(transcript_id, start_time)
+        """))
+        
+        # Backfill transcripts that have segments_json but no rows yet,
+        # fetched through a server-side cursor a few transcripts at a time
+        pending = conn.execution_options(yield_per=BACKFILL_FETCH).execute(text("""
+            SELECT t.id, t.segments_json FROM transcripts t
+            WHERE t.segments_json IS NOT NULL
+              AND NOT EXISTS (SELECT 1 FROM transcript_segments s WHERE s.transcript_id = t.id)
+        """))
+        
+        insert = text("""
+            INSERT INTO transcript_segments (transcript_id, seq, start_time, end_time, speaker, text)
+            VALUES (:transcript_id, :seq, :start_time, :end_time, :speaker, :text)
+        """)
+        
+        rows = []
+        backfilled = 0
+        for transcript_id, segments in pending:
+            if isinstance(segments, str):
+                segments = json.loads(segments)
+            if not isinstance(segments, list):
+                continue
+            for index, seg in enumerate(segments):
+                rows.append({
+                    "transcript_id": transcript_id,
+                    "seq": seg.get("id", index),
+                    "start_time": float(seg.get("start", 0.0)),
+                    "end_time": float(seg.get("end", 0.0)),
+                    "speaker": seg.get("speaker"),
+                    "text": seg.get("text", "")
+                })
+            backfilled += 1
+            if len(rows) >= BACKFILL_BATCH:
+                conn.execute(insert, rows)
+                rows = []
+        if rows:
+            conn.execute(insert, rows)
+        
+        conn.commit()
+        print(f"✅ Transcript segments table created ({backfilled} transcripts backfilled)")
+
+
+def downgrade():
+    """Drop transcript_segments table."""
+    with engine.connect() as conn:
+        conn.execute(text("DROP TABLE IF EXISTS transcript_segments"))
+        conn.commit()
+        print("✅ Transcript segments table dropped")
+
+
+if __name__ == "__main__":
+    print("Running migration: Create transcript_segments table")
+    upgrade()
@@ -0,0 +1,57 @@
+"""
+Database migration: Create the transcript search index and backfill it
+
+SQLite gets an FTS5 virtual table, PostgreSQL a tsvector column with a
+GIN index on transcript_segments (see transcript/search.py).
+
+Revision ID: 006
+Create Date: 2026-10-19
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import text
+from database.base import engine
+from domains.zoom_resume.transcript.search import SEARCH_BACKEND, TranscriptSearchService
+
+
+def upgrade():
+    """Create search structures and index every transcript that has segments."""
+    with engine.connect() as conn:
+        TranscriptSearchService.ensure_index(conn)
+        
+        transcripts = conn.execute(text("""
+            SELECT t.id, t.user_id FROM transcripts t
+            WHERE EXISTS (SELECT 1 FROM transcript_segments s WHERE s.transcript_id = t.id)
+        """)).fetchall()
+        
+        indexed = 0
+        for transcript_id, user_id in transcripts:
+            # Re-running the migration rebuilds entries instead of duplicating them
+            TranscriptSearchService.remove_transcript(conn, transcript_id)
+            indexed += TranscriptSearchService.index_transcript(conn, transcript_id, user_id)
+        
+        conn.commit()
+        print(f"✅ Transcript search index created ({indexed} segments from {len(transcripts)} transcripts)")
+
+
+def downgrade():
+    """Drop the transcript search index."""
+    with engine.connect() as conn:
+        if SEARCH_BACKEND == "postgresql":
+            conn.execute(text("DROP INDEX IF EXISTS idx_transcript_segments_search"))
+            conn.execute(text("ALTER TABLE transcript_segments DROP COLUMN IF EXISTS search_vector"))
+        else:
+            conn.execute(text("DROP TABLE IF EXISTS transcript_search"))
+        conn.commit()
+        print("✅ Transcript search index dropped")
+
+
+if __name__ == "__main__":
+    print("Running migration: Create transcript search index")
+    upgrade()
@@ -0,0 +1,65 @@
+"""
+Database migration: Add audio_expires_at to transcripts for audio retention
+
+Revision ID: 007
+Create Date: 2026-10-19
+"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path for imports
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import inspect, text
+from core.config import settings
+from database.base import engine
+
+
+def upgrade():
+    """Add audio_expires_at and give retained audio of finished transcripts an expiry."""
+    columns = {c["name"] for c in inspect(engine).get_columns("transcripts")}
+    
+    with engine.connect() as conn:
+        if "audio_expires_at" not in columns:
+            conn.execute(text("ALTER TABLE transcripts ADD COLUMN audio_expires_at TIMESTAMP"))
+        conn.execute(text("""
+            CREATE INDEX IF NOT EXISTS ix_transcripts_audio_expires_at
+            ON transcripts(audio_expires_at)
+        """))
+        
+        # Files that survived the old delete-after-transcription default
+        retained = 0
+        if settings.AUDIO_RETENTION_DAYS:
+            expires_at = datetime.utcnow() + timedelta(days=settings.AUDIO_RETENTION_DAYS)
+            done = conn.execute(text("""
+                SELECT id, audio_url FROM transcripts
+                WHERE status = 'DONE' AND audio_expires_at IS NULL
+            """)).fetchall()
+            keep = [{"id": transcript_id, "expires_at": expires_at}
+                    for transcript_id, audio_url in done if Path(audio_url).exists()]
+            if keep:
+                conn.execute(
+                    text("UPDATE transcripts SET audio_expires_at = :expires_at WHERE id = :id"),
+                    keep
+                )
+            retained = len(keep)
+        
+        conn.commit()
+        print(f"✅ Audio retention column added ({retained} retained files scheduled for purge)")
+
+
+def downgrade():
+    """Remove audio_expires_at."""
+    with engine.connect() as conn:
+        conn.execute(text("DROP INDEX IF EXISTS ix_transcripts_audio_expires_at"))
+        conn.execute(text("ALTER TABLE transcripts DROP COLUMN audio_expires_at"))
+        conn.commit()
+        print("✅ Audio retention column removed")
+
+
+if __name__ == "__main__":
+    print("Running migration: Add audio retention")
+    upgrade()
@@ -28,6 +28,8 @@ def main():
     parser.add_argument('--bot-name', default='Meeting Transcript Bot', help='Bot display name')
     parser.add_argument('--duration', type=int, default=7200, help='Max recording duration in seconds')
     parser.add_argument('--output-dir', default='storage/zoom_recordings', help='Output directory')
+    parser.add_argument('--low-resource', action='store_true', help='Use the low-resource Chrome profile (no video, capped renderers)')
+    parser.add_argument('--rss-budget-mb', type=int, default=None, help='Warn when bot RSS (Chrome + FFmpeg) exceeds this many MB')
     
     args = parser.parse_args()
     
@@ -47,7 +49,9 @@ def main():
             bot_name=args.bot_name,
             min_record_time=args.duration,
             output_dir=args.output_dir,
-            bot_id=args.bot_id  # Pass bot_id if provided
+            bot_id=args.bot_id,  # Pass bot_id if provided
+            low_resource=args.low_resource,
+            rss_budget_mb=args.rss_budget_mb
         )
         
         logger.info(f"Bot ID: {bot.id}")
@@ -7,9 +7,18 @@ from unittest.mock import MagicMock, Mock
 from sqlalchemy.orm import Session
 
 from domains.user.model import User
+from domains.user.cache import clear_user_cache
 from core.config import settings
 
 
+@pytest.fixture(autouse=True)
+def _isolate_user_cache():
+    """Keep cached users from leaking between tests."""
+    clear_user_cache()
+    yield
+    clear_user_cache()
+
+
 @pytest.fixture
 def mock_db_session():
     """Mock SQLAlchemy database session."""
@@ -0,0 +1,138 @@
+"""
+Unit tests for api/zoom_transcript/audio_preprocess.py
+Tests the streaming ffmpeg decoder and fixed-size framing.
+"""
+import io
+import subprocess
+import sys
+import threading
+
+import numpy as np
+import pytest
+
+from api.zoom_transcript import audio_preprocess
+from api.zoom_transcript.audio_preprocess import frames, stream_pcm
+
+
+class _FakeFfmpeg:
+    """Stands in for the ffmpeg process: serves PCM bytes on stdout."""
+
+    def __init__(self, pcm, returncode=0):
+        self.stdout = io.BytesIO(pcm)
+        self.stderr = None
+        self.returncode = None
+        self._exit = returncode
+        self.killed = False
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self):
+        if self._exit and self.returncode is None:
+            self.stderr.write(b"decode error")
+        self.returncode = self._exit
+        return self.returncode
+
+    def kill(self):
+        self.killed = True
+        self._exit = -9
+
+
+@pytest.fixture
+def fake_ffmpeg(monkeypatch):
+    def install(pcm, returncode=0):
+        process = _FakeFfmpeg(pcm, returncode)
+
+        def popen(cmd, stdout, stderr):
+            process.stderr = stderr
+            return process
+
+        monkeypatch.setattr(audio_preprocess.subprocess, "Popen", popen)
+        return process
+    return install
+
+
+class TestStreamPcm:
+    """Tests for stream_pcm."""
+
+    def test_yields_bounded_windows(self, fake_ffmpeg):
+        """Verify the decoded audio arrives in windows of the requested size."""
+        # Arrange: 10 samples at 4 Hz with 1 s windows -> 4 + 4 + 2
+        fake_ffmpeg(np.arange(10, dtype=np.int16).tobytes())
+
+        # Act
+        windows = list(stream_pcm("meeting.m4a", sampling_rate=4, window_seconds=1.0))
+
+        # Assert
+        assert [len(w) for w in windows] == [4, 4, 2]
+        assert windows[0].dtype == np.float32
+        assert np.concatenate(windows) * 32768 == pytest.approx(np.arange(10))
+
+    def test_ffmpeg_failure_raises(self, fake_ffmpeg):
+        """Verify a failing decode is reported like subprocess.run(check=True)."""
+        # Arrange
+        fake_ffmpeg(b"", returncode=1)
+
+        # Act & Assert
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            list(stream_pcm("broken.m4a"))
+        assert exc_info.value.stderr == b"decode error"
+
+    def test_noisy_stderr_does_not_block(self, monkeypatch):
+        """Verify a decoder writing more warnings than a pipe holds still streams."""
+        # Arrange: a real child writes 1 MiB to stderr before any audio
+        script = (
+            "import sys; sys.stderr.buffer.write(b'w' * (1 << 20)); sys.stderr.flush(); "
+            "sys.stdout.buffer.write(bytes(8))"
+        )
+        popen = subprocess.Popen
+        monkeypatch.setattr(
+            audio_preprocess.subprocess, "Popen",
+            lambda cmd, **kwargs: popen([sys.executable, "-c", script], **kwargs)
+        )
+        windows = []
+        reader = threading.Thread(target=lambda: windows.extend(stream_pcm("noisy.m4a")), daemon=True)
+
+        # Act
+        reader.start()
+        reader.join(timeout=10)
+
+        # Assert
+        assert not reader.is_alive()
+        assert sum(len(w) for w in windows) == 4
+
+    def test_stopping_early_kills_ffmpeg(self, fake_ffmpeg):
+        """Verify an abandoned stream does not leave ffmpeg running."""
+        # Arrange
+        process = fake_ffmpeg(np.zeros(100, dtype=np.int16).tobytes())
+        stream = stream_pcm("meeting.m4a", sampling_rate=10, window_seconds=1.0)
+
+        # Act
+        next(stream)
+        stream.close()
+
+        # Assert
+        assert process.killed
+
+
+class TestFrames:
+    """Tests for frames."""
+
+    def test_carries_samples_across_windows(self):
+        """Verify frames spanning a window boundary keep their samples in order."""
+        # Arrange
+        windows = [np.arange(0, 5, dtype=np.float32), np.arange(5, 9, dtype=np.float32)]
+
+        # Act
+        result = [f.tolist() for f in frames(windows, frame_size=3)]
+
+        # Assert
+        assert result == [[0, 1, 2], [3, 4, 5], [6, 7, 8]]
+
+    def test_last_frame_is_zero_padded(self):
+        """Verify a partial final frame is padded to the frame size."""
+        # Act
+        result = [f.tolist() for f in frames([np.ones(4, dtype=np.float32)], frame_size=3)]
+
+        # Assert
+        assert result == [[1, 1, 1], [1, 0, 0]]
@@ -4,10 +4,11 @@ Tests authentication business logic including signup, login, OTP verification, a
 """
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from sqlalchemy.orm import Session
+import asyncio
 
-from domains.auth.service import AuthService
+from domains.auth.service import AuthService, AsyncAuthService
 from domains.auth.schemas import SignupRequest, LoginRequest, OTPVerifyRequest
 from domains.user.schemas import UserCreate
 from core.exceptions import (
@@ -223,6 +224,72 @@ class TestAuthServiceLogin:
             AuthService.login(mock_db, login_data)
 
 
+class TestAsyncAuthServiceLogin:
+    """Tests for async login (password hashing pool, rehash on login)."""
+    
+    @staticmethod
+    def _user():
+        mock_user = Mock()
+        mock_user.hashed_password = "old_hash"
+        mock_user.is_verified = True
+        mock_user.is_active = True
+        mock_user.id = 1
+        mock_user.email = "test@example.com"
+        return mock_user
+    
+    @patch('domains.auth.service.verify_and_update_password_async', new_callable=AsyncMock)
+    @patch('domains.auth.service.AsyncUserService.get_by_email', new_callable=AsyncMock)
+    def test_login_rehashes_outdated_password(self, mock_get_by_email, mock_verify):
+        """Verify a hash below BCRYPT_ROUNDS is replaced on successful login."""
+        # Arrange
+        mock_db = AsyncMock()
+        mock_user = self._user()
+        mock_get_by_email.return_value = mock_user
+        mock_verify.return_value = (True, "new_hash")
+        login_data = LoginRequest(email="test@example.com", password="password123")
+        
+        # Act
+        result = asyncio.run(AsyncAuthService.login(mock_db, login_data))
+        
+        # Assert
+        assert result.access_token
+        assert mock_user.hashed_password == "new_hash"
+        mock_db.commit.assert_awaited_once()
+    
+    @patch('domains.auth.service.verify_and_update_password_async', new_callable=AsyncMock)
+    @patch('domains.auth.service.AsyncUserService.get_by_email', new_callable=AsyncMock)
+    def test_login_keeps_current_hash(self, mock_get_by_email, mock_verify):
+        """Verify nothing is written when the hash is up to date."""
+        # Arrange
+        mock_db = AsyncMock()
+        mock_user = self._user()
+        mock_get_by_email.return_value = mock_user
+        mock_verify.return_value = (True, None)
+        login_data = LoginRequest(email="test@example.com", password="password123")
+        
+        # Act
+        asyncio.run(AsyncAuthService.login(mock_db, login_data))
+        
+        # Assert
+        assert mock_user.hashed_password == "old_hash"
+        mock_db.commit.assert_not_awaited()
+    
+    @patch('domains.auth.service.verify_and_update_password_async', new_callable=AsyncMock)
+    @patch('domains.auth.service.AsyncUserService.get_by_email', new_callable=AsyncMock)
+    def test_login_with_invalid_password_raises_error(self, mock_get_by_email, mock_verify):
+        """Verify a wrong password never triggers a rehash."""
+        # Arrange
+        mock_db = AsyncMock()
+        mock_get_by_email.return_value = self._user()
+        mock_verify.return_value = (False, None)
+        login_data = LoginRequest(email="test@example.com", password="wrongpassword")
+        
+        # Act & Assert
+        with pytest.raises(InvalidCredentialsError):
+            asyncio.run(AsyncAuthService.login(mock_db, login_data))
+        mock_db.commit.assert_not_awaited()
+
+
 class TestAuthServiceTokenRefresh:
     """Tests for token refresh functionality."""
     
@@ -0,0 +1,112 @@
+"""
+Unit tests for api/zoom_transcript/cleanup.py
+Tests word-boundary filler removal, per-language lexicons, and segment cleanup.
+"""
+from types import SimpleNamespace
+
+from api.zoom_transcript.cleanup import (
+    build_filler_pattern,
+    clean_segments,
+    remove_fillers,
+    remove_fillers_batch,
+)
+
+
+def _segment(text, start=0.0, end=1.0, avg_logprob=-0.2, no_speech_prob=0.01, words=None):
+    return SimpleNamespace(
+        text=text, start=start, end=end,
+        avg_logprob=avg_logprob, no_speech_prob=no_speech_prob, words=words
+    )
+
+
+class TestRemoveFillers:
+    """Tests for the compiled filler matcher."""
+    
+    def test_keeps_fillers_inside_words(self):
+        """Verify "em"/"ee" inside real words are not removed."""
+        assert remove_fillers("pemerintah menyetujui deem") == "pemerintah menyetujui deem"
+    
+    def test_removes_standalone_fillers(self):
+        """Verify fillers are removed with their trailing space."""
+        assert remove_fillers("kita hmm perlu emm membahas") == "kita perlu membahas"
+    
+    def test_prefers_longest_phrase(self):
+        """Verify multi-word fillers win over their single-word prefix."""
+        assert remove_fillers("jadi anu ya begitu") == "jadi begitu"
+    
+    def test_case_insensitive_with_comma(self):
+        """Verify capitalised fillers and their comma are removed."""
+        assert remove_fillers("Eee, jadi begini") == "jadi begini"
+    
+    def test_tidies_punctuation(self):
+        """Verify no dangling comma or space is left before punctuation."""
+        assert remove_fillers("jadi, eee.") == "jadi."
+        assert remove_fillers("saya, eee, setuju") == "saya, setuju"
+    
+    def test_language_lexicon(self):
+        """Verify the lexicon follows the language and unknown languages are untouched."""
+        assert remove_fillers("um so I mean yes", language="en") == "so yes"
+        assert remove_fillers("eee oke", language="xx") == "eee oke"
+    
+    def test_custom_lexicon(self):
+        """Verify a caller-provided lexicon replaces the language default."""
+        assert remove_fillers("gimana ya eee", fillers=["gimana ya"]) == "eee"
+    
+    def test_empty_lexicon_compiles_to_none(self):
+        """Verify an empty lexicon yields no pattern."""
+        assert build_filler_pattern([]) is None
+    
+    def test_batch_keeps_segments_separate(self):
+        """Verify matches never span two texts."""
+        # Act
+        result = remove_fillers_batch(["kita anu", "ya setuju", "hmm"])
+        
+        # Assert
+        assert result == ["kita", "ya setuju", ""]
+
+
+class TestCleanSegments:
+    """Tests for clean_segments."""
+    
+    def test_filters_low_confidence_and_cleans_text(self):
+        """Verify unreliable segments are dropped and text is normalised."""
+        # Arrange
+        segments = [
+            _segment("eee jadi kita mulai"),
+            _segment("noise", avg_logprob=-2.0),
+            _segment("silence", no_speech_prob=0.9),
+            _segment("hmm"),
+        ]
+        
+        # Act
+        result = clean_segments(segments)
+        
+        # Assert
+        assert [s["text"] for s in result] == ["Jadi kita mulai."]
+    
+    def test_drops_punctuated_whisper_fillers(self):
+        """Verify capitalised, punctuated filler-only segments leave no punctuation behind."""
+        # Arrange: Whisper text has a leading space, capitals and punctuation
+        segments = [
+            _segment(" Hmm."),
+            _segment(" Eee..."),
+            _segment(" Apa itu?"),
+            _segment(" Eee, kenapa anggarannya naik?"),
+        ]
+        
+        # Act
+        result = clean_segments(segments)
+        
+        # Assert
+        assert [s["text"] for s in result] == ["Kenapa anggarannya naik?"]
+    
+    def test_keeps_word_timestamps(self):
+        """Verify word timestamps are carried over for speaker alignment."""
+        # Arrange
+        words = [SimpleNamespace(start=0.123, end=0.456, word=" halo")]
+        
+        # Act
+        result = clean_segments([_segment("halo", words=words)])
+        
+        # Assert
+        assert result[0]["words"] == [{"start": 0.12, "end": 0.46, "word": " halo"}]
@@ -0,0 +1,99 @@
+"""
+Unit tests for core/compression.py
+Tests Accept-Encoding negotiation and the compression middleware.
+"""
+import gzip
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from core import compression
+from core.compression import CompressionMiddleware, compress_body, negotiate_encoding
+
+LARGE_BODY = b'{"text": "halo semua"}' * 200
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware)
+
+    @app.get("/large")
+    def large():
+        return PlainTextResponse(LARGE_BODY, media_type="application/json")
+
+    @app.get("/small")
+    def small():
+        return PlainTextResponse(b'{"ok": true}', media_type="application/json")
+
+    @app.get("/events")
+    def events():
+        return StreamingResponse(iter([LARGE_BODY]), media_type="text/event-stream")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([LARGE_BODY, LARGE_BODY]), media_type="application/x-ndjson")
+
+    return TestClient(app)
+
+
+class TestNegotiateEncoding:
+    """Tests for Accept-Encoding parsing."""
+
+    def test_prefers_brotli_when_available(self, monkeypatch):
+        """Verify br wins over gzip at equal quality when brotli is installed."""
+        monkeypatch.setattr(compression, "brotli", object())
+        assert negotiate_encoding("gzip, deflate, br") == "br"
+
+    def test_falls_back_to_gzip_without_brotli(self, monkeypatch):
+        """Verify gzip is used when the optional brotli package is missing."""
+        monkeypatch.setattr(compression, "brotli", None)
+        assert negotiate_encoding("gzip, deflate, br") == "gzip"
+
+    def test_respects_quality_values(self, monkeypatch):
+        """Verify q=0 excludes an encoding and higher q wins."""
+        monkeypatch.setattr(compression, "brotli", object())
+        assert negotiate_encoding("br;q=0, gzip") == "gzip"
+        assert negotiate_encoding("br;q=0.5, gzip;q=0.8") == "gzip"
+        assert negotiate_encoding("identity") is None
+        assert negotiate_encoding(None) is None
+
+
+class TestCompressionMiddleware:
+    """Tests for response compression."""
+
+    def test_compresses_large_json_with_gzip(self, client):
+        """Verify large bodies are gzip-encoded with Vary and a correct length."""
+        # Act
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        # Assert
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) < len(LARGE_BODY) // 5
+        assert response.content == LARGE_BODY
+
+    def test_skips_small_bodies_and_event_streams(self, client):
+        """Verify tiny responses and SSE are sent unencoded."""
+        # Act
+        small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+        events = client.get("/events", headers={"Accept-Encoding": "gzip"})
+
+        # Assert
+        assert "content-encoding" not in small.headers
+        assert "content-encoding" not in events.headers
+
+    def test_compresses_streaming_responses(self, client):
+        """Verify streamed chunks form one valid gzip stream."""
+        # Act
+        response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+        # Assert
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.content == LARGE_BODY * 2
+
+    def test_compress_body_round_trips(self):
+        """Verify pre-compressed bodies decode to the original."""
+        assert gzip.decompress(compress_body(LARGE_BODY, "gzip")) == LARGE_BODY
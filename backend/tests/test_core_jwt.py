@@ -10,9 +10,11 @@ from jose import jwt
 from core.jwt import (
     create_access_token,
     create_refresh_token,
+    create_stream_token,
     decode_token,
     verify_access_token,
-    verify_refresh_token
+    verify_refresh_token,
+    verify_stream_token
 )
 from core.exceptions import InvalidTokenError
 from core.config import settings
@@ -144,3 +146,35 @@ class TestTokenTypeVerification:
             verify_refresh_token(token)
         
         assert "Invalid token type" in str(exc_info.value)
+    
+    def test_verify_stream_token_accepts_its_transcript(self):
+        """Verify a stream token passes for the transcript it was issued for."""
+        token = create_stream_token(123, 7)
+        
+        payload = verify_stream_token(token, 7)
+        
+        assert payload["sub"] == "123"
+        assert payload["type"] == "stream"
+    
+    def test_verify_stream_token_rejects_other_transcript(self):
+        """Verify a stream token is scoped to one transcript."""
+        token = create_stream_token(123, 7)
+        
+        with pytest.raises(InvalidTokenError):
+            verify_stream_token(token, 8)
+    
+    def test_verify_stream_token_rejects_access_token(self):
+        """Verify access tokens are not accepted where stream tokens are expected."""
+        token = create_access_token({"sub": "123", "tid": 7})
+        
+        with pytest.raises(InvalidTokenError) as exc_info:
+            verify_stream_token(token, 7)
+        
+        assert "Invalid token type" in str(exc_info.value)
+    
+    def test_access_verification_rejects_stream_token(self):
+        """Verify a leaked stream token cannot be used as an access token."""
+        token = create_stream_token(123, 7)
+        
+        with pytest.raises(InvalidTokenError):
+            verify_access_token(token)
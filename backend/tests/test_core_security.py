@@ -3,7 +3,21 @@ Unit tests for core/security.py
 Tests password hashing, verification, and OTP generation.
 """
 import pytest
-from core.security import hash_password, verify_password, generate_otp, generate_random_token
+from unittest.mock import patch
+import asyncio
+
+from passlib.context import CryptContext
+
+from core.security import (
+    hash_password,
+    verify_password,
+    verify_and_update_password,
+    hash_password_async,
+    verify_password_async,
+    shutdown_password_hasher,
+    generate_otp,
+    generate_random_token,
+)
 
 
 class TestPasswordHashing:
@@ -48,6 +62,59 @@ class TestPasswordHashing:
         assert result is False
 
 
+class TestPasswordRehash:
+    """Tests for cost upgrades on verification."""
+    
+    def test_weaker_hash_is_upgraded(self):
+        """Verify a hash with fewer rounds than configured gets a replacement."""
+        weak_hash = CryptContext(schemes=["bcrypt"], bcrypt__default_rounds=4).hash("secret")
+        
+        valid, new_hash = verify_and_update_password("secret", weak_hash)
+        
+        assert valid is True
+        assert new_hash is not None and new_hash != weak_hash
+        assert verify_password("secret", new_hash)
+    
+    def test_current_hash_is_kept(self):
+        """Verify no rehash for hashes at the configured cost."""
+        valid, new_hash = verify_and_update_password("secret", hash_password("secret"))
+        
+        assert valid is True
+        assert new_hash is None
+    
+    def test_wrong_password_is_not_rehashed(self):
+        """Verify failed verification never returns a new hash."""
+        weak_hash = CryptContext(schemes=["bcrypt"], bcrypt__default_rounds=4).hash("secret")
+        
+        assert verify_and_update_password("wrong", weak_hash) == (False, None)
+
+
+class TestPasswordHashingPool:
+    """Tests for the async password hashing interface."""
+    
+    def test_hash_and_verify_in_worker_process(self):
+        """Verify hashes produced by the process pool verify as usual."""
+        try:
+            hashed = asyncio.run(hash_password_async("pooled"))
+            valid = asyncio.run(verify_password_async("pooled", hashed))
+        finally:
+            shutdown_password_hasher()
+        
+        assert valid is True
+        assert verify_password("pooled", hashed)
+    
+    @patch('core.security.settings')
+    def test_zero_workers_uses_threadpool(self, mock_settings):
+        """Verify PASSWORD_HASH_WORKERS=0 hashes without a process pool."""
+        mock_settings.PASSWORD_HASH_WORKERS = 0
+        
+        with patch('core.security.ProcessPoolExecutor') as mock_pool:
+            hashed = asyncio.run(hash_password_async("threaded"))
+        
+        mock_pool.assert_not_called()
+        assert verify_password("threaded", hashed)
+
+
 class TestOTPGeneration:
     """Tests for OTP generation."""
     
@@ -0,0 +1,153 @@
+"""
+Unit tests for api/zoom_transcript/diarization.py
+Tests windowing, cross-window speaker clustering, stitching and the embedding cache.
+"""
+import numpy as np
+import pytest
+
+from api.zoom_transcript import diarization
+from api.zoom_transcript.diarization import cluster_speakers, plan_windows, stitch
+
+
+ALICE = np.array([1.0, 0.0, 0.1])
+BOB = np.array([0.0, 1.0, 0.1])
+
+
+class TestPlanWindows:
+    """Tests for plan_windows."""
+
+    def test_short_audio_is_one_window(self):
+        """Verify audio shorter than a window is processed in one call."""
+        assert plan_windows(300.0) == [(0.0, 300.0)]
+
+    def test_long_audio_gets_overlapping_windows(self):
+        """Verify consecutive windows overlap and cover the whole recording."""
+        # Act
+        windows = plan_windows(1200.0, window_seconds=600.0, overlap_seconds=30.0)
+
+        # Assert
+        assert windows == [(0.0, 600.0), (570.0, 1170.0), (1140.0, 1200.0)]
+
+
+class TestClusterSpeakers:
+    """Tests for cluster_speakers."""
+
+    def test_same_voice_across_windows_is_one_speaker(self):
+        """Verify window speakers with close embeddings share a label."""
+        # Act
+        labels = cluster_speakers([ALICE, BOB, BOB * 2, ALICE + 0.05], window_of=[0, 0, 1, 1])
+
+        # Assert
+        assert labels == [0, 1, 1, 0]
+
+    def test_speakers_of_one_window_never_merge(self):
+        """Verify two speakers the model separated within a window stay apart."""
+        # Act
+        labels = cluster_speakers([ALICE, ALICE + 0.01], window_of=[0, 0], threshold=2.0)
+
+        # Assert
+        assert labels == [0, 1]
+
+    def test_max_speakers_forces_merges(self):
+        """Verify clustering merges the closest speakers down to max_speakers."""
+        # Arrange
+        carol = np.array([0.7, 0.7, 0.0])
+
+        # Act
+        labels = cluster_speakers([ALICE, BOB, carol], window_of=[0, 1, 2], max_speakers=2, threshold=0.0)
+
+        # Assert
+        assert len(set(labels)) == 2
+
+
+class TestStitch:
+    """Tests for stitch."""
+
+    def test_overlap_is_counted_once_and_labels_are_global(self):
+        """Verify overlapping windows yield one timeline with meeting-wide labels."""
+        # Arrange: window 1's local labels are swapped relative to window 0
+        windows = [(0.0, 600.0), (570.0, 1170.0)]
+        results = [
+            {"turns": [(0.0, 300.0, "A"), (300.0, 600.0, "B")], "embeddings": {"A": ALICE, "B": BOB}},
+            {"turns": [(570.0, 900.0, "X"), (900.0, 1170.0, "Y")], "embeddings": {"X": BOB, "Y": ALICE}},
+        ]
+
+        # Act
+        speakers = stitch(windows, results)
+
+        # Assert
+        assert speakers == [
+            {"start": 0.0, "end": 300.0, "speaker": "SPEAKER_00"},
+            {"start": 300.0, "end": 900.0, "speaker": "SPEAKER_01"},
+            {"start": 900.0, "end": 1170.0, "speaker": "SPEAKER_00"},
+        ]
+
+    def test_speakers_without_embedding_are_dropped(self):
+        """Verify turns of speakers pyannote could not embed are left out."""
+        # Arrange
+        results = [{"turns": [(0.0, 1.0, "A"), (1.0, 1.2, "B")], "embeddings": {"A": ALICE, "B": np.full(3, np.nan)}}]
+
+        # Act
+        speakers = stitch([(0.0, 2.0)], results)
+
+        # Assert
+        assert speakers == [{"start": 0.0, "end": 1.0, "speaker": "SPEAKER_00"}]
+
+
+class TestDiarize:
+    """Tests for diarize."""
+
+    @pytest.fixture
+    def audio(self, tmp_path, monkeypatch):
+        path = tmp_path / "clean.wav"
+        path.write_bytes(b"meeting audio")
+        calls = []
+
+        def fake_window(audio_file, start, end):
+            calls.append((start, end))
+            return {"turns": [(start, end, "A")], "embeddings": {"A": ALICE}}
+
+        monkeypatch.setattr(diarization, "_audio_duration", lambda audio_file: 1200.0)
+        monkeypatch.setattr(diarization, "_diarize_window", fake_window)
+        return str(path), calls
+
+    def test_windows_are_cached_per_audio(self, audio, tmp_path):
+        """Verify a re-run on the same audio reuses the cached window results."""
+        # Arrange
+        path, calls = audio
+        cache_dir = str(tmp_path / "cache")
+        first = diarization.diarize(path, cache_dir=cache_dir)
+        calls.clear()
+
+        # Act
+        second = diarization.diarize(path, cache_dir=cache_dir)
+
+        # Assert
+        assert calls == []
+        assert second == first == [{"start": 0.0, "end": 1200.0, "speaker": "SPEAKER_00"}]
+
+    def test_changed_audio_is_recomputed(self, audio, tmp_path):
+        """Verify the cache is keyed by audio content."""
+        # Arrange
+        path, calls = audio
+        cache_dir = str(tmp_path / "cache")
+        diarization.diarize(path, cache_dir=cache_dir)
+        with open(path, "wb") as f:
+            f.write(b"another meeting")
+        calls.clear()
+
+        # Act
+        diarization.diarize(path, cache_dir=cache_dir)
+
+        # Assert
+        assert len(calls) == 3
+
+    def test_disabled_diarization_returns_no_turns(self, audio, monkeypatch):
+        """Verify ENABLE_DIARIZATION=false skips the model entirely."""
+        # Arrange
+        path, calls = audio
+        monkeypatch.setattr(diarization, "ENABLE_DIARIZATION", False)
+
+        # Act & Assert
+        assert diarization.diarize(path) == []
+        assert calls == []
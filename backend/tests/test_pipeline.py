@@ -0,0 +1,245 @@
+"""
+Unit tests for api/zoom_transcript/pipeline.py
+Tests dependency resolution, concurrent stage execution and the artifact cache.
+"""
+import threading
+
+import pytest
+
+from api.zoom_transcript.pipeline import Pipeline
+
+
+def _diamond(calls):
+    pipeline = Pipeline()
+
+    @pipeline.stage("audio", inputs=("path",))
+    def audio(path):
+        calls.append("audio")
+        return f"audio({path})"
+
+    @pipeline.stage("asr", inputs=("audio",))
+    def asr(audio):
+        calls.append("asr")
+        return f"asr({audio})"
+
+    @pipeline.stage("speakers", inputs=("audio",))
+    def speakers(audio):
+        calls.append("speakers")
+        return f"speakers({audio})"
+
+    @pipeline.stage("transcript", inputs=("asr", "speakers"))
+    def transcript(asr, speakers):
+        calls.append("transcript")
+        return (asr, speakers)
+
+    @pipeline.stage("qa", inputs=("asr",))
+    def qa(asr):
+        calls.append("qa")
+        return f"qa({asr})"
+
+    return pipeline
+
+
+class TestPipelineRun:
+    """Tests for Pipeline.run."""
+    
+    def test_shared_stage_runs_once(self):
+        """Verify a stage consumed by several stages is computed once."""
+        # Arrange
+        calls = []
+        pipeline = _diamond(calls)
+        
+        # Act
+        results = pipeline.run(["transcript", "qa"], path="m.wav")
+        
+        # Assert
+        assert sorted(calls) == sorted(["audio", "asr", "speakers", "transcript", "qa"])
+        assert results["transcript"] == ("asr(audio(m.wav))", "speakers(audio(m.wav))")
+        assert results["qa"] == "qa(asr(audio(m.wav)))"
+    
+    def test_dependencies_run_first(self):
+        """Verify every stage runs after its inputs."""
+        # Arrange
+        calls = []
+        
+        # Act
+        _diamond(calls).run(["transcript"], path="m.wav")
+        
+        # Assert
+        assert calls.index("audio") < calls.index("asr") < calls.index("transcript")
+        assert calls.index("speakers") < calls.index("transcript")
+    
+    def test_only_required_stages_run(self):
+        """Verify stages not needed for the targets are skipped."""
+        # Arrange
+        calls = []
+        
+        # Act
+        _diamond(calls).run(["asr"], path="m.wav")
+        
+        # Assert
+        assert calls == ["audio", "asr"]
+
+    def test_independent_stages_run_concurrently(self):
+        """Verify stages that do not depend on each other overlap."""
+        # Arrange: each branch blocks until the other one has started
+        barrier = threading.Barrier(2, timeout=5)
+        pipeline = Pipeline()
+        pipeline.stage("asr", inputs=("path",))(lambda path: barrier.wait() is not None)
+        pipeline.stage("speakers", inputs=("path",))(lambda path: barrier.wait() is not None)
+        
+        # Act
+        results = pipeline.run(["asr", "speakers"], max_workers=2, path="m.wav")
+        
+        # Assert
+        assert results["asr"] is True
+        assert results["speakers"] is True
+    
+    def test_stage_failure_propagates(self):
+        """Verify an exception raised by a stage reaches the caller."""
+        # Arrange
+        pipeline = Pipeline()
+        
+        @pipeline.stage("asr", inputs=("path",))
+        def asr(path):
+            raise RuntimeError("model crashed")
+        
+        # Act & Assert
+        with pytest.raises(RuntimeError, match="model crashed"):
+            pipeline.run(["asr"], path="m.wav")
+
+
+class TestPipelineCache:
+    """Tests for artifact caching across runs."""
+    
+    def test_second_run_reuses_artifacts(self, tmp_path):
+        """Verify unchanged stages are loaded from the cache."""
+        # Arrange
+        calls = []
+        cache_dir = str(tmp_path / "cache")
+        _diamond(calls).run(["transcript"], cache_dir=cache_dir, path="m.wav")
+        calls.clear()
+        
+        # Act
+        results = _diamond(calls).run(["transcript"], cache_dir=cache_dir, path="m.wav")
+        
+        # Assert
+        assert calls == []
+        assert results["transcript"] == ("asr(audio(m.wav))", "speakers(audio(m.wav))")
+    
+    def test_changed_input_file_reruns(self, tmp_path):
+        """Verify editing an input file invalidates the stages built on it."""
+        # Arrange
+        audio_file = tmp_path / "m.wav"
+        audio_file.write_bytes(b"first")
+        cache_dir = str(tmp_path / "cache")
+        calls = []
+        _diamond(calls).run(["asr"], cache_dir=cache_dir, path=str(audio_file))
+        audio_file.write_bytes(b"second")
+        calls.clear()
+        
+        # Act
+        _diamond(calls).run(["asr"], cache_dir=cache_dir, path=str(audio_file))
+        
+        # Assert
+        assert calls == ["audio", "asr"]
+    
+    def test_uncached_stage_always_runs(self, tmp_path):
+        """Verify stages declared with cache=False run on every call."""
+        # Arrange
+        calls = []
+        pipeline = Pipeline()
+        pipeline.stage("persisted", inputs=("path",), cache=False)(lambda path: calls.append(path))
+        cache_dir = str(tmp_path / "cache")
+        
+        # Act
+        pipeline.run(["persisted"], cache_dir=cache_dir, path="m.wav")
+        pipeline.run(["persisted"], cache_dir=cache_dir, path="m.wav")
+        
+        # Assert
+        assert calls == ["m.wav", "m.wav"]
+    
+    @staticmethod
+    def _file_stage(calls, output):
+        # Like main.py: every run writes its result to the same fixed path
+        pipeline = Pipeline()
+        
+        @pipeline.stage("clean_audio", inputs=("path",), produces_file=True)
+        def clean_audio(path):
+            calls.append(path)
+            output.write_bytes(f"clean({path})".encode())
+            return str(output)
+        
+        return pipeline
+    
+    def test_file_artifact_survives_other_runs(self, tmp_path):
+        """Verify A -> B -> A returns A's file, not what B left at the shared path."""
+        # Arrange
+        output = tmp_path / "clean.wav"
+        calls = []
+        pipeline = self._file_stage(calls, output)
+        cache_dir = str(tmp_path / "cache")
+        pipeline.run(["clean_audio"], cache_dir=cache_dir, path="a.wav")
+        pipeline.run(["clean_audio"], cache_dir=cache_dir, path="b.wav")
+        
+        # Act
+        results = pipeline.run(["clean_audio"], cache_dir=cache_dir, path="a.wav")
+        
+        # Assert
+        assert calls == ["a.wav", "b.wav"]
+        with open(results["clean_audio"], "rb") as f:
+            assert f.read() == b"clean(a.wav)"
+        assert output.read_bytes() == b"clean(b.wav)"
+    
+    def test_missing_cached_file_is_rebuilt(self, tmp_path):
+        """Verify a cache entry is ignored once its file copy is deleted."""
+        # Arrange
+        output = tmp_path / "clean.wav"
+        calls = []
+        pipeline = self._file_stage(calls, output)
+        cache_dir = tmp_path / "cache"
+        pipeline.run(["clean_audio"], cache_dir=str(cache_dir), path="m.wav")
+        for artifact in cache_dir.glob("*.wav"):
+            artifact.unlink()
+        
+        # Act
+        results = pipeline.run(["clean_audio"], cache_dir=str(cache_dir), path="m.wav")
+        
+        # Assert
+        assert calls == ["m.wav", "m.wav"]
+        assert results["clean_audio"] == str(output)
+
+
+class TestPipelineValidation:
+    """Tests for graph errors."""
+    
+    def test_missing_parameter(self):
+        """Verify an input that is neither a stage nor a parameter is reported."""
+        with pytest.raises(KeyError):
+            _diamond([]).run(["asr"])
+    
+    def test_cycle_is_rejected(self):
+        """Verify cyclic graphs are rejected before running."""
+        # Arrange
+        pipeline = Pipeline()
+        pipeline.stage("a", inputs=("b",))(lambda b: b)
+        pipeline.stage("b", inputs=("a",))(lambda a: a)
+        
+        # Act & Assert
+        with pytest.raises(ValueError):
+            pipeline.run(["a"])
+    
+    def test_duplicate_stage_is_rejected(self):
+        """Verify stage names are unique."""
+        # Arrange
+        pipeline = Pipeline()
+        pipeline.stage("a")(lambda: 1)
+        
+        # Act & Assert
+        with pytest.raises(ValueError):
+            pipeline.stage("a")(lambda: 2)
+    
+    def test_unknown_executor_is_rejected(self):
+        """Verify only thread and process executors are accepted."""
+        with pytest.raises(ValueError):
+            Pipeline().stage("a", executor="gpu")(lambda: 1)
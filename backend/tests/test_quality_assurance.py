@@ -0,0 +1,133 @@
+"""
+Unit tests for api/zoom_transcript/qualityasurance.py
+Tests the columnar QA engine: coverage, gaps, low-confidence spans and talk time.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from api.zoom_transcript.qualityasurance import QAEngine, detect_gaps, qa_coverage
+
+
+def _raw(start, end, avg_logprob=-0.3, no_speech_prob=0.05, text="x"):
+    return SimpleNamespace(start=start, end=end, avg_logprob=avg_logprob, no_speech_prob=no_speech_prob, text=text)
+
+
+class TestQAEngineReport:
+    """Tests for QAEngine.report."""
+    
+    def test_coverage_counts_overlapping_speech_once(self):
+        """Verify coverage is the union of segment spans over the duration."""
+        # Arrange
+        segments = [{"start": 0.0, "end": 5.0}, {"start": 1.0, "end": 3.0}, {"start": 8.0, "end": 10.0}]
+        
+        # Act
+        report = QAEngine().extend(segments).report(20.0)
+        
+        # Assert
+        assert report["coverage"] == pytest.approx(7.0 / 20.0)
+    
+    def test_gaps_use_running_end(self):
+        """Verify a long segment hides gaps after shorter ones, regardless of input order."""
+        # Arrange
+        segments = [{"start": 12.5, "end": 13.0}, {"start": 0.0, "end": 10.0}, {"start": 2.0, "end": 3.0}]
+        
+        # Act
+        report = QAEngine().extend(segments).report(20.0)
+        
+        # Assert
+        assert report["missing_speech_segments"] == [{"gap_start": 10.0, "gap_end": 12.5, "duration": 2.5}]
+    
+    def test_low_confidence_and_dropped_rows(self):
+        """Verify suspicious rows are reported and excluded from coverage."""
+        # Arrange
+        segments = [_raw(0.0, 4.0), _raw(4.0, 8.0, avg_logprob=-1.6, text="???"), _raw(8.0, 10.0, no_speech_prob=0.9)]
+        
+        # Act
+        report = QAEngine().extend(segments).report(10.0)
+        
+        # Assert
+        assert report["low_confidence_segments"] == [{"start": 4.0, "end": 8.0, "text": "???"}]
+        assert report["coverage"] == pytest.approx(0.4)
+    
+    def test_talk_time_from_diarization_turns(self):
+        """Verify talk time sums turn durations per speaker."""
+        # Arrange
+        speakers = [
+            {"start": 0.0, "end": 4.0, "speaker": "SPEAKER_00"},
+            {"start": 4.0, "end": 5.0, "speaker": "SPEAKER_01"},
+            {"start": 5.0, "end": 7.0, "speaker": "SPEAKER_00"},
+        ]
+        
+        # Act
+        report = QAEngine().report(10.0, speakers=speakers)
+        
+        # Assert
+        assert report["speaker_talk_time"] == {"SPEAKER_00": 6.0, "SPEAKER_01": 1.0}
+    
+    def test_talk_time_from_segment_labels(self):
+        """Verify labelled segments are used when no turns are given."""
+        # Arrange
+        segments = [
+            {"start": 0.0, "end": 2.0, "speaker": "A"},
+            {"start": 2.0, "end": 3.0, "speaker": "B"},
+            {"start": 3.0, "end": 6.0, "speaker": "A"},
+        ]
+        
+        # Act
+        report = QAEngine().extend(segments).report(6.0)
+        
+        # Assert
+        assert report["speaker_talk_time"] == {"A": 5.0, "B": 1.0}
+    
+    def test_empty_engine(self):
+        """Verify an empty engine yields an empty report."""
+        assert QAEngine().report(10.0) == {
+            "coverage": 0.0,
+            "missing_speech_segments": [],
+            "low_confidence_segments": [],
+            "speaker_talk_time": {},
+        }
+
+
+class TestQAEngineIncremental:
+    """Tests for streaming ingestion."""
+    
+    def test_track_records_while_passing_through(self):
+        """Verify a one-shot generator is consumed once and recorded."""
+        # Arrange
+        engine = QAEngine(capacity=2)
+        generator = (_raw(i * 3.0, i * 3.0 + 2.0) for i in range(10))
+        
+        # Act
+        passed = list(engine.track(generator))
+        
+        # Assert
+        assert len(passed) == len(engine) == 10
+        assert len(engine.report(30.0)["missing_speech_segments"]) == 0
+    
+    def test_report_between_batches(self):
+        """Verify reports reflect the segments added so far."""
+        # Arrange
+        engine = QAEngine(capacity=1)
+        engine.add({"start": 0.0, "end": 1.0})
+        first = engine.report(10.0)
+        
+        # Act
+        engine.extend([{"start": 5.0, "end": 6.0}])
+        second = engine.report(10.0)
+        
+        # Assert
+        assert first["missing_speech_segments"] == []
+        assert second["missing_speech_segments"][0]["duration"] == pytest.approx(4.0)
+
+
+class TestLegacyHelpers:
+    """Tests for the function wrappers kept for existing callers."""
+    
+    def test_qa_coverage_and_detect_gaps(self):
+        """Verify wrappers delegate to the engine."""
+        segments = [{"start": 0.0, "end": 1.0}, {"start": 4.0, "end": 5.0}]
+        
+        assert qa_coverage(segments, 10.0) == pytest.approx(0.2)
+        assert detect_gaps(segments, threshold=2.5)[0]["gap_start"] == 1.0
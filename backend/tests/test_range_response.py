@@ -0,0 +1,126 @@
+"""
+Unit tests for HTTP Range file responses.
+"""
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from core.range_response import (
+    RangeNotSatisfiable,
+    parse_range_header,
+    ranged_file_response,
+)
+
+
+class TestParseRangeHeader:
+    """Tests for parse_range_header."""
+    
+    def test_parses_closed_range(self):
+        """Verify an explicit start-end range is returned inclusive."""
+        assert parse_range_header("bytes=0-99", 1000) == (0, 99)
+    
+    def test_clamps_end_to_file_size(self):
+        """Verify ranges running past EOF are truncated."""
+        assert parse_range_header("bytes=900-5000", 1000) == (900, 999)
+    
+    def test_parses_suffix_range(self):
+        """Verify bytes=-N selects the last N bytes."""
+        assert parse_range_header("bytes=-100", 1000) == (900, 999)
+    
+    def test_open_range_is_bounded(self):
+        """Verify an open-ended range is capped instead of covering a huge file."""
+        # Act
+        start, end = parse_range_header("bytes=0-", 10 ** 10)
+        
+        # Assert
+        assert start == 0
+        assert 0 < end < 10 ** 10 - 1
+    
+    @pytest.mark.parametrize("value", [None, "", "items=0-1", "bytes=0-1,5-6", "bytes=a-b", "bytes=9-3"])
+    def test_ignores_unsupported_ranges(self, value):
+        """Verify malformed and multi-range headers fall back to the full file."""
+        assert parse_range_header(value, 1000) is None
+    
+    def test_rejects_range_past_end(self):
+        """Verify a start beyond EOF is not satisfiable."""
+        with pytest.raises(RangeNotSatisfiable):
+            parse_range_header("bytes=1000-", 1000)
+
+
+class TestRangedFileResponse:
+    """Tests for ranged_file_response."""
+    
+    @pytest.fixture
+    def audio_client(self, tmp_path):
+        """Client for a minimal app serving one file."""
+        audio = tmp_path / "meeting.mp3"
+        audio.write_bytes(bytes(range(256)) * 4)
+        app = FastAPI()
+        
+        @app.api_route("/audio", methods=["GET", "HEAD"])
+        def serve(request: Request):
+            return ranged_file_response(audio, request)
+        
+        return TestClient(app)
+    
+    def test_full_file_without_range(self, audio_client):
+        """Verify a plain GET returns the whole file."""
+        # Act
+        response = audio_client.get("/audio")
+        
+        # Assert
+        assert response.status_code == 200
+        assert len(response.content) == 1024
+        assert response.headers["content-type"] == "audio/mpeg"
+        assert response.headers["accept-ranges"] == "bytes"
+    
+    def test_partial_content(self, audio_client):
+        """Verify a Range request returns only the requested slice."""
+        # Act
+        response = audio_client.get("/audio", headers={"Range": "bytes=-4"})
+        
+        # Assert
+        assert response.status_code == 206
+        assert response.content == bytes([252, 253, 254, 255])
+        assert response.headers["content-range"] == "bytes 1020-1023/1024"
+        assert response.headers["content-length"] == "4"
+    
+    def test_unsatisfiable_range(self, audio_client):
+        """Verify 416 with the file size when the range starts past EOF."""
+        # Act
+        response = audio_client.get("/audio", headers={"Range": "bytes=4096-"})
+        
+        # Assert
+        assert response.status_code == 416
+        assert response.headers["content-range"] == "bytes */1024"
+    
+    def test_if_range_mismatch_returns_full_file(self, audio_client):
+        """Verify a stale If-Range validator ignores the Range header."""
+        # Act
+        response = audio_client.get("/audio", headers={"Range": "bytes=0-9", "If-Range": '"stale"'})
+        
+        # Assert
+        assert response.status_code == 200
+        assert len(response.content) == 1024
+    
+    def test_if_range_match_returns_partial(self, audio_client):
+        """Verify a current If-Range validator keeps the Range."""
+        # Arrange
+        etag = audio_client.head("/audio").headers["etag"]
+        
+        # Act
+        response = audio_client.get("/audio", headers={"Range": "bytes=0-9", "If-Range": etag})
+        
+        # Assert
+        assert response.status_code == 206
+        assert response.content == bytes(range(10))
+    
+    def test_head_has_no_body(self, audio_client):
+        """Verify HEAD reports the length without sending the file."""
+        # Act
+        response = audio_client.head("/audio")
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-length"] == "1024"
+        assert response.content == b""
@@ -0,0 +1,141 @@
+"""
+Unit tests for api/zoom_transcript/speaker_align.py
+Tests maximum-overlap speaker selection and word-level assignment.
+"""
+import random
+
+from api.zoom_transcript.speaker_align import assign_speaker, assign_word_speakers
+
+
+def _turn(start, end, speaker):
+    return {"start": start, "end": end, "speaker": speaker}
+
+
+class TestAssignSpeaker:
+    """Tests for segment-level assignment."""
+    
+    def test_picks_speaker_with_most_overlap(self):
+        """Verify the dominant speaker wins, not the first overlapping turn."""
+        # Arrange
+        segments = [{"start": 0.0, "end": 10.0, "text": "a"}]
+        speakers = [_turn(0.0, 1.0, "SPEAKER_00"), _turn(1.0, 10.0, "SPEAKER_01")]
+        
+        # Act
+        result = assign_speaker(segments, speakers)
+        
+        # Assert
+        assert result[0]["speaker"] == "SPEAKER_01"
+    
+    def test_sums_overlap_across_turns_of_same_speaker(self):
+        """Verify several short turns of one speaker outweigh one longer turn."""
+        # Arrange
+        segments = [{"start": 0.0, "end": 10.0, "text": "a"}]
+        speakers = [
+            _turn(0.0, 3.0, "SPEAKER_00"),
+            _turn(3.0, 7.0, "SPEAKER_01"),
+            _turn(7.0, 10.0, "SPEAKER_00"),
+        ]
+        
+        # Act
+        result = assign_speaker(segments, speakers)
+        
+        # Assert
+        assert result[0]["speaker"] == "SPEAKER_00"
+    
+    def test_unknown_without_overlap(self):
+        """Verify segments outside every turn are marked UNKNOWN."""
+        # Arrange
+        segments = [{"start": 20.0, "end": 21.0, "text": "a"}]
+        
+        # Act
+        result = assign_speaker(segments, [_turn(0.0, 5.0, "SPEAKER_00")])
+        
+        # Assert
+        assert result[0]["speaker"] == "UNKNOWN"
+    
+    def test_handles_unsorted_and_overlapping_turns(self):
+        """Verify results match a brute-force maximum-overlap reference."""
+        # Arrange
+        rng = random.Random(7)
+        speakers = []
+        for _ in range(300):
+            start = rng.uniform(0, 600)
+            speakers.append(_turn(start, start + rng.uniform(0.2, 20), f"SPEAKER_{rng.randrange(4):02d}"))
+        segments = []
+        for _ in range(200):
+            start = rng.uniform(0, 600)
+            segments.append({"start": start, "end": start + rng.uniform(0.5, 15), "text": "x"})
+        
+        def reference(seg):
+            totals = {}
+            for sp in speakers:
+                overlap = min(seg["end"], sp["end"]) - max(seg["start"], sp["start"])
+                if overlap > 0:
+                    totals[sp["speaker"]] = totals.get(sp["speaker"], 0.0) + overlap
+            return max(totals, key=totals.get) if totals else "UNKNOWN"
+        
+        expected = [reference(seg) for seg in segments]
+        
+        # Act
+        result = assign_speaker(segments, speakers)
+        
+        # Assert
+        assert [seg["speaker"] for seg in result] == expected
+
+
+class TestWordLevelAssignment:
+    """Tests for word-level assignment when word timestamps exist."""
+    
+    def test_words_get_their_own_speaker(self):
+        """Verify each word is labeled by the turn it falls in."""
+        # Arrange
+        segments = [{
+            "start": 0.0, "end": 4.0, "text": "halo apa kabar",
+            "words": [
+                {"start": 0.0, "end": 1.0, "word": "halo"},
+                {"start": 1.5, "end": 2.0, "word": "apa"},
+                {"start": 2.5, "end": 4.0, "word": "kabar"},
+            ],
+        }]
+        speakers = [_turn(0.0, 1.2, "SPEAKER_00"), _turn(1.2, 4.0, "SPEAKER_01")]
+        
+        # Act
+        assign_word_speakers(segments, speakers)
+        
+        # Assert
+        assert [w["speaker"] for w in segments[0]["words"]] == ["SPEAKER_00", "SPEAKER_01", "SPEAKER_01"]
+    
+    def test_segment_speaker_follows_word_majority(self):
+        """Verify the segment takes the speaker holding most word time."""
+        # Arrange
+        segments = [{
+            "start": 0.0, "end": 10.0, "text": "a b",
+            "words": [
+                {"start": 0.0, "end": 1.0, "word": "a"},
+                {"start": 8.0, "end": 10.0, "word": "b"},
+            ],
+        }]
+        # Segment overlap favours SPEAKER_00, but only one short word is theirs
+        speakers = [_turn(0.0, 7.0, "SPEAKER_00"), _turn(7.0, 10.0, "SPEAKER_01")]
+        
+        # Act
+        result = assign_speaker(segments, speakers)
+        
+        # Assert
+        assert result[0]["speaker"] == "SPEAKER_01"
+    
+    def test_segment_level_only(self):
+        """Verify word_level=False ignores word timestamps."""
+        # Arrange
+        segments = [{
+            "start": 0.0, "end": 10.0, "text": "a",
+            "words": [{"start": 8.0, "end": 10.0, "word": "a"}],
+        }]
+        speakers = [_turn(0.0, 7.0, "SPEAKER_00"), _turn(7.0, 10.0, "SPEAKER_01")]
+        
+        # Act
+        result = assign_speaker(segments, speakers, word_level=False)
+        
+        # Assert
+        assert result[0]["speaker"] == "SPEAKER_00"
+        assert "speaker" not in result[0]["words"][0]
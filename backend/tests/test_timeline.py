@@ -0,0 +1,163 @@
+"""
+Unit tests for api/zoom_transcript/timeline.py
+Tests streaming speech regions to ASR and mapping timestamps back onto the recording.
+"""
+from collections import namedtuple
+from dataclasses import dataclass
+import itertools
+
+import numpy as np
+import pytest
+
+from api.zoom_transcript.timeline import OffsetMap, gather_groups, group_regions
+
+
+Word = namedtuple("Word", "start end word")
+Segment = namedtuple("Segment", "start end text words")
+
+
+@dataclass
+class DataclassSegment:
+    start: float
+    end: float
+    text: str
+    words: list = None
+
+
+# Speech at 2-5s and 10-12s of the recording -> 0-3s and 3-5s of speech
+REGIONS = [{"start": 2.0, "end": 5.0}, {"start": 10.0, "end": 12.0}]
+
+
+class TestOffsetMapToOriginal:
+    """Tests for OffsetMap.to_original."""
+
+    def test_times_inside_regions_are_shifted(self):
+        """Verify each region is shifted by its own offset."""
+        # Arrange
+        offsets = OffsetMap(REGIONS)
+
+        # Act & Assert
+        assert offsets.to_original(0.0) == pytest.approx(2.0)
+        assert offsets.to_original(1.5) == pytest.approx(3.5)
+        assert offsets.to_original(4.0) == pytest.approx(11.0)
+        assert offsets.speech_duration == pytest.approx(5.0)
+
+    def test_boundary_depends_on_interval_side(self):
+        """Verify a boundary closes the previous region and opens the next one."""
+        # Arrange
+        offsets = OffsetMap(REGIONS)
+
+        # Act & Assert
+        assert offsets.to_original(3.0, is_end=True) == pytest.approx(5.0)
+        assert offsets.to_original(3.0) == pytest.approx(10.0)
+
+    def test_without_regions_times_are_unchanged(self):
+        """Verify an empty map is the identity."""
+        assert OffsetMap([]).to_original(7.5) == 7.5
+
+
+class TestGroupRegions:
+    """Tests for group_regions."""
+
+    def test_batches_consecutive_regions_up_to_the_limit(self):
+        """Verify regions are grouped by speech length, never split."""
+        # Arrange
+        regions = REGIONS + [{"start": 20.0, "end": 30.0}]
+
+        # Act
+        groups = list(group_regions(regions, max_seconds=5.0))
+
+        # Assert
+        assert groups == [REGIONS, [{"start": 20.0, "end": 30.0}]]
+
+    def test_unbounded_regions_are_grouped_lazily(self):
+        """Verify an endless region source can be consumed group by group."""
+        # Arrange
+        regions = ({"start": t, "end": t + 1.0} for t in itertools.count())
+
+        # Act
+        first = next(group_regions(regions, max_seconds=2.0))
+
+        # Assert
+        assert first == [{"start": 0, "end": 1.0}, {"start": 1, "end": 2.0}]
+
+
+class TestGatherGroups:
+    """Tests for gather_groups."""
+
+    def test_concatenates_speech_samples_per_group(self):
+        """Verify only region samples are kept, across window boundaries."""
+        # Arrange: 1 sample per second, windows of 4 samples
+        windows = [np.arange(n, n + 4, dtype=np.float32) for n in range(0, 16, 4)]
+        groups = [[REGIONS[0]], [REGIONS[1]]]
+
+        # Act
+        gathered = [(group, samples.tolist()) for group, samples in gather_groups(windows, groups, sampling_rate=1)]
+
+        # Assert
+        assert gathered == [([REGIONS[0]], [2, 3, 4]), ([REGIONS[1]], [10, 11])]
+
+    def test_reads_the_whole_stream_and_drops_groups_after_it(self):
+        """Verify the stream is drained and regions past its end are skipped."""
+        # Arrange
+        read = []
+
+        def windows():
+            for n in range(0, 16, 4):
+                read.append(n)
+                yield np.arange(n, n + 4, dtype=np.float32)
+
+        groups = [[{"start": 1.0, "end": 2.0}], [{"start": 14.0, "end": 20.0}], [{"start": 30.0, "end": 31.0}]]
+
+        # Act
+        gathered = [samples.tolist() for _, samples in gather_groups(windows(), groups, sampling_rate=1)]
+
+        # Assert
+        assert gathered == [[1], [14, 15]]
+        assert read == [0, 4, 8, 12]
+
+    def test_only_one_group_is_buffered(self):
+        """Verify a group is yielded before later windows are read."""
+        # Arrange
+        read = []
+
+        def windows():
+            for n in range(0, 16, 4):
+                read.append(n)
+                yield np.arange(n, n + 4, dtype=np.float32)
+
+        # Act
+        gathered = gather_groups(windows(), [[REGIONS[0]], [REGIONS[1]]], sampling_rate=1)
+        next(gathered)
+
+        # Assert
+        assert read == [0, 4]
+
+
+class TestOffsetMapRemapSegments:
+    """Tests for OffsetMap.remap_segments."""
+
+    def test_segment_and_word_times_are_remapped(self):
+        """Verify segments and their words land on the recording timeline."""
+        # Arrange
+        segment = Segment(2.5, 4.0, "halo semua", [Word(2.5, 3.0, "halo"), Word(3.0, 4.0, "semua")])
+
+        # Act
+        (remapped,) = OffsetMap(REGIONS).remap_segments([segment])
+
+        # Assert
+        assert (remapped.start, remapped.end) == pytest.approx((4.5, 11.0))
+        assert [(w.start, w.end) for w in remapped.words] == pytest.approx([(4.5, 5.0), (10.0, 11.0)])
+        assert remapped.text == "halo semua"
+
+    def test_dataclass_segments_are_supported(self):
+        """Verify newer faster-whisper dataclass results are remapped too."""
+        # Arrange
+        segment = DataclassSegment(0.5, 1.0, "ya")
+
+        # Act
+        (remapped,) = OffsetMap(REGIONS).remap_segments([segment])
+
+        # Assert
+        assert (remapped.start, remapped.end) == pytest.approx((2.5, 3.0))
+        assert segment.start == 0.5
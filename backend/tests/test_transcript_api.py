@@ -5,11 +5,22 @@ Tests authentication, file validation, and async upload flow.
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import Mock, patch
+from pathlib import Path
+from datetime import datetime
+import asyncio
 import io
 
 from main import app
 from domains.zoom_resume.transcript.model import TranscriptStatus
-from domains.auth.utils import get_current_active_user
+from domains.zoom_resume.transcript.cache import transcript_response_cache
+from domains.zoom_resume.transcript.validation import FileValidator
+from domains.zoom_resume.transcript.upload_service import AsyncUploadSessionService
+from core.jwt import create_access_token, create_stream_token, verify_stream_token
+from domains.auth.utils import (
+    get_current_active_user,
+    get_current_active_user_async,
+    get_current_active_user_for_stream
+)
 
 
 # Mock user for testing
@@ -27,21 +38,25 @@ def client():
     """Test client fixture with auth dependency override."""
     # Override authentication dependency
     app.dependency_overrides[get_current_active_user] = get_mock_user
+    app.dependency_overrides[get_current_active_user_async] = get_mock_user
+    app.dependency_overrides[get_current_active_user_for_stream] = get_mock_user
     client = TestClient(app)
     yield client
     # Clean up
     app.dependency_overrides.clear()
 
 
+# Minimal WAV header so container sniffing accepts the upload
+WAV_BYTES = b"RIFF\x24\x00\x00\x00WAVEfmt " + b"\x00" * 64
+
+
 class TestTranscriptUploadEndpoint:
     """Tests for POST /transcripts/upload endpoint."""
     
     @patch('workers.meeting.transcribe_worker.enqueue_transcript')
-    @patch('api.zoom_resume.transcripts.TranscriptService.create_transcript')
-    @patch('api.zoom_resume.transcripts.FileValidator.validate_upload')
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.create_transcript')
     def test_upload_creates_pending_transcript(
         self,
-        mock_validate,
         mock_create,
         mock_enqueue,
         client
@@ -62,7 +77,7 @@ class TestTranscriptUploadEndpoint:
         mock_create.return_value = mock_transcript
         
         # Create test file
-        test_file = io.BytesIO(b"fake audio data")
+        test_file = io.BytesIO(WAV_BYTES)
         
         # Act
         response = client.post(
@@ -72,9 +87,13 @@ class TestTranscriptUploadEndpoint:
         
         # Assert
         assert response.status_code == 201
-        mock_validate.assert_called_once()
         mock_create.assert_called_once()
         mock_enqueue.assert_called_once_with(1)
+        
+        # Uploaded bytes written to disk unchanged
+        saved_path = Path(mock_create.call_args.kwargs["audio_url"])
+        assert saved_path.read_bytes() == WAV_BYTES
+        saved_path.unlink()
     
     def test_upload_requires_authentication(self):
         """Verify upload endpoint requires authentication."""
@@ -91,31 +110,26 @@ class TestTranscriptUploadEndpoint:
         # Assert
         assert response.status_code == 401
     
-    @patch('api.zoom_resume.transcripts.FileValidator.validate_upload')
-    def test_upload_validates_file_size(self, mock_validate, client):
-        """Verify file size validation."""
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.create_transcript')
+    def test_upload_validates_file_size(self, mock_create, client):
+        """Verify MAX_FILE_SIZE is enforced while streaming."""
         # Arrange
-        from fastapi import HTTPException
-        mock_validate.side_effect = HTTPException(status_code=413, detail="File too large")
-        
-        test_file = io.BytesIO(b"fake audio data")
+        test_file = io.BytesIO(WAV_BYTES + b"\x00" * 1024)
         
         # Act
-        response = client.post(
-            "/transcripts/upload",
-            files={"file": ("test.wav", test_file, "audio/wav")}
-        )
+        with patch.object(FileValidator, "MAX_FILE_SIZE", 512):
+            response = client.post(
+                "/transcripts/upload",
+                files={"file": ("test.wav", test_file, "audio/wav")}
+            )
         
         # Assert
         assert response.status_code == 413
+        mock_create.assert_not_called()
     
-    @patch('api.zoom_resume.transcripts.FileValidator.validate_upload')
-    def test_upload_validates_file_extension(self, mock_validate, client):
+    def test_upload_validates_file_extension(self, client):
         """Verify file extension validation."""
         # Arrange
-        from fastapi import HTTPException
-        mock_validate.side_effect = HTTPException(status_code=400, detail="Invalid extension")
-        
         test_file = io.BytesIO(b"fake data")
         
         # Act
@@ -126,28 +140,149 @@ class TestTranscriptUploadEndpoint:
         
         # Assert
         assert response.status_code == 400
+    
+    def test_upload_rejects_content_not_matching_extension(self, client):
+        """Verify magic-byte sniffing rejects non-audio data with an audio extension."""
+        # Arrange
+        test_file = io.BytesIO(b"this is not really a wav file")
+        
+        # Act
+        response = client.post(
+            "/transcripts/upload",
+            files={"file": ("test.wav", test_file, "audio/wav")}
+        )
+        
+        # Assert
+        assert response.status_code == 400
+        assert "container" in response.json()["detail"]
+
+
+class TestResumableUploadEndpoints:
+    """Tests for /transcripts/uploads resumable upload protocol."""
+    
+    @patch('api.zoom_resume.transcripts.AsyncUploadSessionService.get_session')
+    def test_patch_rejects_offset_mismatch(self, mock_get, client):
+        """Verify a chunk at the wrong offset returns 409 without writing."""
+        # Arrange
+        mock_upload = Mock()
+        mock_upload.upload_offset = 2000
+        mock_get.return_value = mock_upload
+        
+        # Act
+        response = client.patch(
+            "/transcripts/uploads/abc",
+            content=b"data",
+            headers={"Upload-Offset": "0"}
+        )
+        
+        # Assert
+        assert response.status_code == 409
+    
+    @patch('api.zoom_resume.transcripts.AsyncUploadSessionService.record_offset')
+    @patch('api.zoom_resume.transcripts.AsyncUploadSessionService.get_session')
+    def test_patch_appends_at_offset_and_records_progress(self, mock_get, mock_record, client, tmp_path):
+        """Verify chunk bytes land at the session offset and the new offset is persisted."""
+        # Arrange
+        partial = tmp_path / "abc.part"
+        partial.write_bytes(WAV_BYTES[:20])
+        mock_upload = Mock()
+        mock_upload.file_path = str(partial)
+        mock_upload.filename = "meeting.wav"
+        mock_upload.upload_offset = 20
+        mock_upload.upload_length = len(WAV_BYTES)
+        mock_get.return_value = mock_upload
+        
+        # Act
+        response = client.patch(
+            "/transcripts/uploads/abc",
+            content=WAV_BYTES[20:],
+            headers={"Upload-Offset": "20"}
+        )
+        
+        # Assert
+        assert response.status_code == 204
+        assert partial.read_bytes() == WAV_BYTES
+        assert mock_record.call_args.args[2] == len(WAV_BYTES)
+    
+    @patch('api.zoom_resume.transcripts.AsyncUploadSessionService.get_session')
+    def test_patch_rejects_concurrent_chunk(self, mock_get, client):
+        """Verify a chunk arriving while another is written for the same upload gets 409."""
+        # Arrange: another request holds the upload's chunk lock
+        lock = AsyncUploadSessionService.chunk_lock("abc")
+        asyncio.run(lock.acquire())
+        
+        # Act
+        try:
+            response = client.patch(
+                "/transcripts/uploads/abc",
+                content=b"data",
+                headers={"Upload-Offset": "0"}
+            )
+        finally:
+            lock.release()
+        
+        # Assert
+        assert response.status_code == 409
+        mock_get.assert_not_called()
+    
+    @patch('api.zoom_resume.transcripts.AsyncUploadSessionService.get_session')
+    def test_patch_rejects_partial_file_behind_offset(self, mock_get, client, tmp_path):
+        """Verify the recorded offset is checked against the bytes on disk."""
+        # Arrange
+        partial = tmp_path / "abc.part"
+        partial.write_bytes(WAV_BYTES[:10])
+        mock_upload = Mock()
+        mock_upload.file_path = str(partial)
+        mock_upload.upload_offset = 20
+        mock_get.return_value = mock_upload
+        
+        # Act
+        response = client.patch(
+            "/transcripts/uploads/abc",
+            content=WAV_BYTES[20:],
+            headers={"Upload-Offset": "20"}
+        )
+        
+        # Assert
+        assert response.status_code == 409
+        assert partial.read_bytes() == WAV_BYTES[:10]
+    
+    def test_create_rejects_size_over_resumable_limit(self, client):
+        """Verify the declared size is checked against MAX_RESUMABLE_FILE_SIZE."""
+        # Act
+        with patch.object(FileValidator, "MAX_RESUMABLE_FILE_SIZE", 1024):
+            response = client.post(
+                "/transcripts/uploads",
+                json={"filename": "meeting.wav", "size": 4096}
+            )
+        
+        # Assert
+        assert response.status_code == 413
 
 
 class TestTranscriptListEndpoint:
     """Tests for GET /transcripts endpoint."""
     
-    @patch('api.zoom_resume.transcripts.TranscriptService.list_by_user')
-    def test_list_returns_user_transcripts(self, mock_list, client):
-        """Verify list endpoint returns user's transcripts."""
-        # Arrange
-        mock_transcripts = [Mock() for _ in range(3)]
-        for i, t in enumerate(mock_transcripts):
+    @staticmethod
+    def _summary_rows(count):
+        rows = [Mock() for _ in range(count)]
+        for i, t in enumerate(rows):
             t.id = i + 1
             t.status = TranscriptStatus.DONE
             t.user_id = 123
             t.audio_url = f"uploads/test{i}.wav"
             t.language = "en"
-            t.full_text = "Test"
-            t.segments = []
+            t.segments_count = 4
             t.error_message = None
             t.created_at = "2024-01-01T00:00:00"
             t.updated_at = "2024-01-01T00:00:00"
-        mock_list.return_value = (mock_transcripts, 3)
+        return rows
+    
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.list_summaries_by_user')
+    def test_list_returns_summaries_without_heavy_fields(self, mock_list, client):
+        """Verify list items are summaries (no full_text/segments)."""
+        # Arrange
+        mock_list.return_value = (self._summary_rows(3), None)
         
         # Act
         response = client.get("/transcripts")
@@ -155,39 +290,407 @@ class TestTranscriptListEndpoint:
         # Assert
         assert response.status_code == 200
         data = response.json()
-        assert data["total"] == 3
         assert len(data["items"]) == 3
+        assert data["items"][0]["segments_count"] == 4
+        assert "full_text" not in data["items"][0]
+        assert "segments" not in data["items"][0]
+        assert data["next_cursor"] is None
+        assert data["total"] is None
     
-    @patch('api.zoom_resume.transcripts.TranscriptService.list_by_user')
-    def test_list_supports_pagination(self, mock_list, client):
-        """Verify pagination parameters work."""
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.count_by_user')
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.list_summaries_by_user')
+    def test_list_supports_cursor_pagination(self, mock_list, mock_count, client):
+        """Verify cursor/limit are passed through and total is opt-in."""
         # Arrange
         from unittest.mock import ANY
-        
-        mock_transcripts = [Mock() for _ in range(5)]
-        for i, t in enumerate(mock_transcripts):
-            t.id = i + 1
-            t.status = TranscriptStatus.DONE
-            t.user_id = 123
-            t.audio_url = f"uploads/test{i}.wav"
-            t.language = "en"
-            t.full_text = "Test"
-            t.segments = []
-            t.error_message = None
-            t.created_at = "2024-01-01T00:00:00"
-            t.updated_at = "2024-01-01T00:00:00"
-        mock_list.return_value = (mock_transcripts, 10)
+        mock_list.return_value = (self._summary_rows(5), "next-page")
+        mock_count.return_value = 10
         
         # Act
-        response = client.get("/transcripts?skip=5&limit=5")
+        response = client.get("/transcripts?cursor=abc&limit=5&include_total=true")
         
         # Assert
         assert response.status_code == 200
         data = response.json()
-        assert data["skip"] == 5
         assert data["limit"] == 5
-        # Check call with ANY for db session (first parameter)
-        mock_list.assert_called_once_with(ANY, 123, 5, 5)
+        assert data["next_cursor"] == "next-page"
+        assert data["total"] == 10
+        mock_list.assert_called_once_with(ANY, 123, 5, "abc")
+    
+    def test_list_rejects_malformed_cursor(self, client):
+        """Verify an undecodable cursor returns 400."""
+        # Act
+        response = client.get("/transcripts?cursor=not-a-cursor")
+        
+        # Assert
+        assert response.status_code == 400
+
+
+class TestTranscriptDetailEndpoint:
+    """Tests for GET /transcripts/{id} conditional requests and caching."""
+    
+    @staticmethod
+    def _transcript(status=TranscriptStatus.DONE, updated_at=datetime(2026, 10, 1, 8, 30, 0, 250000)):
+        return Mock(
+            id=1, user_id=123, audio_url="uploads/a.wav", status=status, language="id",
+            full_text="Halo semua", segments=[{"id": 0, "start": 0.0, "end": 1.5, "text": "Halo semua"}],
+            error_message=None, created_at=datetime(2026, 10, 1, 8, 0, 0), updated_at=updated_at
+        )
+    
+    @pytest.fixture(autouse=True)
+    def _empty_cache(self):
+        transcript_response_cache.clear()
+        yield
+        transcript_response_cache.clear()
+    
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.get_by_id')
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.get_summary')
+    def test_get_returns_validators_and_serves_done_from_cache(self, mock_summary, mock_get, client):
+        """Verify ETag/Last-Modified are set and a DONE body is only built once."""
+        # Arrange
+        mock_summary.return_value = self._transcript()
+        mock_get.return_value = self._transcript()
+        
+        # Act
+        first = client.get("/transcripts/1")
+        second = client.get("/transcripts/1")
+        
+        # Assert
+        assert first.status_code == second.status_code == 200
+        assert first.json()["full_text"] == "Halo semua"
+        assert second.content == first.content
+        assert first.headers["etag"] == second.headers["etag"]
+        assert first.headers["last-modified"] == "Thu, 01 Oct 2026 08:30:00 GMT"
+        assert "immutable" in first.headers["cache-control"]
+        assert mock_get.call_count == 1
+    
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.get_by_id')
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.get_summary')
+    def test_get_returns_304_for_matching_etag(self, mock_summary, mock_get, client):
+        """Verify If-None-Match with the current ETag skips loading the transcript."""
+        # Arrange
+        mock_summary.return_value = self._transcript()
+        mock_get.return_value = self._transcript()
+        etag = client.get("/transcripts/1").headers["etag"]
+        mock_get.reset_mock()
+        
+        # Act
+        response = client.get("/transcripts/1", headers={"If-None-Match": f'"other", {etag}'})
+        
+        # Assert
+        assert response.status_code == 304
+        assert response.content == b""
+        mock_get.assert_not_called()
+    
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.get_by_id')
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.get_summary')
+    def test_get_honours_if_modified_since_and_skips_cache_while_processing(self, mock_summary, mock_get, client):
+        """Verify If-Modified-Since handling and that unfinished transcripts are not cached."""
+        # Arrange
+        mock_summary.return_value = self._transcript(status=TranscriptStatus.PROCESSING)
+        mock_get.return_value = self._transcript(status=TranscriptStatus.PROCESSING)
+        
+        # Act
+        not_modified = client.get("/transcripts/1", headers={"If-Modified-Since": "Thu, 01 Oct 2026 08:30:00 GMT"})
+        stale = client.get("/transcripts/1", headers={"If-Modified-Since": "Thu, 01 Oct 2026 08:29:59 GMT"})
+        
+        # Assert
+        assert not_modified.status_code == 304
+        assert stale.status_code == 200
+        assert stale.headers["cache-control"] == "private, no-cache"
+        assert len(transcript_response_cache) == 0
+    
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.get_by_id')
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.get_summary')
+    def test_get_caches_done_body_per_content_encoding(self, mock_summary, mock_get, client):
+        """Verify DONE bodies are cached pre-compressed for the negotiated encoding."""
+        # Arrange
+        mock_summary.return_value = self._transcript()
+        mock_get.return_value = self._transcript()
+        
+        # Act
+        gzipped = client.get("/transcripts/1", headers={"Accept-Encoding": "gzip"})
+        identity = client.get("/transcripts/1", headers={"Accept-Encoding": "identity"})
+        
+        # Assert
+        assert gzipped.headers["content-encoding"] == "gzip"
+        assert "content-encoding" not in identity.headers
+        assert gzipped.json() == identity.json()
+        assert len(transcript_response_cache) == 2
+    
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.get_summary')
+    def test_get_returns_404_for_unauthorized_access(self, mock_summary, client):
+        """Verify 404 when the transcript is missing or owned by someone else."""
+        # Arrange
+        mock_summary.return_value = None
+        
+        # Act
+        response = client.get("/transcripts/999")
+        
+        # Assert
+        assert response.status_code == 404
+
+
+class TestTranscriptSegmentsEndpoint:
+    """Tests for GET /transcripts/{id}/segments endpoint."""
+    
+    @staticmethod
+    def _rows(*starts):
+        async def stream(db, transcript_id, start_from=None, end_to=None, speaker=None, limit=None):
+            for i, start in enumerate(starts):
+                yield Mock(seq=i, start=start, end=start + 5.0, text=f"seg {i}", speaker="SPEAKER_0")
+        return stream
+    
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.stream_segments')
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.get_summary')
+    def test_segments_streams_requested_range(self, mock_summary, mock_stream, client):
+        """Verify the range filters are passed through and segments are returned as JSON."""
+        # Arrange
+        mock_summary.return_value = Mock(id=1)
+        mock_stream.side_effect = self._rows(1800.0, 1805.0)
+        
+        # Act
+        response = client.get("/transcripts/1/segments?from=1800&to=2100&speaker=SPEAKER_0")
+        
+        # Assert
+        assert response.status_code == 200
+        assert [seg["start"] for seg in response.json()] == [1800.0, 1805.0]
+        args = mock_stream.call_args.args
+        assert args[1:] == (1, 1800.0, 2100.0, "SPEAKER_0", None)
+    
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.stream_segments')
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.get_summary')
+    def test_segments_supports_ndjson(self, mock_summary, mock_stream, client):
+        """Verify Accept: application/x-ndjson yields one segment per line."""
+        # Arrange
+        mock_summary.return_value = Mock(id=1)
+        mock_stream.side_effect = self._rows(0.0, 5.0, 10.0)
+        
+        # Act
+        response = client.get("/transcripts/1/segments", headers={"Accept": "application/x-ndjson"})
+        
+        # Assert
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        assert len(response.text.strip().splitlines()) == 3
+    
+    def test_segments_rejects_empty_range(self, client):
+        """Verify 'to' must be after 'from'."""
+        # Act
+        response = client.get("/transcripts/1/segments?from=60&to=30")
+        
+        # Assert
+        assert response.status_code == 400
+    
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.get_summary')
+    def test_segments_returns_404_for_unauthorized_access(self, mock_summary, client):
+        """Verify 404 when the transcript is missing or owned by someone else."""
+        # Arrange
+        mock_summary.return_value = None
+        
+        # Act
+        response = client.get("/transcripts/999/segments")
+        
+        # Assert
+        assert response.status_code == 404
+
+
+class TestTranscriptSearchEndpoint:
+    """Tests for GET /transcripts/search endpoint."""
+    
+    @patch('api.zoom_resume.transcripts.TranscriptSearchService.search')
+    def test_search_returns_ranked_segment_hits(self, mock_search, client):
+        """Verify hits are returned for the current user with their timestamps."""
+        # Arrange
+        mock_search.return_value = [{
+            "transcript_id": 7, "segment_id": 3, "start": 120.0, "end": 125.5,
+            "speaker": "SPEAKER_1", "text": "Kita bertemu lagi minggu depan", "score": 2.4
+        }]
+        
+        # Act
+        response = client.get("/transcripts/search?q=pertemuan&limit=5")
+        
+        # Assert
+        assert response.status_code == 200
+        data = response.json()
+        assert data["query"] == "pertemuan"
+        assert data["items"][0]["transcript_id"] == 7
+        assert data["items"][0]["start"] == 120.0
+        assert mock_search.call_args.args[1:] == (123, "pertemuan", 5)
+    
+    def test_search_requires_query(self, client):
+        """Verify an empty query is rejected instead of matching everything."""
+        # Act
+        response = client.get("/transcripts/search?q=")
+        
+        # Assert
+        assert response.status_code == 422
+
+
+class TestTranscriptExportEndpoint:
+    """Tests for GET /transcripts/{id}/export endpoint."""
+    
+    @patch('api.zoom_resume.transcripts.export_artifact_path')
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.stream_segments')
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.get_summary')
+    def test_export_streams_then_serves_cached_artifact(
+        self, mock_summary, mock_stream, mock_path, client, tmp_path
+    ):
+        """Verify the first download is rendered and cached, the second read from disk."""
+        # Arrange
+        mock_summary.return_value = Mock(id=1, status=TranscriptStatus.DONE, updated_at=datetime(2026, 10, 1))
+        mock_stream.side_effect = TestTranscriptSegmentsEndpoint._rows(0.0, 5.0)
+        mock_path.return_value = tmp_path / "1-1.srt"
+        
+        # Act
+        first = client.get("/transcripts/1/export?format=srt")
+        second = client.get("/transcripts/1/export?format=srt")
+        
+        # Assert
+        assert first.status_code == second.status_code == 200
+        assert first.text.startswith("1\n00:00:00,000 --> 00:00:05,000\nSPEAKER_0: seg 0")
+        assert 'filename="transcript-1.srt"' in first.headers["content-disposition"]
+        assert second.content == first.content
+        assert mock_stream.call_count == 1
+    
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.get_summary')
+    def test_export_rejects_unfinished_transcript(self, mock_summary, client):
+        """Verify 409 while the transcript is still processing."""
+        # Arrange
+        mock_summary.return_value = Mock(id=1, status=TranscriptStatus.PROCESSING)
+        
+        # Act
+        response = client.get("/transcripts/1/export?format=txt")
+        
+        # Assert
+        assert response.status_code == 409
+    
+    def test_export_rejects_unknown_format(self, client):
+        """Verify only supported formats are accepted."""
+        # Act
+        response = client.get("/transcripts/1/export?format=pdf")
+        
+        # Assert
+        assert response.status_code == 422
+
+
+class TestTranscriptAudioEndpoint:
+    """Tests for GET /transcripts/{id}/audio endpoint."""
+    
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.get_summary')
+    def test_audio_serves_requested_byte_range(self, mock_summary, client, tmp_path):
+        """Verify a Range request returns 206 with only the requested bytes."""
+        # Arrange
+        audio = tmp_path / "meeting.wav"
+        audio.write_bytes(bytes(range(256)) * 8)
+        mock_summary.return_value = Mock(id=1, audio_url=str(audio))
+        
+        # Act
+        response = client.get("/transcripts/1/audio", headers={"Range": "bytes=10-19"})
+        
+        # Assert
+        assert response.status_code == 206
+        assert response.content == bytes(range(10, 20))
+        assert response.headers["content-range"] == "bytes 10-19/2048"
+        assert response.headers["accept-ranges"] == "bytes"
+    
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.get_summary')
+    def test_audio_gone_after_retention(self, mock_summary, client, tmp_path):
+        """Verify 410 once the retention sweep removed the recording."""
+        # Arrange
+        mock_summary.return_value = Mock(id=1, audio_url=str(tmp_path / "purged.wav"))
+        
+        # Act
+        response = client.get("/transcripts/1/audio")
+        
+        # Assert
+        assert response.status_code == 410
+    
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.get_summary')
+    def test_audio_not_found(self, mock_summary, client):
+        """Verify 404 for transcripts of other users."""
+        # Arrange
+        mock_summary.return_value = None
+        
+        # Act
+        response = client.get("/transcripts/999/audio")
+        
+        # Assert
+        assert response.status_code == 404
+
+
+class TestStreamTokenEndpoint:
+    """Tests for POST /transcripts/{id}/stream-token and ?token= authentication."""
+    
+    @pytest.fixture
+    def stream_client(self, client):
+        """Client authenticating export/audio/events with the real stream-token check."""
+        app.dependency_overrides.pop(get_current_active_user_for_stream)
+        return client
+    
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.get_summary')
+    def test_issues_token_scoped_to_transcript(self, mock_summary, client):
+        """Verify the token names the user and only this transcript."""
+        # Arrange
+        mock_summary.return_value = Mock(id=1)
+        
+        # Act
+        response = client.post("/transcripts/1/stream-token")
+        
+        # Assert
+        assert response.status_code == 200
+        payload = verify_stream_token(response.json()["token"], 1)
+        assert payload["sub"] == "123"
+        assert response.json()["expires_in"] > 0
+    
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.get_summary')
+    def test_no_token_for_other_users_transcript(self, mock_summary, client):
+        """Verify 404 for transcripts of other users."""
+        # Arrange
+        mock_summary.return_value = None
+        
+        # Act
+        response = client.post("/transcripts/999/stream-token")
+        
+        # Assert
+        assert response.status_code == 404
+    
+    @patch('domains.auth.utils.get_cached_user')
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.get_summary')
+    def test_audio_accepts_stream_token(self, mock_summary, mock_cached_user, stream_client, tmp_path):
+        """Verify <audio src> can play with a stream token in the query string."""
+        # Arrange
+        audio = tmp_path / "meeting.wav"
+        audio.write_bytes(b"RIFF")
+        mock_summary.return_value = Mock(id=1, audio_url=str(audio))
+        mock_cached_user.return_value = get_mock_user()
+        
+        # Act
+        response = stream_client.get(f"/transcripts/1/audio?token={create_stream_token(123, 1)}")
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.content == b"RIFF"
+    
+    @pytest.mark.parametrize("path", ["audio", "export?format=txt", "events"])
+    def test_access_token_rejected_in_query(self, path, stream_client):
+        """Verify the long-lived access token is never accepted from the URL."""
+        # Arrange
+        separator = "&" if "?" in path else "?"
+        token = create_access_token({"sub": "123"})
+        
+        # Act
+        response = stream_client.get(f"/transcripts/1/{path}{separator}token={token}")
+        
+        # Assert
+        assert response.status_code == 401
+    
+    def test_stream_token_of_other_transcript_rejected(self, stream_client):
+        """Verify a stream token only opens the transcript it was issued for."""
+        # Act
+        response = stream_client.get(f"/transcripts/2/audio?token={create_stream_token(123, 1)}")
+        
+        # Assert
+        assert response.status_code == 401
 
 
 class TestTranscriptStatusEndpoint:
@@ -222,3 +725,67 @@ class TestTranscriptStatusEndpoint:
         
         # Assert
         assert response.status_code == 404
+
+
+class TestTranscriptEventsEndpoint:
+    """Tests for GET /transcripts/{id}/events (Server-Sent Events)."""
+    
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.get_summary')
+    def test_events_closes_after_snapshot_when_done(self, mock_get, client):
+        """Verify a finished transcript gets one status event and the stream ends."""
+        # Arrange
+        mock_transcript = Mock()
+        mock_transcript.id = 1
+        mock_transcript.status = TranscriptStatus.DONE
+        mock_transcript.error_message = None
+        mock_get.return_value = mock_transcript
+        
+        # Act
+        response = client.get("/transcripts/1/events")
+        
+        # Assert
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.text.count("event: status") == 1
+        assert '"status": "DONE"' in response.text
+    
+    @patch('api.zoom_resume.transcripts.subscribe_transcript_events')
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.get_summary')
+    def test_events_pushes_updates_until_terminal_status(self, mock_get, mock_subscribe, client):
+        """Verify queued progress and status events are streamed, ending on DONE."""
+        # Arrange
+        import asyncio
+        mock_transcript = Mock()
+        mock_transcript.id = 1
+        mock_transcript.status = TranscriptStatus.PROCESSING
+        mock_transcript.error_message = None
+        mock_get.return_value = mock_transcript
+        
+        def subscribe(transcript_id):
+            queue = asyncio.Queue()
+            queue.put_nowait({"type": "progress", "transcript_id": transcript_id, "stage": "transcribing"})
+            queue.put_nowait({"type": "status", "transcript_id": transcript_id, "status": "DONE"})
+            return queue
+        mock_subscribe.side_effect = subscribe
+        
+        # Act
+        response = client.get("/transcripts/1/events")
+        
+        # Assert
+        events = [line for line in response.text.splitlines() if line.startswith("event:")]
+        assert events == ["event: status", "event: progress", "event: status"]
+        assert '"stage": "transcribing"' in response.text
+    
+    @patch('api.zoom_resume.transcripts.AsyncTranscriptService.get_summary')
+    def test_events_returns_404_and_unsubscribes(self, mock_get, client):
+        """Verify unknown transcripts are rejected without leaking a subscription."""
+        # Arrange
+        from domains.zoom_resume.transcript.events import event_bus
+        mock_get.return_value = None
+        
+        # Act
+        response = client.get("/transcripts/999/events")
+        
+        # Assert
+        assert response.status_code == 404
+        assert event_bus.subscriber_count(999) == 0
@@ -0,0 +1,89 @@
+"""
+Unit tests for domains/zoom_resume/transcript/cache.py
+Tests size-bounded LRU eviction of serialized transcripts.
+"""
+from datetime import datetime
+
+from domains.zoom_resume.transcript.cache import ByteLRUCache, transcript_cache_key
+
+
+class TestByteLRUCache:
+    """Tests for the byte-bounded LRU cache."""
+
+    def test_evicts_least_recently_used_when_over_budget(self):
+        """Verify the oldest untouched entry is dropped to stay within max_bytes."""
+        # Arrange
+        cache = ByteLRUCache(max_bytes=400)
+        cache.put("a", b"x" * 100)
+        cache.put("b", b"x" * 100)
+        cache.put("c", b"x" * 100)
+        cache.get("a")
+
+        # Act
+        cache.put("d", b"x" * 100)
+        cache.put("e", b"x" * 100)
+
+        # Assert
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.size == 400
+
+    def test_skips_values_too_large_for_budget(self):
+        """Verify one oversized body cannot flush the whole cache."""
+        # Arrange
+        cache = ByteLRUCache(max_bytes=400)
+        cache.put("a", b"x" * 50)
+
+        # Act
+        cache.put("huge", b"x" * 101)
+
+        # Assert
+        assert cache.get("huge") is None
+        assert cache.get("a") == b"x" * 50
+
+    def test_replacing_entry_updates_size(self):
+        """Verify re-putting a key does not double count its bytes."""
+        # Arrange
+        cache = ByteLRUCache(max_bytes=400)
+
+        # Act
+        cache.put("a", b"x" * 80)
+        cache.put("a", b"x" * 20)
+
+        # Assert
+        assert cache.size == 20
+        assert len(cache) == 1
+
+    def test_key_changes_with_updated_at(self):
+        """Verify an update to the row makes the old entry unreachable."""
+        assert transcript_cache_key(1, datetime(2026, 1, 1)) != transcript_cache_key(1, datetime(2026, 1, 2))
+
+
+class TestDumpTranscriptJson:
+    """Tests for the Pydantic-free transcript serializer."""
+
+    def test_matches_transcript_response(self):
+        """Verify the fast path emits the same document as TranscriptResponse."""
+        # Arrange
+        import json
+        from unittest.mock import Mock
+        from domains.zoom_resume.transcript.model import TranscriptStatus
+        from domains.zoom_resume.transcript.schemas import TranscriptResponse
+        from domains.zoom_resume.transcript.serialization import dump_transcript_json
+        transcript = Mock(
+            id=1, user_id=2, audio_url="uploads/a.wav", status=TranscriptStatus.DONE,
+            language="id", full_text="Halo. Apa kabar?", error_message=None,
+            segments=[
+                {"id": 0, "start": 0, "end": 1.5, "text": "Halo.", "speaker": "SPEAKER_0", "words": []},
+                {"id": 1, "start": 1.5, "end": 3.25, "text": "Apa kabar?"},
+            ],
+            created_at=datetime(2026, 10, 1, 8, 0, 0),
+            updated_at=datetime(2026, 10, 1, 8, 30, 0, 250000)
+        )
+
+        # Act
+        fast = json.loads(dump_transcript_json(transcript))
+        reference = json.loads(TranscriptResponse.from_orm(transcript).model_dump_json())
+
+        # Assert
+        assert fast == reference
@@ -0,0 +1,151 @@
+"""
+Unit tests for domains/zoom_resume/transcript/export.py
+Tests SRT/VTT/TXT/DOCX rendering and on-disk artifact caching.
+"""
+import asyncio
+import io
+import zipfile
+from types import SimpleNamespace
+from xml.etree import ElementTree
+
+import pytest
+
+from domains.zoom_resume.transcript.export import (
+    ExportFormat,
+    cache_while_streaming,
+    format_timestamp,
+    render_export,
+)
+
+
+def _rows(*segments):
+    async def stream():
+        for start, end, speaker, text in segments:
+            yield SimpleNamespace(start=start, end=end, speaker=speaker, text=text)
+    return stream()
+
+
+def _render(export_format, rows, **kwargs) -> bytes:
+    async def collect():
+        return b"".join([chunk async for chunk in render_export(rows, export_format, **kwargs)])
+    return asyncio.run(collect())
+
+
+SEGMENTS = (
+    (0.0, 2.5, "SPEAKER_0", "Selamat pagi."),
+    (3725.04, 3727.0, None, "Rapat <ditutup> & selesai"),
+)
+
+
+class TestTextExports:
+    """Tests for subtitle and plain text formats."""
+
+    def test_format_timestamp(self):
+        """Verify SRT and WebVTT clock formats."""
+        assert format_timestamp(3725.04) == "01:02:05,040"
+        assert format_timestamp(0.5, ".") == "00:00:00.500"
+
+    def test_srt_numbers_cues_and_prefixes_speaker(self):
+        """Verify SRT cues are numbered from 1 with speaker labels."""
+        # Act
+        output = _render(ExportFormat.SRT, _rows(*SEGMENTS)).decode()
+
+        # Assert
+        assert output == (
+            "1\n00:00:00,000 --> 00:00:02,500\nSPEAKER_0: Selamat pagi.\n\n"
+            "2\n01:02:05,040 --> 01:02:07,000\nRapat <ditutup> & selesai\n\n"
+        )
+
+    def test_vtt_has_header_voice_tags_and_escaped_text(self):
+        """Verify WebVTT header, <v> speaker tags and markup escaping."""
+        # Act
+        output = _render(ExportFormat.VTT, _rows(*SEGMENTS)).decode()
+
+        # Assert
+        assert output.startswith("WEBVTT\n\n00:00:00.000 --> 00:00:02.500\n<v SPEAKER_0>Selamat pagi.\n\n")
+        assert "Rapat &lt;ditutup&gt; &amp; selesai" in output
+
+    def test_txt_lines(self):
+        """Verify one timestamped line per segment."""
+        # Act
+        output = _render(ExportFormat.TXT, _rows(*SEGMENTS)).decode()
+
+        # Assert
+        assert output.splitlines() == [
+            "[00:00:00] SPEAKER_0: Selamat pagi.",
+            "[01:02:05] Rapat <ditutup> & selesai",
+        ]
+
+
+class TestDocxExport:
+    """Tests for streamed DOCX output."""
+
+    def test_docx_is_a_valid_package_in_many_chunks(self, monkeypatch):
+        """Verify the streamed archive opens and contains every paragraph."""
+        # Arrange
+        from domains.zoom_resume.transcript import export
+        monkeypatch.setattr(export, "EXPORT_BATCH_SIZE", 10)
+        segments = [(i * 2.0, i * 2.0 + 1.5, "SPEAKER_1", f"kalimat {i}") for i in range(50)]
+
+        async def collect():
+            return [chunk async for chunk in render_export(_rows(*segments), ExportFormat.DOCX, title="Rapat")]
+
+        # Act
+        chunks = asyncio.run(collect())
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(chunks)))
+
+        # Assert
+        assert len(chunks) > 1
+        assert archive.testzip() is None
+        document = ElementTree.fromstring(archive.read("word/document.xml"))
+        ns = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+        paragraphs = document.findall(".//w:p", ns)
+        assert len(paragraphs) == 51  # title + segments
+        assert "kalimat 49" in ElementTree.tostring(paragraphs[-1], encoding="unicode")
+
+
+class TestCacheWhileStreaming:
+    """Tests for export artifact caching."""
+
+    def test_artifact_written_after_complete_stream_and_old_versions_removed(self, tmp_path):
+        """Verify the artifact appears only on completion and replaces older versions."""
+        # Arrange
+        stale = tmp_path / "7-100.txt"
+        stale.write_bytes(b"old")
+        artifact = tmp_path / "7-200.txt"
+
+        async def chunks():
+            yield b"a"
+            assert not artifact.exists()
+            yield b"b"
+
+        async def consume():
+            return [chunk async for chunk in cache_while_streaming(chunks(), artifact)]
+
+        # Act
+        received = asyncio.run(consume())
+
+        # Assert
+        assert received == [b"a", b"b"]
+        assert artifact.read_bytes() == b"ab"
+        assert not stale.exists()
+
+    def test_failed_stream_leaves_no_artifact(self, tmp_path):
+        """Verify an interrupted export does not leave partial files."""
+        # Arrange
+        artifact = tmp_path / "7-200.txt"
+
+        async def chunks():
+            yield b"a"
+            raise RuntimeError("database went away")
+
+        async def consume():
+            async for _ in cache_while_streaming(chunks(), artifact):
+                pass
+
+        # Act
+        with pytest.raises(RuntimeError):
+            asyncio.run(consume())
+
+        # Assert
+        assert list(tmp_path.iterdir()) == []
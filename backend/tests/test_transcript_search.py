@@ -0,0 +1,154 @@
+"""
+Unit tests for domains/zoom_resume/transcript/search.py
+Tests Indonesian normalization and search index maintenance.
+"""
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+
+from domains.zoom_resume.transcript.search import (
+    TranscriptSearchService,
+    build_match_query,
+    normalize_text,
+    stem_indonesian,
+    stem_variants,
+)
+
+
+class TestIndonesianNormalization:
+    """Tests for the tokenizer/stemmer shared by indexing and querying."""
+
+    @pytest.mark.parametrize("word, stem", [
+        ("pertemuannya", "temu"),
+        ("pertemuan", "temu"),
+        ("bertemu", "temu"),
+        ("menyampaikan", "sampai"),
+        ("memutuskan", "putus"),
+        ("keputusan", "putus"),
+        ("perbaikan", "baik"),
+        ("perbaiki", "baik"),
+        ("pemasukan", "masuk"),
+        ("masuk", "masuk"),
+    ])
+    def test_inflections_share_a_stem(self, word, stem):
+        """Verify affixed forms map to the same key."""
+        assert stem_indonesian(word) == stem
+
+    @pytest.mark.parametrize("word, root", [
+        ("memakai", "pakai"),
+        ("mengirim", "kirim"),
+        ("menulis", "tulis"),
+        ("pengiriman", "kirim"),
+        ("pemerintah", "perintah"),
+        ("menyampaikan", "sampai"),
+    ])
+    def test_nasal_prefix_restores_dropped_consonant(self, word, root):
+        """Verify a word with a nasal prefix stems like its bare root."""
+        assert stem_indonesian(word) == stem_indonesian(root)
+
+    @pytest.mark.parametrize("word, root", [
+        ("mengambil", "ambil"),
+        ("memakan", "makan"),
+        ("menilai", "nilai"),
+        ("menyanyikan", "nyanyi"),
+    ])
+    def test_nasal_prefix_keeps_roots_it_did_not_change(self, word, root):
+        """Verify the other reading of a nasal prefix is kept as a variant."""
+        assert stem_indonesian(root) in stem_variants(word)
+
+    @pytest.mark.parametrize("word", ["makan", "sampai", "pakai", "temu", "rapat"])
+    def test_roots_are_left_alone(self, word):
+        """Verify a bare -an/-i ending is not stripped from roots."""
+        assert stem_indonesian(word) == word
+
+    def test_normalize_drops_stopwords_and_accents(self):
+        """Verify lowercasing, accent folding and stopword removal."""
+        assert normalize_text("Kita akan MEMUTUSKAN itu di café") == "putus mutus memutuskan cafe"
+
+    def test_match_query_requires_all_terms_with_prefix_on_last(self):
+        """Verify query terms are ANDed and the last term is a prefix."""
+        assert build_match_query("keputusan anggar") == '"putus" AND "anggar"*'
+
+    def test_match_query_leaves_last_term_unstemmed(self):
+        """Verify a half-typed last word is a raw prefix, not a stem of the fragment."""
+        assert build_match_query("anggaran perte") == '"anggaran" AND ("rte" OR "perte"*)'
+
+    def test_match_query_accepts_any_nasal_reading(self):
+        """Verify ambiguous nasal prefixes match either root."""
+        assert build_match_query("mengambil rapat") == '("kambil" OR "ambil") AND "rapat"*'
+
+    def test_match_query_without_searchable_terms(self):
+        """Verify a query of only stopwords searches nothing."""
+        assert build_match_query("yang dan di") is None
+
+
+class TestTranscriptSearchService:
+    """Tests for FTS5 index maintenance and ranking on SQLite."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        path = tmp_path / "search.db"
+        engine = create_engine(f"sqlite:///{path}")
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE transcripts (id INTEGER PRIMARY KEY, user_id INTEGER)"))
+            conn.execute(text("""
+                CREATE TABLE transcript_segments (
+                    id INTEGER PRIMARY KEY, transcript_id INTEGER, seq INTEGER,
+                    start_time FLOAT, end_time FLOAT, speaker VARCHAR(50), text TEXT
+                )
+            """))
+            conn.execute(text("INSERT INTO transcripts VALUES (1, 10), (2, 20)"))
+            conn.execute(text("""
+                INSERT INTO transcript_segments VALUES
+                    (1, 1, 0, 0.0, 5.0, 'SPEAKER_0', 'Selamat pagi semuanya'),
+                    (2, 1, 1, 5.0, 9.0, 'SPEAKER_1', 'Kita bertemu lagi untuk membahas anggaran'),
+                    (3, 2, 0, 0.0, 4.0, 'SPEAKER_0', 'Pertemuan tim lain')
+            """))
+            TranscriptSearchService.ensure_index(conn)
+            TranscriptSearchService.index_transcript(conn, 1, 10)
+            TranscriptSearchService.index_transcript(conn, 2, 20)
+        engine.dispose()
+        return path
+
+    def _search(self, db_path, user_id, query):
+        async def run():
+            engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+            async with AsyncSession(engine) as db:
+                hits = await TranscriptSearchService.search(db, user_id, query)
+            await engine.dispose()
+            return hits
+        return asyncio.run(run())
+
+    def test_search_matches_inflected_forms_for_owner_only(self, db_path):
+        """Verify 'pertemuannya' finds 'bertemu' and other users' segments are excluded."""
+        # Act
+        hits = self._search(db_path, 10, "pertemuannya")
+
+        # Assert
+        assert [(h["transcript_id"], h["segment_id"], h["start"]) for h in hits] == [(1, 1, 5.0)]
+        assert hits[0]["text"] == "Kita bertemu lagi untuk membahas anggaran"
+
+    @pytest.mark.parametrize("query", ["perte", "pertem", "tim perte"])
+    def test_search_as_you_type_matches_partial_last_word(self, db_path, query):
+        """Verify a half-typed word finds the segment before it is complete."""
+        # Act
+        hits = self._search(db_path, 20, query)
+
+        # Assert
+        assert [h["text"] for h in hits] == ["Pertemuan tim lain"]
+
+    def test_remove_transcript_drops_entries(self, db_path):
+        """Verify removed transcripts no longer match."""
+        # Arrange
+        engine = create_engine(f"sqlite:///{db_path}")
+        with engine.begin() as conn:
+            TranscriptSearchService.remove_transcript(conn, 1)
+        engine.dispose()
+
+        # Act
+        hits = self._search(db_path, 10, "anggaran")
+
+        # Assert
+        assert hits == []
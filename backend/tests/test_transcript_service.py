@@ -3,10 +3,18 @@ Unit tests for TranscriptService domain logic.
 Tests CRUD operations, status lifecycle, and file cleanup.
 """
 import pytest
-from unittest.mock import Mock, MagicMock, patch
+from unittest.mock import AsyncMock, Mock, MagicMock, patch
 from datetime import datetime
+import asyncio
 
-from domains.zoom_resume.transcript.service import TranscriptService
+from domains.zoom_resume.transcript.service import (
+    TranscriptService,
+    AsyncTranscriptService,
+    encode_cursor,
+    decode_cursor,
+    _split_page
+)
+from core.exceptions import InvalidCursorError
 from domains.zoom_resume.transcript.model import Transcript, TranscriptStatus
 
 
@@ -187,6 +195,72 @@ class TestTranscriptService:
         assert mock_transcript.language == "en"
         assert mock_transcript.full_text == "Test"
     
+    @patch('domains.zoom_resume.transcript.service.publish_transcript_event')
+    @patch('domains.zoom_resume.transcript.service.TranscriptService.cleanup_audio_file')
+    def test_save_result_publishes_segment_batches_before_done(self, mock_cleanup, mock_publish):
+        """Verify saved segments are pushed in batches ahead of the closing DONE event."""
+        # Arrange
+        mock_db = Mock()
+        mock_db.query.return_value.filter.return_value.first.return_value = Mock(spec=Transcript, id=1, user_id=5)
+        segments = [{"start": float(i), "end": i + 1.0, "text": f"seg {i}"} for i in range(45)]
+        
+        # Act
+        TranscriptService.save_result(mock_db, transcript_id=1, language="id", full_text="", segments=segments)
+        
+        # Assert
+        events = [(c.args[1], c.kwargs) for c in mock_publish.call_args_list]
+        assert [name for name, _ in events] == ["segments", "segments", "segments", "status"]
+        assert [data["offset"] for _, data in events[:3]] == [0, 20, 40]
+        assert sum((data["segments"] for _, data in events[:3]), []) == segments
+        assert events[3][1]["status"] == "DONE"
+    
+    @patch('domains.zoom_resume.transcript.service.settings')
+    @patch('domains.zoom_resume.transcript.service.TranscriptService.cleanup_audio_file')
+    def test_save_result_schedules_audio_retention_by_default(self, mock_cleanup, mock_settings):
+        """Verify the audio is kept and given an expiry when retention is configured."""
+        # Arrange
+        mock_settings.AUDIO_RETENTION_DAYS = 30
+        mock_db = Mock()
+        mock_transcript = Mock(spec=Transcript)
+        mock_transcript.id = 1
+        mock_db.query.return_value.filter.return_value.first.return_value = mock_transcript
+        
+        # Act
+        TranscriptService.save_result(mock_db, transcript_id=1, language="en", full_text="Test", segments=[])
+        
+        # Assert
+        mock_cleanup.assert_not_called()
+        assert (mock_transcript.audio_expires_at - mock_transcript.updated_at).days == 30
+    
+    @patch('domains.zoom_resume.transcript.service.TranscriptService.cleanup_audio_file')
+    def test_purge_expired_audio_deletes_files_and_clears_expiry(self, mock_cleanup):
+        """Verify expired recordings are removed and their rows updated in one commit."""
+        # Arrange
+        mock_db = Mock()
+        mock_db.execute.return_value.all.return_value = [(1, "/a.wav"), (2, "/b.wav")]
+        
+        # Act
+        purged = TranscriptService.purge_expired_audio(mock_db, now=datetime(2026, 10, 1))
+        
+        # Assert
+        assert purged == 2
+        assert [c.args[0] for c in mock_cleanup.call_args_list] == ["/a.wav", "/b.wav"]
+        assert mock_db.execute.call_count == 2
+        mock_db.commit.assert_called_once()
+    
+    def test_purge_expired_audio_noop_when_nothing_expired(self):
+        """Verify no update or commit happens without expired audio."""
+        # Arrange
+        mock_db = Mock()
+        mock_db.execute.return_value.all.return_value = []
+        
+        # Act
+        purged = TranscriptService.purge_expired_audio(mock_db)
+        
+        # Assert
+        assert purged == 0
+        mock_db.commit.assert_not_called()
+    
     def test_get_by_id_returns_transcript_for_authorized_user(self):
         """Verify get_by_id returns transcript when user authorized."""
         # Arrange
@@ -227,3 +301,71 @@ class TestTranscriptService:
         # Assert
         assert len(transcripts) == 5
         assert total == 10
+
+
+class TestTranscriptKeysetPagination:
+    """Tests for cursor encoding and page splitting."""
+    
+    def test_cursor_round_trip(self):
+        """Verify a cursor decodes back to the same (created_at, id) position."""
+        # Arrange
+        created_at = datetime(2024, 5, 17, 9, 30, 0, 123456)
+        
+        # Act
+        cursor = encode_cursor(created_at, 42)
+        
+        # Assert
+        assert decode_cursor(cursor) == (created_at, 42)
+    
+    def test_decode_rejects_garbage(self):
+        """Verify malformed cursors raise InvalidCursorError."""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor("not-a-cursor")
+    
+    def test_split_page_uses_look_ahead_row(self):
+        """Verify limit + 1 rows yields a cursor at the last returned row."""
+        # Arrange
+        rows = [Mock(created_at=datetime(2024, 1, 10 - i), id=10 - i) for i in range(4)]
+        
+        # Act
+        page, next_cursor = _split_page(rows, 3)
+        last_page, no_cursor = _split_page(rows[:2], 3)
+        
+        # Assert
+        assert page == rows[:3]
+        assert decode_cursor(next_cursor) == (datetime(2024, 1, 8), 8)
+        assert no_cursor is None and last_page == rows[:2]
+
+
+class TestAsyncTranscriptService:
+    """Tests for AsyncTranscriptService (AsyncSession variants)."""
+    
+    def test_create_transcript_awaits_commit(self):
+        """Verify async create adds a PENDING transcript and awaits commit/refresh."""
+        # Arrange
+        mock_db = Mock()
+        mock_db.commit = AsyncMock()
+        mock_db.refresh = AsyncMock()
+        
+        # Act
+        result = asyncio.run(AsyncTranscriptService.create_transcript(
+            mock_db,
+            user_id=123,
+            audio_url="/path/to/audio.wav"
+        ))
+        
+        # Assert
+        assert result.status == TranscriptStatus.PENDING
+        mock_db.add.assert_called_once_with(result)
+        mock_db.commit.assert_awaited_once()
+        mock_db.refresh.assert_awaited_once_with(result)
+    
+    def test_update_status_raises_for_missing_transcript(self):
+        """Verify async update_status raises ValueError like the sync variant."""
+        # Arrange
+        mock_db = Mock()
+        mock_db.get = AsyncMock(return_value=None)
+        
+        # Act & Assert
+        with pytest.raises(ValueError):
+            asyncio.run(AsyncTranscriptService.update_status(mock_db, 999, TranscriptStatus.DONE))
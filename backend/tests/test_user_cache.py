@@ -0,0 +1,156 @@
+"""
+Unit tests for domains/user/cache.py and its use in token authentication.
+Tests TTL expiry, invalidation, and that cache hits skip the database.
+"""
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+import asyncio
+
+from fastapi import HTTPException
+
+from domains.user import cache
+from domains.user.cache import cache_user, get_cached_user, invalidate_user
+from domains.user.service import UserService
+from domains.auth.utils import _authenticate_token, _authenticate_token_async
+
+
+class TestUserCache:
+    """Tests for the per-process user cache."""
+    
+    def test_cached_user_is_detached_copy(self, sample_user):
+        """Verify hits return a new instance without credentials."""
+        # Arrange
+        cache_user(sample_user)
+        
+        # Act
+        first = get_cached_user(sample_user.id)
+        second = get_cached_user(sample_user.id)
+        
+        # Assert
+        assert first is not second
+        assert first.email == sample_user.email
+        assert first.is_verified is True
+        assert first.hashed_password is None
+    
+    def test_entry_expires_after_ttl(self, sample_user):
+        """Verify entries are ignored once the TTL has passed."""
+        # Arrange
+        cache_user(sample_user)
+        
+        # Act
+        with patch('domains.user.cache.time.monotonic', return_value=10 ** 9):
+            result = get_cached_user(sample_user.id)
+        
+        # Assert
+        assert result is None
+    
+    @patch('domains.user.cache.settings')
+    def test_disabled_when_ttl_is_zero(self, mock_settings, sample_user):
+        """Verify AUTH_USER_CACHE_SECONDS=0 turns caching off."""
+        # Arrange
+        mock_settings.AUTH_USER_CACHE_SECONDS = 0
+        
+        # Act
+        cache_user(sample_user)
+        
+        # Assert
+        assert get_cached_user(sample_user.id) is None
+    
+    def test_invalidate_user_drops_entry(self, sample_user):
+        """Verify invalidation forces the next lookup to the database."""
+        # Arrange
+        cache_user(sample_user)
+        
+        # Act
+        invalidate_user(sample_user.id)
+        
+        # Assert
+        assert get_cached_user(sample_user.id) is None
+    
+    @patch('domains.user.cache.USER_CACHE_MAX_ENTRIES', 2)
+    def test_size_is_bounded(self, sample_user, unverified_user, expired_otp_user):
+        """Verify the oldest entry is evicted when the cache is full."""
+        # Act
+        for user in (sample_user, unverified_user, expired_otp_user):
+            cache_user(user)
+        
+        # Assert
+        assert len(cache._user_cache) == 2
+        assert get_cached_user(sample_user.id) is None
+        assert get_cached_user(expired_otp_user.id) is not None
+
+
+class TestUserServiceInvalidation:
+    """Tests that user changes invalidate the cache."""
+    
+    def test_verify_user_invalidates(self, mock_db_session, unverified_user):
+        """Verify a newly verified user is not served from a stale entry."""
+        # Arrange
+        cache_user(unverified_user)
+        
+        # Act
+        UserService.verify_user(mock_db_session, unverified_user)
+        
+        # Assert
+        assert get_cached_user(unverified_user.id) is None
+    
+    def test_set_active_invalidates(self, mock_db_session, sample_user):
+        """Verify deactivation takes effect on the next request."""
+        # Arrange
+        cache_user(sample_user)
+        
+        # Act
+        UserService.set_active(mock_db_session, sample_user, False)
+        
+        # Assert
+        assert sample_user.is_active is False
+        assert get_cached_user(sample_user.id) is None
+
+
+class TestAuthenticateTokenCache:
+    """Tests for cached lookups in token authentication."""
+    
+    @patch('domains.auth.utils.verify_access_token', return_value={"sub": "1"})
+    @patch('domains.auth.utils.UserService.get_by_id')
+    def test_second_request_skips_database(self, mock_get_by_id, mock_verify, sample_user):
+        """Verify only the first request within the TTL queries the user."""
+        # Arrange
+        mock_get_by_id.return_value = sample_user
+        db = Mock()
+        
+        # Act
+        first = _authenticate_token("token", db)
+        second = _authenticate_token("token", db)
+        
+        # Assert
+        assert first.id == second.id == 1
+        mock_get_by_id.assert_called_once()
+    
+    @patch('domains.auth.utils.verify_access_token', return_value={"sub": "1"})
+    @patch('domains.auth.utils.AsyncUserService.get_by_id', new_callable=AsyncMock)
+    def test_async_hit_does_not_touch_session(self, mock_get_by_id, mock_verify, sample_user):
+        """Verify the async variant serves hits without using the session."""
+        # Arrange
+        mock_get_by_id.return_value = sample_user
+        db = AsyncMock()
+        asyncio.run(_authenticate_token_async("token", db))
+        db.reset_mock()
+        
+        # Act
+        user = asyncio.run(_authenticate_token_async("token", db))
+        
+        # Assert
+        assert user.email == sample_user.email
+        mock_get_by_id.assert_called_once()
+        assert not db.method_calls
+    
+    @patch('domains.auth.utils.verify_access_token', return_value={"sub": "1"})
+    def test_cached_deactivated_user_is_rejected(self, mock_verify, sample_user):
+        """Verify the active check still applies to cached users."""
+        # Arrange
+        sample_user.is_active = False
+        cache_user(sample_user)
+        
+        # Act / Assert
+        with pytest.raises(HTTPException):
+            _authenticate_token("token", Mock())
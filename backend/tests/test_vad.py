@@ -0,0 +1,137 @@
+"""
+Unit tests for api/zoom_transcript/vad.py
+Tests the streaming Silero VAD state machine, region merging and model lookup.
+"""
+import numpy as np
+import pytest
+
+from api.zoom_transcript import vad
+from api.zoom_transcript.vad import FRAME_SAMPLES, SAMPLE_RATE, SileroVAD, merge_segments
+
+
+class _ScriptedSession:
+    """Stands in for the ONNX Runtime session: returns scripted speech scores."""
+
+    def __init__(self, probabilities):
+        self.probabilities = list(probabilities)
+        self.inputs = []
+
+    def run(self, output_names, feeds):
+        self.inputs.append(feeds["input"])
+        return [np.array([[self.probabilities.pop(0)]], dtype=np.float32), feeds["state"] + 1]
+
+
+# 2 silent frames, 10 speech frames, 10 silent frames
+SCRIPT = [0.0] * 2 + [0.9] * 10 + [0.0] * 10
+
+
+class TestSileroVAD:
+    """Tests for SileroVAD."""
+
+    def test_emits_padded_start_and_end(self):
+        """Verify speech start and end follow silero's VADIterator rules."""
+        # Arrange
+        detector = SileroVAD(session=_ScriptedSession(SCRIPT))
+
+        # Act
+        events = [e for e in (detector(np.zeros(FRAME_SAMPLES)) for _ in SCRIPT) if e]
+
+        # Assert: start is padded back 30 ms, end waits out 100 ms of silence
+        assert events == [{"start": 3 * FRAME_SAMPLES - 480 - FRAME_SAMPLES},
+                          {"end": 13 * FRAME_SAMPLES + 480 - FRAME_SAMPLES}]
+
+    def test_short_dip_does_not_end_speech(self):
+        """Verify a pause shorter than min_silence_ms keeps the region open."""
+        # Arrange
+        detector = SileroVAD(session=_ScriptedSession([0.9, 0.0, 0.9, 0.9]))
+
+        # Act
+        events = [detector(np.zeros(FRAME_SAMPLES)) for _ in range(4)]
+
+        # Assert
+        assert [e for e in events if e] == [{"start": 0}]
+
+    def test_frames_carry_context_and_state(self):
+        """Verify each frame is scored with the previous frame's tail and state."""
+        # Arrange
+        session = _ScriptedSession([0.0, 0.0])
+        detector = SileroVAD(session=session)
+        first = np.arange(FRAME_SAMPLES, dtype=np.float32)
+
+        # Act
+        detector(first)
+        detector(np.zeros(FRAME_SAMPLES, dtype=np.float32))
+
+        # Assert
+        assert session.inputs[1].shape == (1, 64 + FRAME_SAMPLES)
+        assert session.inputs[1][0, :64].tolist() == first[-64:].tolist()
+        assert detector._state.max() == 2
+
+
+class TestStreamSpeech:
+    """Tests for stream_speech."""
+
+    def test_regions_are_in_seconds(self, monkeypatch):
+        """Verify decoded windows become speech regions on the recording timeline."""
+        # Arrange: windows of odd sizes, so frames straddle window boundaries
+        total = len(SCRIPT) * FRAME_SAMPLES
+        monkeypatch.setattr(vad, "stream_pcm", lambda *args: iter([np.zeros(1000), np.zeros(total - 1000)]))
+        monkeypatch.setattr(vad, "load_session", lambda: _ScriptedSession(SCRIPT))
+
+        # Act
+        regions = list(vad.stream_speech("clean.wav", min_speech=0.1))
+
+        # Assert
+        assert regions == [pytest.approx({"start": 544 / SAMPLE_RATE, "end": 6624 / SAMPLE_RATE})]
+
+    def test_speech_until_the_end_is_closed(self, monkeypatch):
+        """Verify a region still open when the audio ends is closed at the end."""
+        # Arrange
+        monkeypatch.setattr(vad, "stream_pcm", lambda *args: iter([np.zeros(20 * FRAME_SAMPLES)]))
+        monkeypatch.setattr(vad, "load_session", lambda: _ScriptedSession([0.9] * 20))
+
+        # Act
+        regions = vad.detect_speech("clean.wav")
+
+        # Assert
+        assert regions == [pytest.approx({"start": 0.0, "end": 20 * FRAME_SAMPLES / SAMPLE_RATE})]
+
+
+class TestMergeSegments:
+    """Tests for merge_segments."""
+
+    def test_merges_short_gaps_lazily(self):
+        """Verify close regions merge and distant ones stay apart."""
+        # Arrange
+        regions = iter([{"start": 0.0, "end": 1.0}, {"start": 1.2, "end": 2.0}, {"start": 3.0, "end": 4.0}])
+
+        # Act
+        merged = merge_segments(regions)
+
+        # Assert
+        assert next(merged) == {"start": 0.0, "end": 2.0}
+        assert list(merged) == [{"start": 3.0, "end": 4.0}]
+
+
+class TestModelPath:
+    """Tests for model_path."""
+
+    def test_explicit_path_wins(self, monkeypatch, tmp_path):
+        """Verify SILERO_VAD_MODEL points at a local model file."""
+        # Arrange
+        model = tmp_path / "silero_vad.onnx"
+        model.write_bytes(b"onnx")
+        monkeypatch.setenv("SILERO_VAD_MODEL", str(model))
+
+        # Act & Assert
+        assert vad.model_path() == str(model)
+
+    def test_missing_model_is_reported(self, monkeypatch, tmp_path):
+        """Verify a missing model fails clearly instead of downloading."""
+        # Arrange
+        monkeypatch.setenv("SILERO_VAD_MODEL", str(tmp_path / "missing.onnx"))
+        monkeypatch.setattr(vad.importlib.util, "find_spec", lambda name: None)
+
+        # Act & Assert
+        with pytest.raises(FileNotFoundError):
+            vad.model_path()
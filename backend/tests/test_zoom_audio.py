@@ -0,0 +1,245 @@
+"""
+Unit tests for api/zoom_transcript/zoom_audio.py
+Tests streaming, resumable downloads against a local HTTP stand-in for Zoom.
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from api.zoom_transcript.zoom_audio import IncompleteDownload, download_many, download_zoom_audio
+
+
+RECORDING = bytes(range(256)) * 400  # ~100 KB
+
+
+class _RecordingHandler(BaseHTTPRequestHandler):
+    """Serves RECORDING with Range support; can cut the body short."""
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(dict(self.headers))
+            drop = server.drops > 0
+            server.drops -= 1
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            if server.status != 200:
+                self.send_response(server.status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            start = 0
+            range_header = self.headers.get("Range")
+            if_range = self.headers.get("If-Range")
+            if range_header and server.ranges and if_range in (None, server.etag):
+                start = int(range_header.split("=")[1].rstrip("-"))
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{len(server.body) - 1}/{len(server.body)}")
+            else:
+                self.send_response(200)
+            self.send_header("ETag", server.etag)
+            body = server.body[start:]
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            time.sleep(server.delay)
+            # A dropped connection delivers a third of what was promised
+            self.wfile.write(body[:len(body) // 3] if drop else body)
+            if drop:
+                self.close_connection = True
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def zoom_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RecordingHandler)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.drops = 0
+    server.ranges = True
+    server.status = 200
+    server.delay = 0.0
+    server.body = RECORDING
+    server.etag = '"rec-v1"'
+    server.active = server.max_active = 0
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}/rec/download/abc"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestDownloadZoomAudio:
+    """Tests for download_zoom_audio."""
+
+    def test_streams_recording_with_token(self, zoom_server, tmp_path):
+        """Verify the recording is written in chunks and the bearer token is sent."""
+        # Arrange
+        out_file = str(tmp_path / "meeting.m4a")
+
+        # Act
+        result = download_zoom_audio(zoom_server.url, "secret", out_file, session=requests.Session(), chunk_size=4096)
+
+        # Assert
+        assert result == out_file
+        assert open(out_file, "rb").read() == RECORDING
+        assert zoom_server.requests[0]["Authorization"] == "Bearer secret"
+        assert not (tmp_path / "meeting.m4a.part").exists()
+
+    def test_resumes_after_dropped_connection(self, zoom_server, tmp_path):
+        """Verify retries continue from the bytes already on disk."""
+        # Arrange
+        zoom_server.drops = 2
+        out_file = str(tmp_path / "meeting.m4a")
+
+        # Act
+        download_zoom_audio(zoom_server.url, "secret", out_file, session=requests.Session(),
+                            chunk_size=4096, backoff=0)
+
+        # Assert: at most the chunk being read when the connection broke is fetched again
+        assert open(out_file, "rb").read() == RECORDING
+        ranges = [r.get("Range") for r in zoom_server.requests]
+        assert ranges[0] is None
+        resumed_at = int(ranges[1].split("=")[1].rstrip("-"))
+        assert len(RECORDING) // 3 - 4096 < resumed_at <= len(RECORDING) // 3
+        assert len(ranges) == 3
+
+    @staticmethod
+    def _leftover_part(tmp_path, url, validator='"rec-v1"'):
+        (tmp_path / "meeting.m4a.part").write_bytes(RECORDING[:1000])
+        (tmp_path / "meeting.m4a.part.meta").write_text(json.dumps({"url": url, "validator": validator}))
+
+    def test_resumes_part_file_from_earlier_run(self, zoom_server, tmp_path):
+        """Verify a part file left by an interrupted run is continued if the remote file is unchanged."""
+        # Arrange
+        out_file = tmp_path / "meeting.m4a"
+        self._leftover_part(tmp_path, zoom_server.url)
+
+        # Act
+        download_zoom_audio(zoom_server.url, "secret", str(out_file), session=requests.Session())
+
+        # Assert
+        assert out_file.read_bytes() == RECORDING
+        assert zoom_server.requests[0]["Range"] == "bytes=1000-"
+        assert zoom_server.requests[0]["If-Range"] == '"rec-v1"'
+        assert not (tmp_path / "meeting.m4a.part.meta").exists()
+
+    def test_part_file_of_other_url_is_discarded(self, zoom_server, tmp_path):
+        """Verify a part file downloaded from another URL is not continued."""
+        # Arrange
+        out_file = tmp_path / "meeting.m4a"
+        self._leftover_part(tmp_path, zoom_server.url.replace("abc", "other"))
+
+        # Act
+        download_zoom_audio(zoom_server.url, "secret", str(out_file), session=requests.Session())
+
+        # Assert
+        assert out_file.read_bytes() == RECORDING
+        assert "Range" not in zoom_server.requests[0]
+
+    def test_part_file_without_meta_is_discarded(self, zoom_server, tmp_path):
+        """Verify a part file that cannot be tied to a download is not continued."""
+        # Arrange
+        out_file = tmp_path / "meeting.m4a"
+        (tmp_path / "meeting.m4a.part").write_bytes(b"unknown bytes")
+
+        # Act
+        download_zoom_audio(zoom_server.url, "secret", str(out_file), session=requests.Session())
+
+        # Assert
+        assert out_file.read_bytes() == RECORDING
+        assert "Range" not in zoom_server.requests[0]
+
+    def test_changed_recording_restarts(self, zoom_server, tmp_path):
+        """Verify If-Range fetches the whole new version after the recording changed."""
+        # Arrange
+        zoom_server.body = bytes(reversed(RECORDING))
+        zoom_server.etag = '"rec-v2"'
+        out_file = tmp_path / "meeting.m4a"
+        self._leftover_part(tmp_path, zoom_server.url)
+
+        # Act
+        download_zoom_audio(zoom_server.url, "secret", str(out_file), session=requests.Session())
+
+        # Assert
+        assert out_file.read_bytes() == zoom_server.body
+        assert len(zoom_server.requests) == 1
+
+    def test_server_without_range_support_restarts(self, zoom_server, tmp_path):
+        """Verify a 200 answer to a Range request overwrites the part file."""
+        # Arrange
+        zoom_server.ranges = False
+        out_file = tmp_path / "meeting.m4a"
+        self._leftover_part(tmp_path, zoom_server.url)
+
+        # Act
+        download_zoom_audio(zoom_server.url, "secret", str(out_file), session=requests.Session())
+
+        # Assert
+        assert out_file.read_bytes() == RECORDING
+
+    def test_gives_up_after_max_retries(self, zoom_server, tmp_path):
+        """Verify a server that keeps failing without sending data eventually fails."""
+        # Arrange
+        zoom_server.status = 503
+        out_file = tmp_path / "meeting.m4a"
+
+        # Act & Assert
+        with pytest.raises(IncompleteDownload):
+            download_zoom_audio(zoom_server.url, "secret", str(out_file),
+                                session=requests.Session(), max_retries=2, backoff=0)
+        assert not out_file.exists()
+        assert len(zoom_server.requests) == 3
+
+    def test_retries_that_make_progress_do_not_use_up_attempts(self, zoom_server, tmp_path):
+        """Verify the retry budget only counts attempts that received nothing."""
+        # Arrange: more drops than max_retries, but each one delivers data
+        zoom_server.drops = 4
+        out_file = tmp_path / "meeting.m4a"
+
+        # Act
+        download_zoom_audio(zoom_server.url, "secret", str(out_file),
+                            session=requests.Session(), chunk_size=4096, max_retries=2, backoff=0)
+
+        # Assert
+        assert out_file.read_bytes() == RECORDING
+        assert len(zoom_server.requests) == 5
+
+    def test_client_errors_are_not_retried(self, zoom_server, tmp_path):
+        """Verify an expired token fails immediately."""
+        # Arrange
+        zoom_server.status = 401
+
+        # Act & Assert
+        with pytest.raises(requests.HTTPError):
+            download_zoom_audio(zoom_server.url, "expired", str(tmp_path / "meeting.m4a"),
+                                session=requests.Session(), backoff=0)
+        assert len(zoom_server.requests) == 1
+
+
+class TestDownloadMany:
+    """Tests for download_many."""
+
+    def test_limits_concurrent_downloads(self, zoom_server, tmp_path):
+        """Verify every file is downloaded with at most max_concurrent in flight."""
+        # Arrange
+        zoom_server.delay = 0.05
+        downloads = [(zoom_server.url, str(tmp_path / f"meeting{i}.m4a")) for i in range(6)]
+
+        # Act
+        paths = download_many(downloads, "secret", max_concurrent=2, session=requests.Session())
+
+        # Assert
+        assert paths == [out_file for _, out_file in downloads]
+        assert all(open(path, "rb").read() == RECORDING for path in paths)
+        assert zoom_server.max_active == 2
@@ -0,0 +1,151 @@
+"""
+Unit tests for integrations/zoom/bot_utils.py
+Tests meeting link parsing, the incremental captions log helpers and caption draining.
+"""
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from integrations.zoom.bot_utils import extract_zoom_details, append_jsonl, iter_jsonl
+
+
+class TestExtractZoomDetails:
+    """Tests for Zoom meeting link parsing."""
+
+    def test_extracts_meeting_id_and_password(self):
+        """Verify meeting ID and passcode are parsed from a join link."""
+        meeting_id, pwd = extract_zoom_details("https://zoom.us/j/123456789?pwd=abc.def")
+
+        assert meeting_id == "123456789"
+        assert pwd == "abc.def"
+
+
+class TestCaptionsLog:
+    """Tests for JSONL append/iterate helpers used by caption draining."""
+
+    def test_append_then_iter_preserves_order_across_drains(self, tmp_path):
+        """Verify successive appends are read back in order."""
+        # Arrange
+        path = tmp_path / "captions.jsonl"
+
+        # Act
+        append_jsonl(path, [{"type": "transcript", "entry": {"text": "halo"}}])
+        append_jsonl(path, ({"type": "chat", "entry": {"text": n}} for n in ("a", "b")))
+        records = list(iter_jsonl(path))
+
+        # Assert
+        assert [r["entry"]["text"] for r in records] == ["halo", "a", "b"]
+
+    def test_iter_skips_truncated_trailing_line(self, tmp_path):
+        """Verify a partially written line from a crash does not break reading."""
+        # Arrange
+        path = tmp_path / "captions.jsonl"
+        append_jsonl(path, [{"type": "transcript", "entry": "ok"}])
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"type": "transc')
+
+        # Act
+        records = list(iter_jsonl(path))
+
+        # Assert
+        assert records == [{"type": "transcript", "entry": "ok"}]
+
+    def test_iter_missing_file_yields_nothing(self, tmp_path):
+        """Verify reading a log that was never written is a no-op."""
+        assert list(iter_jsonl(tmp_path / "missing.jsonl")) == []
+
+
+class _NodeBrowser:
+    """Runs execute_script under node against a fake localStorage."""
+
+    def __init__(self):
+        self.storage = {}
+
+    def execute_script(self, script, *args):
+        harness = (
+            "const storage = JSON.parse(process.argv[1]);"
+            "const localStorage = {getItem: (key) => storage[key] ?? null};"
+            f"const result = (function () {{ {script} }}).apply(null, JSON.parse(process.argv[2]));"
+            "console.log(JSON.stringify(result));"
+        )
+        storage = {key: json.dumps(value) for key, value in self.storage.items()}
+        output = subprocess.run(["node", "-e", harness, json.dumps(storage), json.dumps(args)],
+                                capture_output=True, text=True, check=True).stdout
+        return json.loads(output)
+
+
+class TestDrainCaptions:
+    """Tests for ZoomBot.drain_captions against the real drain script."""
+
+    @pytest.fixture
+    def bot(self, tmp_path):
+        if not shutil.which("node"):
+            pytest.skip("node is needed to run the drain script")
+        from integrations.zoom.bot import CAPTION_SOURCES, ZoomBot
+        bot = ZoomBot.__new__(ZoomBot)
+        bot.browser = _NodeBrowser()
+        bot.captions_file = str(tmp_path / "meeting_captions.jsonl")
+        bot.caption_cursors = {key: {"index": 0, "key": None} for key in CAPTION_SOURCES}
+        return bot
+
+    def test_last_entry_edited_in_place_is_logged_as_update(self, bot, tmp_path):
+        """Verify a growing live caption is re-sent once, not the whole array again."""
+        # Arrange
+        bot.browser.storage["transcript"] = [{"timestamp": 1, "text": "halo"}, {"timestamp": 2, "text": "kita"}]
+        bot.drain_captions()
+        bot.browser.storage["transcript"] = [{"timestamp": 1, "text": "halo"}, {"timestamp": 2, "text": "kita mulai"},
+                                             {"timestamp": 3, "text": "rapat"}]
+
+        # Act
+        written = bot.drain_captions()
+        out = tmp_path / "saved.json"
+        with open(out, "w", encoding="utf-8") as f:
+            bot._write_caption_array(f, "transcript")
+
+        # Assert
+        records = list(iter_jsonl(bot.captions_file))
+        assert written == 2
+        assert [r["entry"]["text"] for r in records] == ["halo", "kita", "kita mulai", "rapat"]
+        assert [r.get("update", False) for r in records] == [False, False, True, False]
+        assert [e["text"] for e in json.loads(out.read_text())] == ["halo", "kita mulai", "rapat"]
+
+    def test_shorter_array_without_cursor_entry_restarts(self, bot):
+        """Verify a replaced, shorter array is logged again from the start."""
+        # Arrange
+        bot.browser.storage["transcript"] = [{"timestamp": 1, "text": "halo"}, {"timestamp": 2, "text": "kita"}]
+        bot.drain_captions()
+        bot.browser.storage["transcript"] = [{"timestamp": 5, "text": "baru"}]
+
+        # Act
+        written = bot.drain_captions()
+
+        # Assert
+        records = list(iter_jsonl(bot.captions_file))
+        assert written == 1
+        assert records[-1] == {"type": "transcript", "entry": {"timestamp": 5, "text": "baru"}}
+
+
+class TestProcessTreeSampler:
+    """Tests for per-bot RSS/CPU sampling."""
+
+    def test_sample_tracks_peak_and_ignores_missing_pids(self):
+        """Verify sampling the current process reports RSS and skips dead/None PIDs."""
+        # Arrange
+        import os
+        from integrations.zoom.bot_utils import ProcessTreeSampler
+        pytest.importorskip("psutil")
+        sampler = ProcessTreeSampler()
+
+        # Act
+        usage = sampler.sample([os.getpid(), None, 999999999])
+        summary = sampler.summary()
+
+        # Assert
+        assert usage["processes"] >= 1
+        assert usage["rss_mb"] > 0
+        assert summary["samples"] == 1
+        assert summary["peak_rss_mb"] == usage["rss_mb"]
+        assert summary["suggested_rss_budget_mb"] >= usage["rss_mb"] * 1.2
+        assert summary["suggested_rss_budget_mb"] % 10 == 0
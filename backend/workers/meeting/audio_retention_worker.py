@@ -0,0 +1,74 @@
+"""
+Background sweeper that purges meeting audio past AUDIO_RETENTION_DAYS.
+Pure domain logic - NO FastAPI imports.
+"""
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add backend to path for imports
+backend_dir = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from core.config import settings
+from database.base import SessionLocal
+from domains.zoom_resume.transcript.service import TranscriptService
+
+_sweeper: threading.Thread = None
+_sweeper_lock = threading.Lock()
+
+
+def purge_expired_audio() -> int:
+    """
+    Purge every transcript audio file whose retention has ended.
+    
+    Returns:
+        Number of transcripts purged
+    """
+    db = SessionLocal()
+    purged = 0
+    try:
+        while True:
+            count = TranscriptService.purge_expired_audio(db)
+            purged += count
+            if count == 0:
+                return purged
+    finally:
+        db.close()
+
+
+def _sweep_forever() -> None:
+    while True:
+        try:
+            purged = purge_expired_audio()
+            if purged:
+                print(f"[RETENTION] Purged audio of {purged} transcripts")
+        except Exception as e:
+            print(f"[RETENTION] Audio purge failed: {str(e)}")
+        time.sleep(settings.AUDIO_RETENTION_SWEEP_MINUTES * 60)
+
+
+def start_audio_retention_sweeper() -> None:
+    """
+    Start the purge loop once per process.
+    
+    For development: runs in a daemon thread next to the API
+    For production: run purge_expired_audio() from cron/Celery beat instead
+    """
+    global _sweeper
+    
+    if not settings.AUDIO_RETENTION_DAYS:
+        return  # Nothing expires (kept forever, or deleted right after transcription)
+    
+    with _sweeper_lock:
+        if _sweeper is not None and _sweeper.is_alive():
+            return
+        _sweeper = threading.Thread(target=_sweep_forever, daemon=True)
+        _sweeper.start()
+    
+    print(f"[RETENTION] Audio retention sweeper started ({settings.AUDIO_RETENTION_DAYS} days)")
+
+
+if __name__ == "__main__":
+    print(f"Purged audio of {purge_expired_audio()} transcripts")
@@ -13,6 +13,7 @@ sys.path.insert(0, str(backend_dir))
 from database.base import SessionLocal
 from domains.zoom_resume.transcript.service import TranscriptService
 from domains.zoom_resume.transcript.model import TranscriptStatus
+from domains.zoom_resume.transcript.events import publish_transcript_event
 from domains.zoom_resume.transcript.whisper import transcribe_audio_file
 
 
@@ -50,9 +51,11 @@ def process_transcript(transcript_id: int) -> Dict[str, Any]:
             raise FileNotFoundError(f"Audio file not found: {transcript.audio_url}")
         
         # Run Whisper transcription
+        publish_transcript_event(transcript_id, "progress", stage="transcribing", progress=0.1)
         result = transcribe_audio_file(str(audio_path))
         
         # Save results
+        publish_transcript_event(transcript_id, "progress", stage="saving", progress=0.9)
         TranscriptService.save_result(
             db,
             transcript_id,
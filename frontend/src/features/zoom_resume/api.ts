@@ -4,7 +4,7 @@
  */
 import { http } from '@/services/http'
 import API_CONFIG from '@/services/config'
-import type { Transcript, TranscriptStatusResponse, TranscriptListResponse } from './types'
+import type { Transcript, TranscriptStatusResponse, TranscriptListResponse, TranscriptExportFormat, StreamTokenResponse } from './types'
 
 const BASE_URL = API_CONFIG.baseURL
 
@@ -54,8 +54,11 @@ export const transcriptApi = {
     /**
      * Fetch paginated list of transcripts for current user.
      */
-    async fetchTranscripts(skip: number = 0, limit: number = 20): Promise<TranscriptListResponse> {
-        return await http.get<TranscriptListResponse>(`/transcripts?skip=${skip}&limit=${limit}`)
+    async fetchTranscripts(cursor: string | null = null, limit: number = 20, includeTotal: boolean = false): Promise<TranscriptListResponse> {
+        const params = new URLSearchParams({ limit: String(limit) })
+        if (cursor) params.set('cursor', cursor)
+        if (includeTotal) params.set('include_total', 'true')
+        return await http.get<TranscriptListResponse>(`/transcripts?${params}`)
     },
     async fetchLatestZoomTranscript(): Promise<Transcript> {
     return await http.get<Transcript>('/transcripts/latest')
@@ -105,5 +108,43 @@ export const transcriptApi = {
      */
     async checkStatus(id: number): Promise<TranscriptStatusResponse> {
         return await http.get<TranscriptStatusResponse>(`/transcripts/${id}/status`)
+    },
+
+    /**
+     * Short-lived token for one transcript's export, audio and events URLs.
+     * Links, <audio src> and EventSource cannot send headers, so this token
+     * goes in their query string instead of the access token.
+     */
+    async streamToken(id: number): Promise<StreamTokenResponse> {
+        return await http.post<StreamTokenResponse>(`/transcripts/${id}/stream-token`)
+    },
+
+    /**
+     * Download URL for a finished transcript (SRT, VTT, TXT or DOCX).
+     * Used as a plain link so the browser streams the file to disk.
+     */
+    exportUrl(id: number, format: TranscriptExportFormat, streamToken: string): string {
+        return `${BASE_URL}/transcripts/${id}/export?format=${format}&token=${encodeURIComponent(streamToken)}`
+    },
+
+    /**
+     * Playback URL of the meeting recording (supports HTTP Range seeking).
+     */
+    audioUrl(id: number, streamToken: string): string {
+        return `${BASE_URL}/transcripts/${id}/audio?token=${encodeURIComponent(streamToken)}`
+    },
+
+    /**
+     * Subscribe to status pushes (Server-Sent Events).
+     * The server closes the stream after DONE or FAILED.
+     */
+    subscribeStatus(id: number, streamToken: string, onStatus: (status: Pick<TranscriptStatusResponse, 'status' | 'error_message'>) => void): EventSource {
+        const source = new EventSource(
+            `${BASE_URL}/transcripts/${id}/events?token=${encodeURIComponent(streamToken)}`
+        )
+        source.addEventListener('status', (event) => {
+            onStatus(JSON.parse((event as MessageEvent).data))
+        })
+        return source
     }
 }
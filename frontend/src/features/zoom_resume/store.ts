@@ -5,7 +5,7 @@
 import { defineStore } from 'pinia'
 import { ref } from 'vue'
 import { transcriptApi } from './api'
-import type { TranscriptSegment, Transcript } from './types'
+import type { TranscriptSegment, Transcript, TranscriptSummary } from './types'
 
 export const useTranscriptStore = defineStore('transcript', () => {
     // State - Single transcript (for TranscriptMeeting.vue)
@@ -14,10 +14,10 @@ export const useTranscriptStore = defineStore('transcript', () => {
     const language = ref<string | null>(null)
 
     // State - Transcript list (for TranscriptList.vue)
-    const transcripts = ref<Transcript[]>([])
+    const transcripts = ref<TranscriptSummary[]>([])
     const currentTranscript = ref<Transcript | null>(null)
     const total = ref(0)
-    const skip = ref(0)
+    const nextCursor = ref<string | null>(null)
     const limit = ref(20)
 
     // Shared state
@@ -36,39 +36,79 @@ export const useTranscriptStore = defineStore('transcript', () => {
             if (result.transcript_id) {
                 const transcriptId = result.transcript_id
 
-                // Poll for status updates
-                const pollInterval = setInterval(async () => {
-                    try {
-                        const transcript = await transcriptApi.fetchTranscriptById(transcriptId)
-
-                        if (transcript.status === 'DONE') {
-                            clearInterval(pollInterval)
-
-                            console.log('[STORE] Transcription DONE:', transcript)
-                            console.log('[STORE] Segments received:', transcript.segments)
-
-                            // Update state with results
-                            language.value = transcript.language
-                            fullText.value = transcript.full_text || ''
-                            segments.value = transcript.segments || []
-
-                            console.log('[STORE] Store segments updated:', segments.value.length)
-
-                            loading.value = false
-                            return // Exit polling
-                        } else if (transcript.status === 'FAILED') {
+                // Fallback: poll for status updates
+                const startPolling = () => {
+                    const pollInterval = setInterval(async () => {
+                        try {
+                            const transcript = await transcriptApi.fetchTranscriptById(transcriptId)
+
+                            if (transcript.status === 'DONE') {
+                                clearInterval(pollInterval)
+
+                                console.log('[STORE] Transcription DONE:', transcript)
+                                console.log('[STORE] Segments received:', transcript.segments)
+
+                                // Update state with results
+                                currentTranscript.value = transcript
+                                language.value = transcript.language
+                                fullText.value = transcript.full_text || ''
+                                segments.value = transcript.segments || []
+
+                                console.log('[STORE] Store segments updated:', segments.value.length)
+
+                                loading.value = false
+                                return // Exit polling
+                            } else if (transcript.status === 'FAILED') {
+                                clearInterval(pollInterval)
+                                error.value = transcript.error_message || 'Transcription failed'
+                                loading.value = false
+                                return // Exit polling
+                            }
+                            // Continue polling if PENDING or PROCESSING
+                        } catch (err: any) {
                             clearInterval(pollInterval)
-                            error.value = transcript.error_message || 'Transcription failed'
+                            error.value = err.message || 'Failed to check status'
                             loading.value = false
-                            return // Exit polling
                         }
-                        // Continue polling if PENDING or PROCESSING
-                    } catch (err: any) {
-                        clearInterval(pollInterval)
-                        error.value = err.message || 'Failed to check status'
+                    }, 2000) // Poll every 2 seconds
+                }
+
+                const finish = async (status: string, errorMessage?: string | null) => {
+                    if (status === 'DONE') {
+                        const transcript = await transcriptApi.fetchTranscriptById(transcriptId)
+                        currentTranscript.value = transcript
+                        language.value = transcript.language
+                        fullText.value = transcript.full_text || ''
+                        segments.value = transcript.segments || []
+                        loading.value = false
+                    } else if (status === 'FAILED') {
+                        error.value = errorMessage || 'Transcription failed'
                         loading.value = false
                     }
-                }, 2000) // Poll every 2 seconds
+                }
+
+                // Server pushes status changes; fall back to polling if the stream fails
+                if (typeof EventSource !== 'undefined') {
+                    transcriptApi.streamToken(transcriptId).then(({ token }) => {
+                        let settled = false
+                        const source = transcriptApi.subscribeStatus(transcriptId, token, (update) => {
+                            if (update.status === 'DONE' || update.status === 'FAILED') {
+                                settled = true
+                                source.close()
+                                finish(update.status, update.error_message).catch((err: any) => {
+                                    error.value = err.message || 'Failed to load transcript'
+                                    loading.value = false
+                                })
+                            }
+                        })
+                        source.onerror = () => {
+                            source.close()
+                            if (!settled) startPolling()
+                        }
+                    }).catch(() => startPolling())
+                } else {
+                    startPolling()
+                }
 
                 return true
             } else {
@@ -93,9 +133,10 @@ export const useTranscriptStore = defineStore('transcript', () => {
         error.value = null
 
         try {
-            const response = await transcriptApi.fetchTranscripts(skip.value, limit.value)
+            const response = await transcriptApi.fetchTranscripts(null, limit.value, true)
             transcripts.value = response.items
-            total.value = response.total
+            total.value = response.total ?? response.items.length
+            nextCursor.value = response.next_cursor
         } catch (err: any) {
             error.value = err.message || 'Failed to load transcripts'
             console.error('Load transcripts error:', err)
@@ -104,6 +145,24 @@ export const useTranscriptStore = defineStore('transcript', () => {
         }
     }
 
+    async function loadMoreTranscripts() {
+        if (!nextCursor.value) return
+
+        loading.value = true
+        error.value = null
+
+        try {
+            const response = await transcriptApi.fetchTranscripts(nextCursor.value, limit.value)
+            transcripts.value.push(...response.items)
+            nextCursor.value = response.next_cursor
+        } catch (err: any) {
+            error.value = err.message || 'Failed to load transcripts'
+            console.error('Load more transcripts error:', err)
+        } finally {
+            loading.value = false
+        }
+    }
+
     async function selectTranscript(id: number) {
         loading.value = true
         error.value = null
@@ -123,7 +182,14 @@ export const useTranscriptStore = defineStore('transcript', () => {
             const updated = await transcriptApi.fetchTranscriptById(id)
             const index = transcripts.value.findIndex(t => t.id === id)
             if (index !== -1) {
-                transcripts.value[index] = updated
+                transcripts.value[index] = {
+                    ...transcripts.value[index],
+                    status: updated.status,
+                    language: updated.language,
+                    error_message: updated.error_message,
+                    segments_count: updated.segments?.length ?? null,
+                    updated_at: updated.updated_at
+                }
             }
             if (currentTranscript.value?.id === id) {
                 currentTranscript.value = updated
@@ -154,7 +220,7 @@ export const useTranscriptStore = defineStore('transcript', () => {
         transcripts,
         currentTranscript,
         total,
-        skip,
+        nextCursor,
         limit,
 
         // Shared state
@@ -164,6 +230,7 @@ export const useTranscriptStore = defineStore('transcript', () => {
         // Actions
         uploadAudio,
         loadTranscriptList,
+        loadMoreTranscripts,
         selectTranscript,
         refreshTranscriptStatus,
         clearTranscript,
@@ -5,6 +5,8 @@
 
 export type TranscriptStatus = 'PENDING' | 'PROCESSING' | 'DONE' | 'FAILED'
 
+export type TranscriptExportFormat = 'srt' | 'vtt' | 'txt' | 'docx'
+
 export interface TranscriptSegment {
     id: number
     start: number
@@ -32,9 +34,26 @@ export interface TranscriptStatusResponse {
     error_message: string | null
 }
 
+export interface StreamTokenResponse {
+    token: string
+    expires_in: number
+}
+
+export interface TranscriptSummary {
+    id: number
+    user_id: number
+    audio_url: string
+    status: TranscriptStatus
+    language: string | null
+    segments_count: number | null
+    error_message: string | null
+    created_at: string
+    updated_at: string
+}
+
 export interface TranscriptListResponse {
-    total: number
-    items: Transcript[]
-    skip: number
+    items: TranscriptSummary[]
     limit: number
+    next_cursor: string | null
+    total: number | null
 }